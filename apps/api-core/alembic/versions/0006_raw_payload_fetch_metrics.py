@@ -0,0 +1,33 @@
+"""raw payload fetch latency and response size
+
+Revision ID: 0006_raw_payload_fetch_metrics
+Revises: 0005_market_data_phase1
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0006_raw_payload_fetch_metrics'
+down_revision = '0005_market_data_phase1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'ingestion_raw_payloads',
+        sa.Column('fetch_latency_ms', sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        'ingestion_raw_payloads',
+        sa.Column('response_bytes', sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('ingestion_raw_payloads', 'response_bytes')
+    op.drop_column('ingestion_raw_payloads', 'fetch_latency_ms')
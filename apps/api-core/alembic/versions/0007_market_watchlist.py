@@ -0,0 +1,55 @@
+"""per-tenant market watchlist for cache pre-warming
+
+Revision ID: 0007_market_watchlist
+Revises: 0006_raw_payload_fetch_metrics
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '0007_market_watchlist'
+down_revision = '0006_raw_payload_fetch_metrics'
+branch_labels = None
+depends_on = None
+
+
+def _enable_rls(table_name: str) -> None:
+    op.execute(f'ALTER TABLE {table_name} ENABLE ROW LEVEL SECURITY;')
+    op.execute(f'ALTER TABLE {table_name} FORCE ROW LEVEL SECURITY;')
+    op.execute(
+        f"""
+        CREATE POLICY {table_name}_tenant_isolation ON {table_name}
+        USING (org_id::text = current_setting('app.current_org_id', true))
+        WITH CHECK (org_id::text = current_setting('app.current_org_id', true));
+        """
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        'market_watchlist',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('org_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('symbol', sa.String(length=32), nullable=False),
+        sa.Column('provider', sa.String(length=64), nullable=False),
+        sa.Column('timeframe', sa.String(length=16), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index('ix_market_watchlist_org_id', 'market_watchlist', ['org_id'])
+    op.create_index(
+        'uq_market_watchlist_org_provider_symbol_timeframe',
+        'market_watchlist',
+        ['org_id', 'provider', 'symbol', 'timeframe'],
+        unique=True,
+    )
+    _enable_rls('market_watchlist')
+
+
+def downgrade() -> None:
+    op.execute('DROP POLICY IF EXISTS market_watchlist_tenant_isolation ON market_watchlist;')
+    op.drop_table('market_watchlist')
@@ -26,6 +26,35 @@ class Settings(BaseSettings):
     twelve_data_api_key: str = Field(default='', alias='TWELVE_DATA_API_KEY')
     alpha_vantage_api_key: str = Field(default='', alias='ALPHA_VANTAGE_API_KEY')
     provider_cache_ttl_seconds: int = Field(default=300, alias='PROVIDER_CACHE_TTL_SECONDS')
+    provider_cache_stale_ttl_seconds: int = Field(
+        default=60,
+        alias='PROVIDER_CACHE_STALE_TTL_SECONDS',
+    )
+    provider_cache_codec: str = Field(default='zlib', alias='PROVIDER_CACHE_CODEC')
+    provider_cache_compression_level: int = Field(
+        default=6,
+        alias='PROVIDER_CACHE_COMPRESSION_LEVEL',
+    )
+    provider_local_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        alias='PROVIDER_LOCAL_CACHE_MAX_BYTES',
+    )
+    provider_local_cache_max_ttl_seconds: float = Field(
+        default=60.0,
+        alias='PROVIDER_LOCAL_CACHE_MAX_TTL_SECONDS',
+    )
+    provider_single_flight_lock_seconds: int = Field(
+        default=60,
+        alias='PROVIDER_SINGLE_FLIGHT_LOCK_SECONDS',
+    )
+    provider_single_flight_wait_seconds: float = Field(
+        default=30.0,
+        alias='PROVIDER_SINGLE_FLIGHT_WAIT_SECONDS',
+    )
+    provider_single_flight_poll_seconds: float = Field(
+        default=0.05,
+        alias='PROVIDER_SINGLE_FLIGHT_POLL_SECONDS',
+    )
     tavily_rate_limit_per_minute: int = Field(default=30, alias='TAVILY_RATE_LIMIT_PER_MINUTE')
     serper_rate_limit_per_minute: int = Field(default=30, alias='SERPER_RATE_LIMIT_PER_MINUTE')
     serpapi_rate_limit_per_minute: int = Field(default=30, alias='SERPAPI_RATE_LIMIT_PER_MINUTE')
@@ -37,11 +66,101 @@ class Settings(BaseSettings):
         default=5,
         alias='ALPHAVANTAGE_RATE_LIMIT_PER_MINUTE',
     )
+    rate_limit_default_tenant_share: float = Field(
+        default=0.25,
+        alias='RATE_LIMIT_DEFAULT_TENANT_SHARE',
+    )
+    rate_limit_tenant_shares: dict[str, float] = Field(
+        default_factory=dict,
+        alias='RATE_LIMIT_TENANT_SHARES',
+    )
+    rate_limit_borrow_reserve_fraction: float = Field(
+        default=0.2,
+        alias='RATE_LIMIT_BORROW_RESERVE_FRACTION',
+    )
     provider_timeout_seconds: float = Field(default=10.0, alias='PROVIDER_TIMEOUT_SECONDS')
     provider_max_retries: int = Field(default=3, alias='PROVIDER_MAX_RETRIES')
     provider_backoff_seconds: float = Field(default=0.5, alias='PROVIDER_BACKOFF_SECONDS')
+    provider_max_backoff_seconds: float = Field(
+        default=30.0,
+        alias='PROVIDER_MAX_BACKOFF_SECONDS',
+    )
+    provider_circuit_failure_threshold: int = Field(
+        default=5,
+        alias='PROVIDER_CIRCUIT_FAILURE_THRESHOLD',
+    )
+    provider_circuit_window_seconds: int = Field(
+        default=60,
+        alias='PROVIDER_CIRCUIT_WINDOW_SECONDS',
+    )
+    provider_circuit_open_seconds: int = Field(default=30, alias='PROVIDER_CIRCUIT_OPEN_SECONDS')
+    provider_concurrency_limit: int = Field(default=10, alias='PROVIDER_CONCURRENCY_LIMIT')
+    provider_concurrency_limit_overrides: dict[str, int] = Field(
+        default_factory=lambda: {'alphavantage': 1},
+        alias='PROVIDER_CONCURRENCY_LIMIT_OVERRIDES',
+    )
+    provider_concurrency_lease_seconds: float = Field(
+        default=30.0,
+        alias='PROVIDER_CONCURRENCY_LEASE_SECONDS',
+    )
+    provider_concurrency_wait_seconds: float = Field(
+        default=5.0,
+        alias='PROVIDER_CONCURRENCY_WAIT_SECONDS',
+    )
+    provider_concurrency_poll_seconds: float = Field(
+        default=0.1,
+        alias='PROVIDER_CONCURRENCY_POLL_SECONDS',
+    )
+    provider_http_max_connections: int = Field(default=20, alias='PROVIDER_HTTP_MAX_CONNECTIONS')
+    provider_http_max_connections_overrides: dict[str, int] = Field(
+        default_factory=dict,
+        alias='PROVIDER_HTTP_MAX_CONNECTIONS_OVERRIDES',
+    )
+    provider_http_max_keepalive_connections: int = Field(
+        default=10,
+        alias='PROVIDER_HTTP_MAX_KEEPALIVE_CONNECTIONS',
+    )
+    provider_http_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        alias='PROVIDER_HTTP_KEEPALIVE_EXPIRY_SECONDS',
+    )
+    provider_http2_enabled: bool = Field(default=False, alias='PROVIDER_HTTP2_ENABLED')
+    provider_max_payload_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        alias='PROVIDER_MAX_PAYLOAD_BYTES',
+    )
+    ingestion_batch_max_jobs: int = Field(default=1000, alias='INGESTION_BATCH_MAX_JOBS')
+    market_upsert_chunk_size: int = Field(default=1000, alias='MARKET_UPSERT_CHUNK_SIZE')
+    quote_coalesce_window_seconds: float = Field(
+        default=0.25,
+        alias='QUOTE_COALESCE_WINDOW_SECONDS',
+    )
+    watchlist_prewarm_times_utc: list[str] = Field(
+        default_factory=lambda: ['13:20', '14:20'],
+        alias='WATCHLIST_PREWARM_TIMES_UTC',
+    )
+    watchlist_prewarm_budget_fraction: float = Field(
+        default=0.5,
+        alias='WATCHLIST_PREWARM_BUDGET_FRACTION',
+    )
+    news_search_hedge_providers: dict[str, str] = Field(
+        default_factory=dict,
+        alias='NEWS_SEARCH_HEDGE_PROVIDERS',
+    )
+    news_search_hedge_default_delay_seconds: float = Field(
+        default=2.0,
+        alias='NEWS_SEARCH_HEDGE_DEFAULT_DELAY_SECONDS',
+    )
+    news_search_hedge_min_samples: int = Field(
+        default=20,
+        alias='NEWS_SEARCH_HEDGE_MIN_SAMPLES',
+    )
 
     worker_max_jobs: int = Field(default=20, alias='WORKER_MAX_JOBS')
+    worker_lane_max_jobs_overrides: dict[str, int] = Field(
+        default_factory=lambda: {'bulk': 5},
+        alias='WORKER_LANE_MAX_JOBS_OVERRIDES',
+    )
 
 
 @lru_cache(maxsize=1)
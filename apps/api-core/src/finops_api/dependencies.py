@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from typing import cast
 from uuid import UUID
 
-from fastapi import Depends, Header, HTTPException, status
+from arq import ArqRedis
+from fastapi import Depends, Header, HTTPException, Request, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -29,3 +31,7 @@ async def get_tenant_session(
         {'org_id': str(org_id)},
     )
     yield session
+
+
+async def get_arq_pool(request: Request) -> ArqRedis:
+    return cast(ArqRedis, request.app.state.arq_pool)
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+
+def canonical_json(value: object) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def stable_hash(value: object) -> str:
+    return hashlib.sha256(canonical_json(value)).hexdigest()
@@ -12,22 +12,32 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from finops_api.config import get_settings
 from finops_api.logging_config import configure_logging
+from finops_api.providers.http_pool import close_provider_http_clients, open_provider_http_clients
+from finops_api.providers.registry import registered_providers
 from finops_api.routers.documents import router as documents_router
 from finops_api.routers.health import router as health_router
 from finops_api.routers.ingestion import router as ingestion_router
 from finops_api.routers.intel import router as intel_router
 from finops_api.routers.market import router as market_router
+from finops_api.routers.metrics import router as metrics_router
 from finops_api.routers.signals import router as signals_router
 from finops_api.routers.system import router as system_router
+from finops_api.services.queue import create_queue_pool
 
 settings = get_settings()
 request_logger = logging.getLogger('finops_api.request')
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
     configure_logging()
-    yield
+    await open_provider_http_clients(registered_providers())
+    application.state.arq_pool = await create_queue_pool()
+    try:
+        yield
+    finally:
+        await application.state.arq_pool.close()
+        await close_provider_http_clients()
 
 
 app = FastAPI(title='FinOps API Core', version='0.1.0', lifespan=lifespan)
@@ -69,6 +79,7 @@ app.include_router(health_router)
 app.include_router(ingestion_router)
 app.include_router(intel_router)
 app.include_router(market_router)
+app.include_router(metrics_router)
 app.include_router(documents_router)
 app.include_router(signals_router)
 app.include_router(system_router)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import re
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+import httpx
+
+METRICS_REDIS_KEY = 'metrics:finops'
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = (1_024, 10_240, 102_400, 1_048_576, 10_485_760, 33_554_432)
+
+METRIC_TYPES = {
+    'finops_provider_attempts_total': 'counter',
+    'finops_provider_retries_total': 'counter',
+    'finops_provider_request_duration_seconds': 'histogram',
+    'finops_provider_response_bytes': 'histogram',
+    'finops_ingestion_cache_lookups_total': 'counter',
+    'finops_cache_raw_bytes_total': 'counter',
+    'finops_cache_encoded_bytes_total': 'counter',
+}
+
+_LE_PATTERN = re.compile(r'le="([^"]+)"')
+
+
+@dataclass(slots=True)
+class FetchStats:
+    fetch_latency_ms: int | None = None
+    response_bytes: int | None = None
+
+
+current_fetch_stats: ContextVar[FetchStats | None] = ContextVar(
+    'current_fetch_stats',
+    default=None,
+)
+
+
+def _series(name: str, labels: dict[str, str]) -> str:
+    rendered = ','.join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+    return f'{name}{{{rendered}}}'
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._values: defaultdict[str, float] = defaultdict(float)
+
+    def inc(self, name: str, labels: dict[str, str], amount: float = 1.0) -> None:
+        self._values[_series(name, labels)] += amount
+
+    def observe(
+        self,
+        name: str,
+        labels: dict[str, str],
+        value: float,
+        buckets: tuple[float, ...],
+    ) -> None:
+        for bound in buckets:
+            if value <= bound:
+                self.inc(f'{name}_bucket', {**labels, 'le': str(bound)})
+        self.inc(f'{name}_bucket', {**labels, 'le': '+Inf'})
+        self.inc(f'{name}_sum', labels, value)
+        self.inc(f'{name}_count', labels)
+
+    def drain(self) -> dict[str, float]:
+        values = dict(self._values)
+        self._values.clear()
+        return values
+
+
+metrics = MetricsRegistry()
+
+
+class ProviderAttempt:
+    def __init__(self, provider: str, endpoint: str, *, attempt: int) -> None:
+        self.provider = provider
+        self.endpoint = endpoint
+        self.attempt = attempt
+        self.status: str | None = None
+        self.response_bytes: int | None = None
+        self._started = 0.0
+
+    def observe_response(self, status_code: int, response_bytes: int) -> None:
+        self.status = str(status_code)
+        self.response_bytes = response_bytes
+
+    async def __aenter__(self) -> ProviderAttempt:
+        self._started = time.perf_counter()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        labels = {'provider': self.provider, 'endpoint': self.endpoint}
+        status = self.status or _exception_status(exc)
+        metrics.inc('finops_provider_attempts_total', {**labels, 'status': status})
+        if self.attempt:
+            metrics.inc('finops_provider_retries_total', labels)
+        metrics.observe(
+            'finops_provider_request_duration_seconds',
+            labels,
+            time.perf_counter() - self._started,
+            LATENCY_BUCKETS,
+        )
+        if self.response_bytes is None:
+            return
+        metrics.observe(
+            'finops_provider_response_bytes',
+            labels,
+            self.response_bytes,
+            BYTES_BUCKETS,
+        )
+        stats = current_fetch_stats.get()
+        if stats is not None and status.startswith('2'):
+            stats.response_bytes = (stats.response_bytes or 0) + self.response_bytes
+
+
+def _exception_status(exc: BaseException | None) -> str:
+    if isinstance(exc, httpx.TimeoutException):
+        return 'timeout'
+    if isinstance(exc, httpx.NetworkError):
+        return 'network_error'
+    code = getattr(exc, 'code', None)
+    return code if isinstance(code, str) else 'error'
+
+
+async def measure_fetch[T](stats: FetchStats, fetch: Callable[[], Awaitable[T]]) -> T:
+    token = current_fetch_stats.set(stats)
+    started = time.perf_counter()
+    try:
+        return await fetch()
+    finally:
+        stats.fetch_latency_ms = round((time.perf_counter() - started) * 1000)
+        current_fetch_stats.reset(token)
+
+
+def observe_cache_lookup(
+    *,
+    provider: str,
+    resource: str,
+    hit: bool,
+    stale: bool = False,
+) -> None:
+    result = 'stale' if stale else 'hit' if hit else 'miss'
+    metrics.inc(
+        'finops_ingestion_cache_lookups_total',
+        {'provider': provider, 'resource': resource, 'result': result},
+    )
+
+
+async def flush_metrics(redis_client: Any) -> None:
+    values = metrics.drain()
+    if not values:
+        return
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for series, amount in values.items():
+            pipe.hincrbyfloat(METRICS_REDIS_KEY, series, amount)
+        await pipe.execute()
+
+
+def _family(series: str) -> str:
+    name = series.split('{', 1)[0]
+    for suffix in ('_bucket', '_sum', '_count'):
+        if name not in METRIC_TYPES and name.endswith(suffix):
+            return name.removesuffix(suffix)
+    return name
+
+
+def _sort_key(series: str) -> tuple[str, str, float]:
+    match = _LE_PATTERN.search(series)
+    le = float('inf') if match is None or match.group(1) == '+Inf' else float(match.group(1))
+    return _family(series), _LE_PATTERN.sub('', series), le
+
+
+def render_metrics(values: dict[str, float]) -> str:
+    lines: list[str] = []
+    family: str | None = None
+    for series in sorted(values, key=_sort_key):
+        current = _family(series)
+        if current != family:
+            family = current
+            lines.append(f'# TYPE {current} {METRIC_TYPES.get(current, "untyped")}')
+        lines.append(f'{series} {values[series]!r}')
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+async def load_metrics(redis_client: Any) -> dict[str, float]:
+    raw = await redis_client.hgetall(METRICS_REDIS_KEY)
+    return {
+        (key.decode('utf-8') if isinstance(key, bytes) else key): float(value)
+        for key, value in raw.items()
+    }
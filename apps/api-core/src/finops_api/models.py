@@ -65,6 +65,8 @@ class IngestionRawPayload(Base, OrgScopedMixin):
     response_payload: Mapped[dict[str, object]] = mapped_column(JSON, nullable=False, default=dict)
     http_status: Mapped[int | None] = mapped_column(nullable=True)
     provider_request_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    fetch_latency_ms: Mapped[int | None] = mapped_column(nullable=True)
+    response_bytes: Mapped[int | None] = mapped_column(nullable=True)
     fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
@@ -216,6 +218,27 @@ class MarketQuote(Base, OrgScopedMixin):
     )
 
 
+class MarketWatchlistEntry(Base, OrgScopedMixin):
+    __tablename__ = 'market_watchlist'
+
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    symbol: Mapped[str] = mapped_column(String(32), nullable=False)
+    provider: Mapped[str] = mapped_column(String(64), nullable=False)
+    timeframe: Mapped[str] = mapped_column(String(16), nullable=False, default='1day')
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index(
+            'uq_market_watchlist_org_provider_symbol_timeframe',
+            'org_id',
+            'provider',
+            'symbol',
+            'timeframe',
+            unique=True,
+        ),
+    )
+
+
 class SignalFeature(Base, OrgScopedMixin, TimestampMixin):
     __tablename__ = 'signal_features'
 
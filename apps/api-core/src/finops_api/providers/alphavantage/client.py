@@ -1,19 +1,30 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import math
+from datetime import UTC, datetime
 from typing import cast
 
 import httpx
 
 from finops_api.config import get_settings
+from finops_api.metrics import ProviderAttempt
 from finops_api.providers.alphavantage.dto import (
+    ALPHAVANTAGE_COMPACT_WINDOW,
+    AlphaVantageQuoteBatchRequest,
     AlphaVantageQuoteRequest,
     AlphaVantageTimeseriesRequest,
+    parse_date,
 )
-from finops_api.providers.base import ProviderError, ProviderResponse
+from finops_api.providers.base import ProviderError, ProviderResponse, chunk_symbols
+from finops_api.providers.http_pool import provider_http_client, read_limited_body
+from finops_api.providers.retry import backoff_delay, parse_retry_after, retries_exhausted_error
 
 
 class AlphaVantageAdapter:
+    max_batch_symbols = 100
+
     def __init__(
         self,
         *,
@@ -38,6 +49,8 @@ class AlphaVantageAdapter:
             max_retries if max_retries is not None else settings.provider_max_retries
         )
         self._backoff_seconds = backoff_seconds or settings.provider_backoff_seconds
+        self._max_backoff_seconds = settings.provider_max_backoff_seconds
+        self._max_payload_bytes = settings.provider_max_payload_bytes
         self._transport = transport
 
     async def get_quote(
@@ -56,6 +69,38 @@ class AlphaVantageAdapter:
         )
         return ProviderResponse(http_status=200, provider_request_id=None, payload=payload)
 
+    async def get_quote_batch(
+        self,
+        *,
+        idempotency_key: str,
+        request_payload: dict[str, object],
+    ) -> ProviderResponse:
+        request = AlphaVantageQuoteBatchRequest.model_validate(request_payload)
+        quotes: list[object] = []
+        for chunk in chunk_symbols(request.symbols, self.max_batch_symbols):
+            payload = await self._get_with_retry(
+                idempotency_key=idempotency_key,
+                query={
+                    'function': 'REALTIME_BULK_QUOTES',
+                    'symbol': ','.join(chunk),
+                },
+            )
+            data = payload.get('data')
+            if not isinstance(data, list):
+                message = str(payload.get('Information') or payload.get('message') or 'no data')
+                raise ProviderError(
+                    f'AlphaVantage bulk quote error: {message}',
+                    code='provider_request_failed',
+                    provider='alphavantage',
+                    retryable=False,
+                )
+            quotes.extend(item for item in data if isinstance(item, dict))
+        return ProviderResponse(
+            http_status=200,
+            provider_request_id=None,
+            payload={'quotes': quotes},
+        )
+
     async def get_timeseries(
         self,
         *,
@@ -70,16 +115,55 @@ class AlphaVantageAdapter:
                 provider='alphavantage',
                 retryable=False,
             )
+        outputsize = request.outputsize
+        start = parse_date(request.start_date[:10]) if request.start_date else None
+        if start is not None:
+            within_compact = datetime.now(UTC) - start <= ALPHAVANTAGE_COMPACT_WINDOW
+            outputsize = 'compact' if within_compact else 'full'
+
         payload = await self._get_with_retry(
             idempotency_key=idempotency_key,
             query={
                 'function': 'TIME_SERIES_DAILY',
                 'symbol': request.symbol,
-                'outputsize': request.outputsize,
+                'outputsize': outputsize,
             },
         )
+        daily = payload.get('Time Series (Daily)')
+        if start is not None and isinstance(daily, dict):
+            payload['Time Series (Daily)'] = {
+                day: value for day, value in daily.items() if parse_date(day) >= start
+            }
         return ProviderResponse(http_status=200, provider_request_id=None, payload=payload)
 
+    def quote_batch_request_count(self, request_payload: dict[str, object]) -> int:
+        request = AlphaVantageQuoteBatchRequest.model_validate(request_payload)
+        return math.ceil(len(request.symbols) / self.max_batch_symbols)
+
+    def timeseries_request_count(self, request_payload: dict[str, object]) -> int:  # noqa: ARG002
+        return 1
+
+    def split_timeseries_request(
+        self,
+        request_payload: dict[str, object],
+    ) -> list[dict[str, object]]:
+        return [request_payload]
+
+    def split_quote_batch_request(
+        self,
+        request_payload: dict[str, object],
+        *,
+        max_requests: int,
+    ) -> list[dict[str, object]]:
+        request = AlphaVantageQuoteBatchRequest.model_validate(request_payload)
+        max_symbols = max(1, max_requests) * self.max_batch_symbols
+        if len(request.symbols) <= max_symbols:
+            return [request_payload]
+        return [
+            {**request_payload, 'symbols': chunk}
+            for chunk in chunk_symbols(request.symbols, max_symbols)
+        ]
+
     async def _get_with_retry(
         self,
         *,
@@ -91,12 +175,28 @@ class AlphaVantageAdapter:
         headers = {'Idempotency-Key': idempotency_key}
         timeout = httpx.Timeout(self._timeout_seconds)
         url = f'{self._base_url}/query'
+        endpoint = str(query.get('function', '/query'))
         last_exception: Exception | None = None
 
         for attempt in range(self._max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=timeout, transport=self._transport) as client:
-                    response = await client.get(url, params=params, headers=headers)
+                async with (
+                    ProviderAttempt('alphavantage', endpoint, attempt=attempt) as tracked,
+                    provider_http_client('alphavantage', transport=self._transport) as client,
+                    client.stream(
+                        'GET',
+                        url,
+                        params=params,
+                        headers=headers,
+                        timeout=timeout,
+                    ) as response,
+                ):
+                    content = await read_limited_body(
+                        response,
+                        provider='alphavantage',
+                        max_bytes=self._max_payload_bytes,
+                    )
+                    tracked.observe_response(response.status_code, len(content))
                 if response.status_code in {429, 500, 502, 503, 504}:
                     raise ProviderError(
                         f'AlphaVantage transient error: {response.status_code}',
@@ -104,16 +204,20 @@ class AlphaVantageAdapter:
                         provider='alphavantage',
                         http_status=response.status_code,
                         retryable=True,
+                        retry_after_seconds=parse_retry_after(
+                            response.headers.get('Retry-After')
+                        ),
                     )
                 if response.status_code >= 400:
                     raise ProviderError(
-                        f'AlphaVantage request failed: {response.status_code} {response.text}',
+                        f'AlphaVantage request failed: {response.status_code} '
+                        f"{content.decode('utf-8', errors='replace')}",
                         code='provider_request_failed',
                         provider='alphavantage',
                         http_status=response.status_code,
                         retryable=False,
                     )
-                payload = cast(dict[str, object], response.json())
+                payload = cast(dict[str, object], json.loads(content))
                 if payload.get('Error Message') or payload.get('Note'):
                     message = str(payload.get('Error Message') or payload.get('Note'))
                     raise ProviderError(
@@ -143,11 +247,18 @@ class AlphaVantageAdapter:
             assert last_exception is not None
             if attempt == self._max_retries or not last_exception.retryable:
                 break
-            await asyncio.sleep(self._backoff_seconds * (2**attempt))
+            delay = backoff_delay(
+                attempt,
+                base_seconds=self._backoff_seconds,
+                max_seconds=self._max_backoff_seconds,
+                retry_after_seconds=last_exception.retry_after_seconds,
+            )
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
 
-        raise ProviderError(
+        raise retries_exhausted_error(
             f'AlphaVantage request exhausted retries: {last_exception}',
-            code='provider_retries_exhausted',
             provider='alphavantage',
-            retryable=False,
+            last_exception=last_exception,
         )
@@ -1,20 +1,35 @@
 from __future__ import annotations
 
-from datetime import UTC
+from datetime import UTC, timedelta
 from datetime import datetime as dt
 from decimal import Decimal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from finops_api.providers.base import normalize_symbol_list
+
+ALPHAVANTAGE_COMPACT_WINDOW = timedelta(days=100)
 
 
 class AlphaVantageQuoteRequest(BaseModel):
     symbol: str = Field(min_length=1, max_length=32)
 
 
+class AlphaVantageQuoteBatchRequest(BaseModel):
+    symbols: list[str] = Field(min_length=1, max_length=1000)
+
+    @field_validator('symbols', mode='before')
+    @classmethod
+    def normalize_symbols(cls, value: object) -> object:
+        return normalize_symbol_list(value)
+
+
 class AlphaVantageTimeseriesRequest(BaseModel):
     symbol: str = Field(min_length=1, max_length=32)
     interval: str = Field(default='1day')
     outputsize: str = Field(default='compact', pattern='^(compact|full)$')
+    start_date: str | None = None
+    incremental: bool = False
 
 
 class AlphaVantageQuoteItem(BaseModel):
@@ -28,6 +43,17 @@ class AlphaVantageQuoteResponse(BaseModel):
     global_quote: AlphaVantageQuoteItem = Field(alias='Global Quote')
 
 
+class AlphaVantageBulkQuoteItem(BaseModel):
+    symbol: str
+    timestamp: str
+    close: Decimal
+    change_percent: Decimal | None = None
+
+
+class AlphaVantageBulkQuoteResponse(BaseModel):
+    quotes: list[AlphaVantageBulkQuoteItem] = Field(default_factory=list)
+
+
 class AlphaVantageDailyValue(BaseModel):
     open: Decimal = Field(alias='1. open')
     high: Decimal = Field(alias='2. high')
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from typing import cast
+
 from finops_api.providers.alphavantage.dto import (
+    AlphaVantageBulkQuoteItem,
+    AlphaVantageBulkQuoteResponse,
     AlphaVantageQuoteResponse,
     AlphaVantageTimeseriesResponse,
     CanonicalQuote,
@@ -20,6 +25,16 @@ def to_canonical_quote(payload: AlphaVantageQuoteResponse) -> CanonicalQuote:
     )
 
 
+def to_canonical_bulk_quote(item: AlphaVantageBulkQuoteItem) -> CanonicalQuote:
+    change_percent = float(item.change_percent) if item.change_percent is not None else None
+    return CanonicalQuote(
+        symbol=item.symbol.upper(),
+        price=float(item.close),
+        change_percent=change_percent,
+        as_of=parse_date(item.timestamp),
+    )
+
+
 def to_canonical_timeseries(
     payload: AlphaVantageTimeseriesResponse,
     *,
@@ -41,3 +56,35 @@ def to_canonical_timeseries(
             )
         )
     return rows
+
+
+def normalize_quote_payload(payload: dict[str, object]) -> CanonicalQuote:
+    return to_canonical_quote(AlphaVantageQuoteResponse.model_validate(payload))
+
+
+def normalize_quote_batch_payload(payload: dict[str, object]) -> list[CanonicalQuote]:
+    response = AlphaVantageBulkQuoteResponse.model_validate(payload)
+    return [to_canonical_bulk_quote(item) for item in response.quotes]
+
+
+def normalize_timeseries_payload(
+    payload: dict[str, object],
+    *,
+    request_payload: dict[str, object],
+) -> Iterator[dict[str, object]]:
+    symbol = str(request_payload.get('symbol', '')).upper()
+    timeframe = str(request_payload.get('interval', '1day'))
+    if 'Time Series (Daily)' not in payload:
+        AlphaVantageTimeseriesResponse.model_validate(payload)
+    daily = cast(dict[str, dict[str, object]], payload['Time Series (Daily)'])
+    for ts_key, item in daily.items():
+        yield {
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'ts': parse_date(ts_key),
+            'open': float(str(item['1. open'])),
+            'high': float(str(item['2. high'])),
+            'low': float(str(item['3. low'])),
+            'close': float(str(item['4. close'])),
+            'volume': float(str(item['5. volume'])),
+        }
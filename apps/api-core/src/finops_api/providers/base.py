@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Protocol
 
+_SYMBOL_REQUEST_FIELDS = frozenset({'symbol'})
+_TEXT_REQUEST_FIELDS = frozenset({'query', 'q'})
+
 
 class ProviderError(Exception):
     def __init__(
@@ -13,6 +18,7 @@ class ProviderError(Exception):
         provider: str | None = None,
         http_status: int | None = None,
         retryable: bool = False,
+        retry_after_seconds: float | None = None,
     ) -> None:
         super().__init__(message)
         self.message = message
@@ -20,6 +26,11 @@ class ProviderError(Exception):
         self.provider = provider
         self.http_status = http_status
         self.retryable = retryable
+        self.retry_after_seconds = retry_after_seconds
+
+    @property
+    def circuit_open(self) -> bool:
+        return self.code == 'provider_circuit_open'
 
     def __str__(self) -> str:
         return self.message
@@ -32,6 +43,24 @@ class ProviderResponse:
     payload: dict[str, object]
 
 
+class CanonicalNewsRecord(Protocol):
+    source_provider: str
+    source_url: str
+    title: str
+    snippet: str
+    author: str | None
+    language: str | None
+    published_at: datetime | None
+    document_hash: str
+
+
+class CanonicalQuoteRecord(Protocol):
+    symbol: str
+    price: float
+    change_percent: float | None
+    as_of: datetime
+
+
 class SearchProvider(Protocol):
     async def search_news(
         self,
@@ -51,6 +80,8 @@ class SearchProvider(Protocol):
 
 
 class MarketDataProvider(Protocol):
+    max_batch_symbols: int
+
     async def get_quote(
         self,
         *,
@@ -66,3 +97,63 @@ class MarketDataProvider(Protocol):
         request_payload: dict[str, object],
     ) -> ProviderResponse:
         ...
+
+    async def get_quote_batch(
+        self,
+        *,
+        idempotency_key: str,
+        request_payload: dict[str, object],
+    ) -> ProviderResponse:
+        ...
+
+    def quote_batch_request_count(self, request_payload: dict[str, object]) -> int:
+        ...
+
+    def timeseries_request_count(self, request_payload: dict[str, object]) -> int:
+        ...
+
+    def split_timeseries_request(
+        self,
+        request_payload: dict[str, object],
+    ) -> list[dict[str, object]]:
+        ...
+
+    def split_quote_batch_request(
+        self,
+        request_payload: dict[str, object],
+        *,
+        max_requests: int,
+    ) -> list[dict[str, object]]:
+        ...
+
+
+def chunk_symbols(symbols: Sequence[str], size: int) -> list[list[str]]:
+    return [list(symbols[index : index + size]) for index in range(0, len(symbols), size)]
+
+
+def normalize_symbol_list(value: object) -> object:
+    if isinstance(value, str):
+        value = value.split(',')
+    if not isinstance(value, list | tuple):
+        return value
+    normalized: list[str] = []
+    for item in value:
+        symbol = str(item).strip().upper()
+        if symbol and symbol not in normalized:
+            normalized.append(symbol)
+    return normalized
+
+
+def canonical_request_fields(fields: dict[str, object]) -> dict[str, object]:
+    canonical: dict[str, object] = {}
+    for name, value in fields.items():
+        if isinstance(value, str):
+            value = ' '.join(value.split())
+            if name in _SYMBOL_REQUEST_FIELDS:
+                value = value.upper()
+            elif name in _TEXT_REQUEST_FIELDS:
+                value = value.casefold()
+        elif name == 'symbols' and isinstance(value, list):
+            value = sorted(str(symbol) for symbol in value)
+        canonical[name] = value
+    return canonical
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import importlib.util
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+
+import httpx
+
+from finops_api.config import get_settings
+from finops_api.providers.base import ProviderError
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec('h2') is not None
+
+
+def _build_client(provider: str) -> httpx.AsyncClient:
+    settings = get_settings()
+    max_connections = settings.provider_http_max_connections_overrides.get(
+        provider,
+        settings.provider_http_max_connections,
+    )
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=min(
+            max_connections,
+            settings.provider_http_max_keepalive_connections,
+        ),
+        keepalive_expiry=settings.provider_http_keepalive_expiry_seconds,
+    )
+    return httpx.AsyncClient(
+        limits=limits,
+        http2=settings.provider_http2_enabled and _http2_available(),
+        timeout=httpx.Timeout(settings.provider_timeout_seconds),
+    )
+
+
+def get_provider_http_client(provider: str) -> httpx.AsyncClient:
+    client = _clients.get(provider)
+    if client is None or client.is_closed:
+        client = _build_client(provider)
+        _clients[provider] = client
+    return client
+
+
+async def open_provider_http_clients(providers: Iterable[str]) -> None:
+    for provider in providers:
+        get_provider_http_client(provider)
+
+
+async def close_provider_http_clients() -> None:
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def provider_http_client(
+    provider: str,
+    *,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    if transport is not None:
+        async with httpx.AsyncClient(transport=transport) as client:
+            yield client
+        return
+    yield get_provider_http_client(provider)
+
+
+async def read_limited_body(
+    response: httpx.Response,
+    *,
+    provider: str,
+    max_bytes: int,
+) -> bytearray:
+    content_length = response.headers.get('Content-Length', '')
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        raise _payload_too_large(provider, max_bytes)
+
+    content = bytearray()
+    async for chunk in response.aiter_bytes():
+        content.extend(chunk)
+        if len(content) > max_bytes:
+            raise _payload_too_large(provider, max_bytes)
+    return content
+
+
+def _payload_too_large(provider: str, max_bytes: int) -> ProviderError:
+    return ProviderError(
+        f'{provider} response exceeded PROVIDER_MAX_PAYLOAD_BYTES ({max_bytes} bytes)',
+        code='provider_payload_too_large',
+        provider=provider,
+        retryable=False,
+    )
@@ -1,36 +1,238 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from pydantic import BaseModel, ValidationError
+
+from finops_api.config import Settings, get_settings
+from finops_api.providers.alphavantage import mapper as alphavantage_mapper
 from finops_api.providers.alphavantage.client import AlphaVantageAdapter
-from finops_api.providers.base import MarketDataProvider, ProviderError, SearchProvider
+from finops_api.providers.alphavantage.dto import (
+    AlphaVantageQuoteBatchRequest,
+    AlphaVantageQuoteRequest,
+    AlphaVantageTimeseriesRequest,
+)
+from finops_api.providers.base import (
+    CanonicalNewsRecord,
+    CanonicalQuoteRecord,
+    MarketDataProvider,
+    ProviderError,
+    SearchProvider,
+    canonical_request_fields,
+)
+from finops_api.providers.serpapi import mapper as serpapi_mapper
 from finops_api.providers.serpapi.client import SerpApiAdapter
+from finops_api.providers.serpapi.dto import SerpApiSearchRequest
+from finops_api.providers.serper import mapper as serper_mapper
 from finops_api.providers.serper.client import SerperAdapter
+from finops_api.providers.serper.dto import SerperSearchRequest
+from finops_api.providers.tavily import mapper as tavily_mapper
 from finops_api.providers.tavily.client import TavilyAdapter
+from finops_api.providers.tavily.dto import TavilySearchRequest
+from finops_api.providers.twelvedata import mapper as twelvedata_mapper
 from finops_api.providers.twelvedata.client import TwelveDataAdapter
+from finops_api.providers.twelvedata.dto import (
+    TwelveDataQuoteBatchRequest,
+    TwelveDataQuoteRequest,
+    TwelveDataTimeseriesRequest,
+)
+
+NewsNormalizer = Callable[[dict[str, object]], Sequence[CanonicalNewsRecord]]
+QuoteNormalizer = Callable[[dict[str, object]], CanonicalQuoteRecord]
+QuoteBatchNormalizer = Callable[[dict[str, object]], Sequence[CanonicalQuoteRecord]]
+
+PUBLIC_MARKET_DATA_RESOURCES = frozenset(
+    {'market_quote_refresh', 'market_quote_batch_refresh', 'market_timeseries_backfill'}
+)
+
+
+class TimeseriesNormalizer(Protocol):
+    def __call__(
+        self,
+        payload: dict[str, object],
+        *,
+        request_payload: dict[str, object],
+    ) -> Iterable[dict[str, object]]:
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderRegistration:
+    name: str
+    rate_limit_setting: str
+    search_factory: Callable[[], SearchProvider] | None = None
+    market_data_factory: Callable[[], MarketDataProvider] | None = None
+    normalize_news: NewsNormalizer | None = None
+    normalize_quote: QuoteNormalizer | None = None
+    normalize_quote_batch: QuoteBatchNormalizer | None = None
+    normalize_timeseries: TimeseriesNormalizer | None = None
+    shared_resources: frozenset[str] = frozenset()
+    supports_batch_quotes: bool = False
+    request_models: Mapping[str, type[BaseModel]] = field(default_factory=dict)
+
+
+_registrations: dict[str, ProviderRegistration] = {}
+_search_instances: dict[str, tuple[Settings, SearchProvider]] = {}
+_market_data_instances: dict[str, tuple[Settings, MarketDataProvider]] = {}
+
+
+def register_provider(registration: ProviderRegistration) -> None:
+    _registrations[registration.name] = registration
+    _search_instances.pop(registration.name, None)
+    _market_data_instances.pop(registration.name, None)
+
+
+def registered_providers() -> tuple[str, ...]:
+    return tuple(_registrations)
+
+
+def reset_provider_instances() -> None:
+    _search_instances.clear()
+    _market_data_instances.clear()
+
+
+def get_provider_registration(provider: str) -> ProviderRegistration:
+    registration = _registrations.get(provider)
+    if registration is None:
+        raise ProviderError(
+            f'Unsupported provider: {provider}',
+            code='provider_unsupported',
+            provider=provider,
+            retryable=False,
+        )
+    return registration
+
+
+def provider_rate_limit_per_minute(provider: str) -> int:
+    registration = _registrations.get(provider)
+    if registration is None:
+        return 0
+    return int(getattr(get_settings(), registration.rate_limit_setting))
+
+
+def is_shared_resource(provider: str, resource: str) -> bool:
+    registration = _registrations.get(provider)
+    return registration is not None and resource in registration.shared_resources
+
+
+def supports_batch_quotes(provider: str) -> bool:
+    registration = _registrations.get(provider)
+    return registration is not None and registration.supports_batch_quotes
+
+
+def canonical_request_payload(
+    provider: str,
+    resource: str,
+    request_payload: dict[str, object],
+) -> dict[str, object]:
+    registration = _registrations.get(provider)
+    model = registration.request_models.get(resource) if registration is not None else None
+    if model is None:
+        return request_payload
+    try:
+        request = model.model_validate(request_payload)
+    except ValidationError:
+        return request_payload
+    return canonical_request_fields(request.model_dump(mode='json'))
 
 
 def get_search_provider(provider: str) -> SearchProvider:
-    if provider == 'tavily':
-        return TavilyAdapter()
-    if provider == 'serper':
-        return SerperAdapter()
-    if provider == 'serpapi':
-        return SerpApiAdapter()
-    raise ProviderError(
-        f'Unsupported search provider: {provider}',
-        code='provider_unsupported',
-        provider=provider,
-        retryable=False,
-    )
+    settings = get_settings()
+    cached = _search_instances.get(provider)
+    if cached is not None and cached[0] is settings:
+        return cached[1]
+
+    registration = _registrations.get(provider)
+    if registration is None or registration.search_factory is None:
+        raise ProviderError(
+            f'Unsupported search provider: {provider}',
+            code='provider_unsupported',
+            provider=provider,
+            retryable=False,
+        )
+    adapter = registration.search_factory()
+    _search_instances[provider] = (settings, adapter)
+    return adapter
 
 
 def get_market_data_provider(provider: str) -> MarketDataProvider:
-    if provider == 'twelvedata':
-        return TwelveDataAdapter()
-    if provider == 'alphavantage':
-        return AlphaVantageAdapter()
-    raise ProviderError(
-        f'Unsupported market data provider: {provider}',
-        code='provider_unsupported',
-        provider=provider,
-        retryable=False,
+    settings = get_settings()
+    cached = _market_data_instances.get(provider)
+    if cached is not None and cached[0] is settings:
+        return cached[1]
+
+    registration = _registrations.get(provider)
+    if registration is None or registration.market_data_factory is None:
+        raise ProviderError(
+            f'Unsupported market data provider: {provider}',
+            code='provider_unsupported',
+            provider=provider,
+            retryable=False,
+        )
+    adapter = registration.market_data_factory()
+    _market_data_instances[provider] = (settings, adapter)
+    return adapter
+
+
+register_provider(
+    ProviderRegistration(
+        name='tavily',
+        rate_limit_setting='tavily_rate_limit_per_minute',
+        search_factory=TavilyAdapter,
+        normalize_news=tavily_mapper.normalize_news_payload,
+        request_models={'news_search': TavilySearchRequest},
+    )
+)
+register_provider(
+    ProviderRegistration(
+        name='serper',
+        rate_limit_setting='serper_rate_limit_per_minute',
+        search_factory=SerperAdapter,
+        normalize_news=serper_mapper.normalize_news_payload,
+        request_models={'news_search': SerperSearchRequest},
+    )
+)
+register_provider(
+    ProviderRegistration(
+        name='serpapi',
+        rate_limit_setting='serpapi_rate_limit_per_minute',
+        search_factory=SerpApiAdapter,
+        normalize_news=serpapi_mapper.normalize_news_payload,
+        request_models={'news_search': SerpApiSearchRequest},
+    )
+)
+register_provider(
+    ProviderRegistration(
+        name='twelvedata',
+        rate_limit_setting='twelvedata_rate_limit_per_minute',
+        market_data_factory=TwelveDataAdapter,
+        normalize_quote=twelvedata_mapper.normalize_quote_payload,
+        normalize_quote_batch=twelvedata_mapper.normalize_quote_batch_payload,
+        normalize_timeseries=twelvedata_mapper.normalize_timeseries_payload,
+        shared_resources=PUBLIC_MARKET_DATA_RESOURCES,
+        supports_batch_quotes=True,
+        request_models={
+            'market_quote_refresh': TwelveDataQuoteRequest,
+            'market_quote_batch_refresh': TwelveDataQuoteBatchRequest,
+            'market_timeseries_backfill': TwelveDataTimeseriesRequest,
+        },
+    )
+)
+register_provider(
+    ProviderRegistration(
+        name='alphavantage',
+        rate_limit_setting='alphavantage_rate_limit_per_minute',
+        market_data_factory=AlphaVantageAdapter,
+        normalize_quote=alphavantage_mapper.normalize_quote_payload,
+        normalize_quote_batch=alphavantage_mapper.normalize_quote_batch_payload,
+        normalize_timeseries=alphavantage_mapper.normalize_timeseries_payload,
+        shared_resources=PUBLIC_MARKET_DATA_RESOURCES,
+        request_models={
+            'market_quote_refresh': AlphaVantageQuoteRequest,
+            'market_quote_batch_refresh': AlphaVantageQuoteBatchRequest,
+            'market_timeseries_backfill': AlphaVantageTimeseriesRequest,
+        },
     )
+)
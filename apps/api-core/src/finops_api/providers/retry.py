@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from finops_api.providers.base import ProviderError
+
+
+def parse_retry_after(value: str | None, *, now: datetime | None = None) -> float | None:
+    if not value:
+        return None
+    raw = value.strip()
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - (now or datetime.now(UTC))).total_seconds())
+
+
+def backoff_delay(
+    attempt: int,
+    *,
+    base_seconds: float,
+    max_seconds: float,
+    retry_after_seconds: float | None = None,
+) -> float | None:
+    if retry_after_seconds is not None and retry_after_seconds > max_seconds:
+        return None
+    ceiling = min(max_seconds, base_seconds * (2.0**attempt))
+    delay = ceiling / 2 + random.uniform(0, ceiling / 2)
+    if retry_after_seconds is not None:
+        delay = max(delay, retry_after_seconds)
+    return delay
+
+
+def retries_exhausted_error(
+    message: str,
+    *,
+    provider: str,
+    last_exception: Exception | None,
+) -> ProviderError:
+    cause = last_exception if isinstance(last_exception, ProviderError) else None
+    error = ProviderError(
+        message,
+        code='provider_retries_exhausted',
+        provider=provider,
+        http_status=cause.http_status if cause else None,
+        retryable=False,
+        retry_after_seconds=cause.retry_after_seconds if cause else None,
+    )
+    error.__cause__ = last_exception
+    return error
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from typing import cast
 
 import httpx
 
 from finops_api.config import get_settings
+from finops_api.metrics import ProviderAttempt
 from finops_api.providers.base import ProviderError, ProviderResponse
+from finops_api.providers.http_pool import provider_http_client, read_limited_body
+from finops_api.providers.retry import backoff_delay, parse_retry_after, retries_exhausted_error
 from finops_api.providers.serper.dto import SerperSearchRequest
 
 
@@ -36,6 +40,7 @@ class SerperAdapter:
             max_retries if max_retries is not None else settings.provider_max_retries
         )
         self._backoff_seconds = backoff_seconds or settings.provider_backoff_seconds
+        self._max_backoff_seconds = settings.provider_max_backoff_seconds
         if self._max_retries < 0:
             raise ProviderError(
                 'PROVIDER_MAX_RETRIES must be non-negative',
@@ -43,6 +48,7 @@ class SerperAdapter:
                 provider='serper',
                 retryable=False,
             )
+        self._max_payload_bytes = settings.provider_max_payload_bytes
         self._transport = transport
 
     async def search_news(
@@ -100,8 +106,23 @@ class SerperAdapter:
 
         for attempt in range(self._max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=timeout, transport=self._transport) as client:
-                    response = await client.post(url, json=body, headers=headers)
+                async with (
+                    ProviderAttempt('serper', path, attempt=attempt) as tracked,
+                    provider_http_client('serper', transport=self._transport) as client,
+                    client.stream(
+                        'POST',
+                        url,
+                        json=body,
+                        headers=headers,
+                        timeout=timeout,
+                    ) as response,
+                ):
+                    content = await read_limited_body(
+                        response,
+                        provider='serper',
+                        max_bytes=self._max_payload_bytes,
+                    )
+                    tracked.observe_response(response.status_code, len(content))
 
                 if response.status_code in {429, 500, 502, 503, 504}:
                     raise ProviderError(
@@ -110,16 +131,20 @@ class SerperAdapter:
                         provider='serper',
                         http_status=response.status_code,
                         retryable=True,
+                        retry_after_seconds=parse_retry_after(
+                            response.headers.get('Retry-After')
+                        ),
                     )
                 if response.status_code >= 400:
                     raise ProviderError(
-                        f'Serper request failed: {response.status_code} {response.text}',
+                        f'Serper request failed: {response.status_code} '
+                        f"{content.decode('utf-8', errors='replace')}",
                         code='provider_request_failed',
                         provider='serper',
                         http_status=response.status_code,
                         retryable=False,
                     )
-                return cast(dict[str, object], response.json())
+                return cast(dict[str, object], json.loads(content))
             except httpx.TimeoutException as exc:
                 last_exception = ProviderError(
                     f'Serper timeout: {exc}',
@@ -140,11 +165,18 @@ class SerperAdapter:
             assert last_exception is not None
             if attempt == self._max_retries or not last_exception.retryable:
                 break
-            await asyncio.sleep(self._backoff_seconds * (2**attempt))
+            delay = backoff_delay(
+                attempt,
+                base_seconds=self._backoff_seconds,
+                max_seconds=self._max_backoff_seconds,
+                retry_after_seconds=last_exception.retry_after_seconds,
+            )
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
 
-        raise ProviderError(
+        raise retries_exhausted_error(
             f'Serper request exhausted retries: {last_exception}',
-            code='provider_retries_exhausted',
             provider='serper',
-            retryable=False,
+            last_exception=last_exception,
         )
@@ -1,20 +1,22 @@
 from __future__ import annotations
 
-import hashlib
-import json
-
-from finops_api.providers.serper.dto import CanonicalNewsItem, SerperNewsResult
+from finops_api.hashing import stable_hash
+from finops_api.providers.serper.dto import (
+    CanonicalNewsItem,
+    SerperNewsResponse,
+    SerperNewsResult,
+)
 
 
 def _stable_document_hash(result: SerperNewsResult) -> str:
-    canonical = {
-        'url': str(result.link),
-        'title': result.title.strip(),
-        'snippet': result.snippet.strip(),
-        'date': result.date,
-    }
-    encoded = json.dumps(canonical, sort_keys=True, separators=(',', ':')).encode('utf-8')
-    return hashlib.sha256(encoded).hexdigest()
+    return stable_hash(
+        {
+            'url': str(result.link),
+            'title': result.title.strip(),
+            'snippet': result.snippet.strip(),
+            'date': result.date,
+        }
+    )
 
 
 def to_canonical_news_item(result: SerperNewsResult) -> CanonicalNewsItem:
@@ -27,3 +29,8 @@ def to_canonical_news_item(result: SerperNewsResult) -> CanonicalNewsItem:
         published_at=result.parsed_date(),
         document_hash=_stable_document_hash(result),
     )
+
+
+def normalize_news_payload(payload: dict[str, object]) -> list[CanonicalNewsItem]:
+    response = SerperNewsResponse.model_validate(payload)
+    return [to_canonical_news_item(result) for result in response.news]
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from typing import Any, cast
 
 import httpx
 
 from finops_api.config import get_settings
+from finops_api.metrics import ProviderAttempt
 from finops_api.providers.base import ProviderError, ProviderResponse
+from finops_api.providers.http_pool import provider_http_client, read_limited_body
+from finops_api.providers.retry import backoff_delay, parse_retry_after, retries_exhausted_error
 from finops_api.providers.tavily.dto import TavilySearchRequest, TavilySearchResponse
 
 
@@ -36,6 +40,7 @@ class TavilyAdapter:
             max_retries if max_retries is not None else settings.provider_max_retries
         )
         self._backoff_seconds = backoff_seconds or settings.provider_backoff_seconds
+        self._max_backoff_seconds = settings.provider_max_backoff_seconds
         if self._max_retries < 0:
             raise ProviderError(
                 'PROVIDER_MAX_RETRIES must be non-negative',
@@ -43,6 +48,7 @@ class TavilyAdapter:
                 provider='tavily',
                 retryable=False,
             )
+        self._max_payload_bytes = settings.provider_max_payload_bytes
         self._transport = transport
 
     async def search_news(
@@ -92,8 +98,23 @@ class TavilyAdapter:
 
         for attempt in range(self._max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=timeout, transport=self._transport) as client:
-                    response = await client.post(url, json=body, headers=headers)
+                async with (
+                    ProviderAttempt('tavily', '/search', attempt=attempt) as tracked,
+                    provider_http_client('tavily', transport=self._transport) as client,
+                    client.stream(
+                        'POST',
+                        url,
+                        json=body,
+                        headers=headers,
+                        timeout=timeout,
+                    ) as response,
+                ):
+                    content = await read_limited_body(
+                        response,
+                        provider='tavily',
+                        max_bytes=self._max_payload_bytes,
+                    )
+                    tracked.observe_response(response.status_code, len(content))
 
                 if response.status_code in {429, 500, 502, 503, 504}:
                     raise ProviderError(
@@ -102,17 +123,21 @@ class TavilyAdapter:
                         provider='tavily',
                         http_status=response.status_code,
                         retryable=True,
+                        retry_after_seconds=parse_retry_after(
+                            response.headers.get('Retry-After')
+                        ),
                     )
                 if response.status_code >= 400:
                     raise ProviderError(
-                        f'Tavily request failed: {response.status_code} {response.text}',
+                        f'Tavily request failed: {response.status_code} '
+                        f"{content.decode('utf-8', errors='replace')}",
                         code='provider_request_failed',
                         provider='tavily',
                         http_status=response.status_code,
                         retryable=False,
                     )
 
-                return cast(dict[str, Any], response.json())
+                return cast(dict[str, Any], json.loads(content))
             except httpx.TimeoutException as exc:
                 last_exception = ProviderError(
                     f'Tavily timeout: {exc}',
@@ -134,10 +159,17 @@ class TavilyAdapter:
             if attempt == self._max_retries or not last_exception.retryable:
                 break
 
-            await asyncio.sleep(self._backoff_seconds * (2**attempt))
-        raise ProviderError(
+            delay = backoff_delay(
+                attempt,
+                base_seconds=self._backoff_seconds,
+                max_seconds=self._max_backoff_seconds,
+                retry_after_seconds=last_exception.retry_after_seconds,
+            )
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+        raise retries_exhausted_error(
             f'Tavily request exhausted retries: {last_exception}',
-            code='provider_retries_exhausted',
             provider='tavily',
-            retryable=False,
+            last_exception=last_exception,
         )
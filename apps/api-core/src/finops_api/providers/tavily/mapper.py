@@ -1,20 +1,22 @@
 from __future__ import annotations
 
-import hashlib
-import json
-
-from finops_api.providers.tavily.dto import CanonicalNewsItem, TavilySearchResult
+from finops_api.hashing import stable_hash
+from finops_api.providers.tavily.dto import (
+    CanonicalNewsItem,
+    TavilySearchResponse,
+    TavilySearchResult,
+)
 
 
 def _stable_document_hash(result: TavilySearchResult) -> str:
-    canonical = {
-        'url': str(result.url),
-        'title': result.title.strip(),
-        'content': result.content.strip(),
-        'published_date': result.published_date.isoformat() if result.published_date else None,
-    }
-    encoded = json.dumps(canonical, sort_keys=True, separators=(',', ':')).encode('utf-8')
-    return hashlib.sha256(encoded).hexdigest()
+    return stable_hash(
+        {
+            'url': str(result.url),
+            'title': result.title.strip(),
+            'content': result.content.strip(),
+            'published_date': result.published_date.isoformat() if result.published_date else None,
+        }
+    )
 
 
 def to_canonical_news_item(result: TavilySearchResult) -> CanonicalNewsItem:
@@ -24,4 +26,9 @@ def to_canonical_news_item(result: TavilySearchResult) -> CanonicalNewsItem:
         snippet=result.content.strip(),
         published_at=result.published_date,
         document_hash=_stable_document_hash(result),
-    )
\ No newline at end of file
+    )
+
+
+def normalize_news_payload(payload: dict[str, object]) -> list[CanonicalNewsItem]:
+    response = TavilySearchResponse.model_validate(payload)
+    return [to_canonical_news_item(result) for result in response.results]
@@ -1,16 +1,31 @@
 from __future__ import annotations
 
 import asyncio
+import json
+from datetime import UTC, datetime
 from typing import cast
 
 import httpx
 
 from finops_api.config import get_settings
-from finops_api.providers.base import ProviderError, ProviderResponse
-from finops_api.providers.twelvedata.dto import TwelveDataQuoteRequest, TwelveDataTimeseriesRequest
+from finops_api.metrics import ProviderAttempt
+from finops_api.providers.base import ProviderError, ProviderResponse, chunk_symbols
+from finops_api.providers.http_pool import provider_http_client, read_limited_body
+from finops_api.providers.retry import backoff_delay, parse_retry_after, retries_exhausted_error
+from finops_api.providers.twelvedata.dto import (
+    TWELVEDATA_MAX_OUTPUTSIZE,
+    TwelveDataQuoteBatchRequest,
+    TwelveDataQuoteRequest,
+    TwelveDataTimeseriesRequest,
+    timeseries_windows,
+)
+
+_SYMBOL_ERROR_CODES = frozenset({400, 404})
 
 
 class TwelveDataAdapter:
+    max_batch_symbols = 120
+
     def __init__(
         self,
         *,
@@ -35,6 +50,7 @@ class TwelveDataAdapter:
             max_retries if max_retries is not None else settings.provider_max_retries
         )
         self._backoff_seconds = backoff_seconds or settings.provider_backoff_seconds
+        self._max_backoff_seconds = settings.provider_max_backoff_seconds
         if self._max_retries < 0:
             raise ProviderError(
                 'PROVIDER_MAX_RETRIES must be non-negative',
@@ -42,6 +58,7 @@ class TwelveDataAdapter:
                 provider='twelvedata',
                 retryable=False,
             )
+        self._max_payload_bytes = settings.provider_max_payload_bytes
         self._transport = transport
 
     async def get_quote(
@@ -58,6 +75,36 @@ class TwelveDataAdapter:
         )
         return ProviderResponse(http_status=200, provider_request_id=None, payload=payload)
 
+    async def get_quote_batch(
+        self,
+        *,
+        idempotency_key: str,
+        request_payload: dict[str, object],
+    ) -> ProviderResponse:
+        request = TwelveDataQuoteBatchRequest.model_validate(request_payload)
+        quotes: list[object] = []
+        errors: dict[str, str] = {}
+        for chunk in chunk_symbols(request.symbols, self.max_batch_symbols):
+            payload = await self._get_with_retry(
+                path='/quote',
+                idempotency_key=idempotency_key,
+                query={'symbol': ','.join(chunk)},
+                allow_symbol_errors=len(chunk) == 1,
+            )
+            entries = {chunk[0]: payload} if len(chunk) == 1 else payload
+            for symbol, entry in entries.items():
+                if not isinstance(entry, dict):
+                    continue
+                if str(entry.get('status', 'ok')).lower() == 'error':
+                    errors[symbol] = str(entry.get('message', 'unknown error'))
+                    continue
+                quotes.append(entry)
+        return ProviderResponse(
+            http_status=200,
+            provider_request_id=None,
+            payload={'quotes': quotes, 'errors': errors},
+        )
+
     async def get_timeseries(
         self,
         *,
@@ -65,15 +112,25 @@ class TwelveDataAdapter:
         request_payload: dict[str, object],
     ) -> ProviderResponse:
         request = TwelveDataTimeseriesRequest.model_validate(request_payload)
+        windows = timeseries_windows(request, now=datetime.now(UTC))
+        if len(windows) > 1:
+            raise ProviderError(
+                f'TwelveData timeseries request spans {len(windows)} windows; '
+                'split it with split_timeseries_request',
+                code='provider_request_invalid',
+                provider='twelvedata',
+                retryable=False,
+            )
+        start_date, end_date = windows[0]
         query: dict[str, object] = {
             'symbol': request.symbol,
             'interval': request.interval,
-            'outputsize': request.outputsize,
+            'outputsize': TWELVEDATA_MAX_OUTPUTSIZE if start_date else request.outputsize,
         }
-        if request.start_date:
-            query['start_date'] = request.start_date
-        if request.end_date:
-            query['end_date'] = request.end_date
+        if start_date:
+            query['start_date'] = start_date
+        if end_date:
+            query['end_date'] = end_date
 
         payload = await self._get_with_retry(
             path='/time_series',
@@ -82,12 +139,48 @@ class TwelveDataAdapter:
         )
         return ProviderResponse(http_status=200, provider_request_id=None, payload=payload)
 
+    def split_timeseries_request(
+        self,
+        request_payload: dict[str, object],
+    ) -> list[dict[str, object]]:
+        request = TwelveDataTimeseriesRequest.model_validate(request_payload)
+        windows = timeseries_windows(request, now=datetime.now(UTC))
+        if len(windows) == 1:
+            return [request_payload]
+        return [
+            {**request_payload, 'start_date': start_date, 'end_date': end_date}
+            for start_date, end_date in windows
+        ]
+
+    def split_quote_batch_request(
+        self,
+        request_payload: dict[str, object],
+        *,
+        max_requests: int,
+    ) -> list[dict[str, object]]:
+        request = TwelveDataQuoteBatchRequest.model_validate(request_payload)
+        if len(request.symbols) <= max_requests:
+            return [request_payload]
+        return [
+            {**request_payload, 'symbols': chunk}
+            for chunk in chunk_symbols(request.symbols, max(1, max_requests))
+        ]
+
+    def quote_batch_request_count(self, request_payload: dict[str, object]) -> int:
+        request = TwelveDataQuoteBatchRequest.model_validate(request_payload)
+        return len(request.symbols)
+
+    def timeseries_request_count(self, request_payload: dict[str, object]) -> int:
+        request = TwelveDataTimeseriesRequest.model_validate(request_payload)
+        return len(timeseries_windows(request, now=datetime.now(UTC)))
+
     async def _get_with_retry(
         self,
         *,
         path: str,
         idempotency_key: str,
         query: dict[str, object],
+        allow_symbol_errors: bool = False,
     ) -> dict[str, object]:
         params = {key: str(value) for key, value in query.items()}
         params['apikey'] = self._api_key
@@ -99,8 +192,23 @@ class TwelveDataAdapter:
 
         for attempt in range(self._max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=timeout, transport=self._transport) as client:
-                    response = await client.get(url, params=params, headers=headers)
+                async with (
+                    ProviderAttempt('twelvedata', path, attempt=attempt) as tracked,
+                    provider_http_client('twelvedata', transport=self._transport) as client,
+                    client.stream(
+                        'GET',
+                        url,
+                        params=params,
+                        headers=headers,
+                        timeout=timeout,
+                    ) as response,
+                ):
+                    content = await read_limited_body(
+                        response,
+                        provider='twelvedata',
+                        max_bytes=self._max_payload_bytes,
+                    )
+                    tracked.observe_response(response.status_code, len(content))
 
                 if response.status_code in {429, 500, 502, 503, 504}:
                     raise ProviderError(
@@ -109,19 +217,25 @@ class TwelveDataAdapter:
                         provider='twelvedata',
                         http_status=response.status_code,
                         retryable=True,
+                        retry_after_seconds=parse_retry_after(
+                            response.headers.get('Retry-After')
+                        ),
                     )
                 if response.status_code >= 400:
                     raise ProviderError(
-                        f'TwelveData request failed: {response.status_code} {response.text}',
+                        f'TwelveData request failed: {response.status_code} '
+                        f"{content.decode('utf-8', errors='replace')}",
                         code='provider_request_failed',
                         provider='twelvedata',
                         http_status=response.status_code,
                         retryable=False,
                     )
 
-                parsed = cast(dict[str, object], response.json())
+                parsed = cast(dict[str, object], json.loads(content))
                 status = str(parsed.get('status', 'ok')).lower()
-                if status == 'error':
+                if status == 'error' and not (
+                    allow_symbol_errors and parsed.get('code') in _SYMBOL_ERROR_CODES
+                ):
                     message = str(parsed.get('message', 'unknown error'))
                     raise ProviderError(
                         f'TwelveData provider error: {message}',
@@ -150,11 +264,18 @@ class TwelveDataAdapter:
             assert last_exception is not None
             if attempt == self._max_retries or not last_exception.retryable:
                 break
-            await asyncio.sleep(self._backoff_seconds * (2**attempt))
+            delay = backoff_delay(
+                attempt,
+                base_seconds=self._backoff_seconds,
+                max_seconds=self._max_backoff_seconds,
+                retry_after_seconds=last_exception.retry_after_seconds,
+            )
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
 
-        raise ProviderError(
+        raise retries_exhausted_error(
             f'TwelveData request exhausted retries: {last_exception}',
-            code='provider_retries_exhausted',
             provider='twelvedata',
-            retryable=False,
+            last_exception=last_exception,
         )
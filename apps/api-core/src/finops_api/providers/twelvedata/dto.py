@@ -1,22 +1,51 @@
 from __future__ import annotations
 
-from datetime import UTC
+from datetime import UTC, timedelta
 from datetime import datetime as dt
 from decimal import Decimal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from finops_api.providers.base import normalize_symbol_list
+
+TWELVEDATA_MAX_OUTPUTSIZE = 5000
+
+_INTERVAL_DURATIONS = {
+    '1min': timedelta(minutes=1),
+    '5min': timedelta(minutes=5),
+    '15min': timedelta(minutes=15),
+    '30min': timedelta(minutes=30),
+    '45min': timedelta(minutes=45),
+    '1h': timedelta(hours=1),
+    '2h': timedelta(hours=2),
+    '4h': timedelta(hours=4),
+    '8h': timedelta(hours=8),
+    '1day': timedelta(days=1),
+    '1week': timedelta(weeks=1),
+    '1month': timedelta(days=31),
+}
 
 
 class TwelveDataQuoteRequest(BaseModel):
     symbol: str = Field(min_length=1, max_length=32)
 
 
+class TwelveDataQuoteBatchRequest(BaseModel):
+    symbols: list[str] = Field(min_length=1, max_length=1000)
+
+    @field_validator('symbols', mode='before')
+    @classmethod
+    def normalize_symbols(cls, value: object) -> object:
+        return normalize_symbol_list(value)
+
+
 class TwelveDataTimeseriesRequest(BaseModel):
     symbol: str = Field(min_length=1, max_length=32)
     interval: str = Field(default='1day', min_length=2, max_length=16)
-    outputsize: int = Field(default=100, ge=1, le=5000)
+    outputsize: int = Field(default=100, ge=1, le=TWELVEDATA_MAX_OUTPUTSIZE)
     start_date: str | None = None
     end_date: str | None = None
+    incremental: bool = False
 
 
 class TwelveDataQuoteResponse(BaseModel):
@@ -29,6 +58,11 @@ class TwelveDataQuoteResponse(BaseModel):
         return parse_datetime(self.datetime)
 
 
+class TwelveDataQuoteBatchResponse(BaseModel):
+    quotes: list[TwelveDataQuoteResponse] = Field(default_factory=list)
+    errors: dict[str, str] = Field(default_factory=dict)
+
+
 class TwelveDataValue(BaseModel):
     datetime: str
     open: Decimal
@@ -75,3 +109,32 @@ def parse_datetime(value: str) -> dt:
     if parsed.tzinfo is None:
         return parsed.replace(tzinfo=UTC)
     return parsed.astimezone(UTC)
+
+
+def format_request_datetime(value: dt) -> str:
+    return value.astimezone(UTC).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def timeseries_windows(
+    request: TwelveDataTimeseriesRequest,
+    *,
+    now: dt,
+) -> list[tuple[str | None, str | None]]:
+    if not request.start_date:
+        return [(None, request.end_date)]
+
+    start = parse_datetime(request.start_date)
+    end = parse_datetime(request.end_date) if request.end_date else now
+    span = _INTERVAL_DURATIONS.get(request.interval, timedelta(days=1)) * (
+        TWELVEDATA_MAX_OUTPUTSIZE
+    )
+    if end - start <= span:
+        return [(request.start_date, request.end_date)]
+
+    windows: list[tuple[str | None, str | None]] = []
+    cursor = start
+    while cursor < end:
+        window_end = min(cursor + span, end)
+        windows.append((format_request_datetime(cursor), format_request_datetime(window_end)))
+        cursor = window_end
+    return windows
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from typing import cast
+
 from finops_api.providers.twelvedata.dto import (
     CanonicalQuote,
     CanonicalTimeseriesPoint,
+    TwelveDataMeta,
+    TwelveDataQuoteBatchResponse,
     TwelveDataQuoteResponse,
     TwelveDataTimeseriesResponse,
     parse_datetime,
@@ -41,3 +46,33 @@ def to_canonical_timeseries(
             )
         )
     return rows
+
+
+def normalize_quote_payload(payload: dict[str, object]) -> CanonicalQuote:
+    return to_canonical_quote(TwelveDataQuoteResponse.model_validate(payload))
+
+
+def normalize_quote_batch_payload(payload: dict[str, object]) -> list[CanonicalQuote]:
+    response = TwelveDataQuoteBatchResponse.model_validate(payload)
+    return [to_canonical_quote(quote) for quote in response.quotes]
+
+
+def normalize_timeseries_payload(
+    payload: dict[str, object],
+    *,
+    request_payload: dict[str, object],  # noqa: ARG001
+) -> Iterator[dict[str, object]]:
+    meta = TwelveDataMeta.model_validate(payload.get('meta'))
+    symbol = meta.symbol.upper()
+    values = cast(list[dict[str, object]], payload.get('values') or [])
+    for value in values:
+        yield {
+            'symbol': symbol,
+            'timeframe': meta.interval,
+            'ts': parse_datetime(str(value['datetime'])),
+            'open': float(str(value['open'])),
+            'high': float(str(value['high'])),
+            'low': float(str(value['low'])),
+            'close': float(str(value['close'])),
+            'volume': float(str(value['volume'])),
+        }
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -52,6 +54,67 @@ class IngestionRepository:
                 raise
             return existing
 
+    async def create_many(
+        self,
+        org_id: UUID,
+        payloads: Sequence[IngestionJobCreate],
+    ) -> list[tuple[IngestionJob, bool]]:
+        if not payloads:
+            return []
+
+        rows: dict[tuple[str, str, str], dict[str, object]] = {}
+        for payload in payloads:
+            key = (payload.provider, payload.resource, payload.idempotency_key)
+            rows.setdefault(
+                key,
+                {
+                    'id': uuid4(),
+                    'org_id': org_id,
+                    'provider': payload.provider,
+                    'resource': payload.resource,
+                    'idempotency_key': payload.idempotency_key,
+                    'payload': payload.payload,
+                    'schema_version': 'v1',
+                    'status': 'queued',
+                    'attempt_count': 0,
+                },
+            )
+
+        stmt = (
+            insert(IngestionJob)
+            .values(list(rows.values()))
+            .on_conflict_do_nothing(
+                index_elements=['org_id', 'provider', 'resource', 'idempotency_key'],
+            )
+            .returning(IngestionJob)
+        )
+        inserted = list((await self.session.scalars(stmt)).all())
+        created_ids = {job.id for job in inserted}
+        jobs = {(job.provider, job.resource, job.idempotency_key): job for job in inserted}
+
+        missing = [key for key in rows if key not in jobs]
+        if missing:
+            existing = await self.session.scalars(
+                select(IngestionJob).where(
+                    IngestionJob.org_id == org_id,
+                    tuple_(
+                        IngestionJob.provider,
+                        IngestionJob.resource,
+                        IngestionJob.idempotency_key,
+                    ).in_(missing),
+                )
+            )
+            for job in existing:
+                jobs[(job.provider, job.resource, job.idempotency_key)] = job
+        await self.session.commit()
+
+        results: list[tuple[IngestionJob, bool]] = []
+        for payload in payloads:
+            job = jobs[(payload.provider, payload.resource, payload.idempotency_key)]
+            results.append((job, job.id in created_ids))
+            created_ids.discard(job.id)
+        return results
+
     async def get(self, *, org_id: UUID, job_id: UUID) -> IngestionJob | None:
         stmt = select(IngestionJob).where(
             IngestionJob.org_id == org_id,
@@ -93,6 +156,14 @@ class IngestionRepository:
         await self.session.refresh(job)
         return job
 
+    async def mark_throttled(self, job: IngestionJob, reason: str) -> IngestionJob:
+        job.status = 'throttled'
+        job.error_message = reason[:2048]
+        job.completed_at = None
+        await self.session.commit()
+        await self.session.refresh(job)
+        return job
+
     async def mark_failed(self, job: IngestionJob, error_message: str) -> IngestionJob:
         job.status = 'failed'
         job.error_message = error_message[:2048]
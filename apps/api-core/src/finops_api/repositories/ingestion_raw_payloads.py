@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from finops_api.models import IngestionRawPayload
@@ -24,22 +25,41 @@ class IngestionRawPayloadRepository:
         response_payload: dict[str, object],
         http_status: int | None,
         provider_request_id: str | None,
+        fetch_latency_ms: int | None = None,
+        response_bytes: int | None = None,
     ) -> IngestionRawPayload:
-        row = IngestionRawPayload(
-            org_id=org_id,
-            job_id=job_id,
-            provider=provider,
-            resource=resource,
-            schema_version='v1',
-            content_hash=content_hash,
-            request_payload=request_payload,
-            response_payload=response_payload,
-            http_status=http_status,
-            provider_request_id=provider_request_id,
+        stmt = (
+            insert(IngestionRawPayload)
+            .values(
+                id=uuid4(),
+                org_id=org_id,
+                job_id=job_id,
+                provider=provider,
+                resource=resource,
+                schema_version='v1',
+                content_hash=content_hash,
+                request_payload=request_payload,
+                response_payload=response_payload,
+                http_status=http_status,
+                provider_request_id=provider_request_id,
+                fetch_latency_ms=fetch_latency_ms,
+                response_bytes=response_bytes,
+            )
+            .on_conflict_do_nothing(index_elements=['org_id', 'provider', 'content_hash'])
+            .returning(IngestionRawPayload)
         )
-        self.session.add(row)
+        row = (await self.session.scalars(stmt)).one_or_none()
+        if row is None:
+            row = (
+                await self.session.scalars(
+                    select(IngestionRawPayload).where(
+                        IngestionRawPayload.org_id == org_id,
+                        IngestionRawPayload.provider == provider,
+                        IngestionRawPayload.content_hash == content_hash,
+                    )
+                )
+            ).one()
         await self.session.commit()
-        await self.session.refresh(row)
         return row
 
     async def get(self, raw_payload_id: UUID) -> IngestionRawPayload | None:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import UTC, datetime
+from itertools import batched
 from uuid import UUID
 
 from sqlalchemy import desc, func, select
@@ -50,6 +52,23 @@ class MarketRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_latest_timeseries_ts(
+        self,
+        *,
+        org_id: UUID,
+        provider: str,
+        symbol: str,
+        timeframe: str,
+    ) -> datetime | None:
+        stmt = select(func.max(MarketTimeseries.ts)).where(
+            MarketTimeseries.org_id == org_id,
+            MarketTimeseries.symbol == symbol.upper(),
+            MarketTimeseries.timeframe == timeframe,
+            MarketTimeseries.provider == provider,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def upsert_timeseries_rows(
         self,
         *,
@@ -57,15 +76,13 @@ class MarketRepository:
         provider: str,
         schema_version: str,
         raw_payload_id: UUID | None,
-        rows: list[dict[str, object]],
+        rows: Iterable[dict[str, object]],
+        chunk_size: int = 1000,
     ) -> int:
-        if not rows:
-            return 0
-
-        values = []
+        upserted = 0
         fetched_at = datetime.now(UTC)
-        for row in rows:
-            values.append(
+        for chunk in batched(rows, chunk_size):
+            values = [
                 {
                     'org_id': org_id,
                     'symbol': str(row['symbol']).upper(),
@@ -81,24 +98,27 @@ class MarketRepository:
                     'volume': row['volume'],
                     'fetched_at': fetched_at,
                 }
+                for row in chunk
+            ]
+            stmt = insert(MarketTimeseries).values(values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['org_id', 'provider', 'symbol', 'timeframe', 'ts'],
+                set_={
+                    'open': stmt.excluded.open,
+                    'high': stmt.excluded.high,
+                    'low': stmt.excluded.low,
+                    'close': stmt.excluded.close,
+                    'volume': stmt.excluded.volume,
+                    'raw_payload_id': stmt.excluded.raw_payload_id,
+                    'fetched_at': stmt.excluded.fetched_at,
+                },
             )
+            await self.session.execute(stmt)
+            upserted += len(values)
 
-        stmt = insert(MarketTimeseries).values(values)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=['org_id', 'provider', 'symbol', 'timeframe', 'ts'],
-            set_={
-                'open': stmt.excluded.open,
-                'high': stmt.excluded.high,
-                'low': stmt.excluded.low,
-                'close': stmt.excluded.close,
-                'volume': stmt.excluded.volume,
-                'raw_payload_id': stmt.excluded.raw_payload_id,
-                'fetched_at': stmt.excluded.fetched_at,
-            },
-        )
-        await self.session.execute(stmt)
-        await self.session.commit()
-        return len(values)
+        if upserted:
+            await self.session.commit()
+        return upserted
 
     async def upsert_quote(
         self,
@@ -138,6 +158,48 @@ class MarketRepository:
         assert latest is not None
         return latest
 
+    async def upsert_quotes(
+        self,
+        *,
+        org_id: UUID,
+        provider: str,
+        schema_version: str,
+        raw_payload_id: UUID | None,
+        rows: list[dict[str, object]],
+    ) -> int:
+        if not rows:
+            return 0
+
+        values_by_key: dict[tuple[str, object], dict[str, object]] = {}
+        fetched_at = datetime.now(UTC)
+        for row in rows:
+            symbol = str(row['symbol']).upper()
+            values_by_key[(symbol, row['as_of'])] = {
+                'org_id': org_id,
+                'symbol': symbol,
+                'provider': provider,
+                'schema_version': schema_version,
+                'raw_payload_id': raw_payload_id,
+                'price': row['price'],
+                'change_percent': row['change_percent'],
+                'as_of': row['as_of'],
+                'fetched_at': fetched_at,
+            }
+
+        stmt = insert(MarketQuote).values(list(values_by_key.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['org_id', 'provider', 'symbol', 'as_of'],
+            set_={
+                'price': stmt.excluded.price,
+                'change_percent': stmt.excluded.change_percent,
+                'raw_payload_id': stmt.excluded.raw_payload_id,
+                'fetched_at': stmt.excluded.fetched_at,
+            },
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+        return len(values_by_key)
+
     async def count_timeseries_by_job(self, *, org_id: UUID, job_id: UUID) -> int:
         raw_ids_subquery = select(IngestionRawPayload.id).where(
             IngestionRawPayload.org_id == org_id, IngestionRawPayload.job_id == job_id
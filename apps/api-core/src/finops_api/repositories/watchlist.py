@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from finops_api.models import MarketWatchlistEntry
+from finops_api.schemas.market import WatchlistEntryCreate
+
+
+class WatchlistRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def list(self, *, org_id: UUID) -> list[MarketWatchlistEntry]:
+        stmt = (
+            select(MarketWatchlistEntry)
+            .where(MarketWatchlistEntry.org_id == org_id)
+            .order_by(
+                MarketWatchlistEntry.provider,
+                MarketWatchlistEntry.symbol,
+                MarketWatchlistEntry.timeframe,
+            )
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def add(self, *, org_id: UUID, payload: WatchlistEntryCreate) -> MarketWatchlistEntry:
+        symbol = payload.symbol.upper()
+        stmt = (
+            insert(MarketWatchlistEntry)
+            .values(
+                org_id=org_id,
+                provider=payload.provider,
+                symbol=symbol,
+                timeframe=payload.timeframe,
+            )
+            .on_conflict_do_nothing(
+                index_elements=['org_id', 'provider', 'symbol', 'timeframe'],
+            )
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+        result = await self.session.execute(
+            select(MarketWatchlistEntry).where(
+                MarketWatchlistEntry.org_id == org_id,
+                MarketWatchlistEntry.provider == payload.provider,
+                MarketWatchlistEntry.symbol == symbol,
+                MarketWatchlistEntry.timeframe == payload.timeframe,
+            )
+        )
+        return result.scalar_one()
+
+    async def remove(self, *, org_id: UUID, entry_id: UUID) -> bool:
+        result = await self.session.execute(
+            delete(MarketWatchlistEntry).where(
+                MarketWatchlistEntry.org_id == org_id,
+                MarketWatchlistEntry.id == entry_id,
+            )
+        )
+        await self.session.commit()
+        return bool(getattr(result, 'rowcount', 0))
@@ -1,12 +1,11 @@
 from datetime import UTC, datetime
 
-from arq import create_pool
-from arq.connections import RedisSettings
-from fastapi import APIRouter
+from arq import ArqRedis
+from fastapi import APIRouter, Depends
 from sqlalchemy import text
 
-from finops_api.config import get_settings
 from finops_api.db import SessionLocal
+from finops_api.dependencies import get_arq_pool
 
 router = APIRouter(prefix='/health', tags=['health'])
 
@@ -17,9 +16,7 @@ async def live() -> dict[str, str]:
 
 
 @router.get('/ready')
-async def ready() -> dict[str, object]:
-    settings = get_settings()
-
+async def ready(redis_pool: ArqRedis = Depends(get_arq_pool)) -> dict[str, object]:
     db_ready = False
     redis_ready = False
 
@@ -30,16 +27,11 @@ async def ready() -> dict[str, object]:
     except Exception:
         db_ready = False
 
-    redis_pool = None
     try:
-        redis_pool = await create_pool(RedisSettings.from_dsn(settings.redis_url))
         await redis_pool.ping()
         redis_ready = True
     except Exception:
         redis_ready = False
-    finally:
-        if redis_pool is not None:
-            await redis_pool.close()
 
     status = 'ready' if db_ready and redis_ready else 'degraded'
     return {
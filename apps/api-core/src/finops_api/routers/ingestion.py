@@ -3,17 +3,24 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from uuid import UUID
 
+from arq import ArqRedis
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from finops_api.dependencies import get_org_id, get_tenant_session
+from finops_api.config import get_settings
+from finops_api.dependencies import get_arq_pool, get_org_id, get_tenant_session
 from finops_api.repositories.ingestion import IngestionRepository
 from finops_api.repositories.ingestion_raw_payloads import IngestionRawPayloadRepository
 from finops_api.repositories.market import MarketRepository
 from finops_api.repositories.news_documents import NewsDocumentRepository
 from finops_api.schemas.common import ApiResponse, MetaEnvelope
-from finops_api.schemas.ingestion import IngestionJobCreate, IngestionJobRead
-from finops_api.services.queue import enqueue_ingestion_job
+from finops_api.schemas.ingestion import (
+    IngestionJobBatchCreate,
+    IngestionJobBatchItem,
+    IngestionJobCreate,
+    IngestionJobRead,
+)
+from finops_api.services.queue import enqueue_ingestion_job, enqueue_many, ingestion_job
 
 CREATE_JOB_EXAMPLE = {
     'data': {
@@ -84,13 +91,19 @@ async def create_job(
     request: Request,
     org_id: UUID = Depends(get_org_id),
     session: AsyncSession = Depends(get_tenant_session),
+    redis_pool: ArqRedis = Depends(get_arq_pool),
 ) -> ApiResponse[IngestionJobRead]:
     repo = IngestionRepository(session)
     raw_repo = IngestionRawPayloadRepository(session)
     news_repo = NewsDocumentRepository(session)
     market_repo = MarketRepository(session)
     job = await repo.create(org_id=org_id, payload=payload)
-    await enqueue_ingestion_job(job_id=job.id, org_id=org_id)
+    await enqueue_ingestion_job(
+        redis_pool,
+        job_id=job.id,
+        org_id=org_id,
+        resource=job.resource,
+    )
     raw_count = await raw_repo.count_by_job(job_id=job.id)
     normalized_count = await _count_normalized_records(
         org_id=org_id,
@@ -114,6 +127,50 @@ async def create_job(
     )
 
 
+@router.post('/jobs:batch', response_model=ApiResponse[list[IngestionJobBatchItem]])
+async def create_jobs_batch(
+    payload: IngestionJobBatchCreate,
+    request: Request,
+    org_id: UUID = Depends(get_org_id),
+    session: AsyncSession = Depends(get_tenant_session),
+    redis_pool: ArqRedis = Depends(get_arq_pool),
+) -> ApiResponse[list[IngestionJobBatchItem]]:
+    max_jobs = get_settings().ingestion_batch_max_jobs
+    if len(payload.jobs) > max_jobs:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'Batch exceeds INGESTION_BATCH_MAX_JOBS ({max_jobs} jobs)',
+        )
+
+    repo = IngestionRepository(session)
+    results = await repo.create_many(org_id=org_id, payloads=payload.jobs)
+    await enqueue_many(
+        redis_pool,
+        [
+            ingestion_job(job_id=job.id, org_id=org_id, resource=job.resource)
+            for job, created in results
+            if created
+        ],
+    )
+
+    return ApiResponse[list[IngestionJobBatchItem]](
+        data=[
+            IngestionJobBatchItem(
+                index=index,
+                created=created,
+                job=IngestionJobRead.model_validate(job, from_attributes=True),
+            )
+            for index, (job, created) in enumerate(results)
+        ],
+        meta=MetaEnvelope(
+            request_id=request.state.request_id,
+            org_id=org_id,
+            trace_id=request.state.trace_id,
+            ts=datetime.now(UTC),
+        ),
+    )
+
+
 @router.get(
     '/jobs/{job_id}',
     response_model=ApiResponse[IngestionJobRead],
@@ -168,7 +225,7 @@ async def _count_normalized_records(
         return await news_repo.count_by_job(org_id=org_id, job_id=job_id)
     if resource == 'market_timeseries_backfill':
         return await market_repo.count_timeseries_by_job(org_id=org_id, job_id=job_id)
-    if resource == 'market_quote_refresh':
+    if resource in {'market_quote_refresh', 'market_quote_batch_refresh'}:
         return await market_repo.count_quotes_by_job(org_id=org_id, job_id=job_id)
     return 0
 
@@ -3,13 +3,21 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from uuid import UUID
 
+from arq import ArqRedis
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from finops_api.dependencies import get_org_id, get_tenant_session
+from finops_api.dependencies import get_arq_pool, get_org_id, get_tenant_session
 from finops_api.repositories.market import MarketRepository
+from finops_api.repositories.watchlist import WatchlistRepository
 from finops_api.schemas.common import ApiResponse, MetaEnvelope
-from finops_api.schemas.market import MarketQuoteRead, TimeseriesPointRead
+from finops_api.schemas.market import (
+    MarketQuoteRead,
+    TimeseriesPointRead,
+    WatchlistEntryCreate,
+    WatchlistEntryRead,
+)
+from finops_api.services.prewarm import track_watchlist_org
 
 router = APIRouter(prefix='/v1/market', tags=['market'])
 
@@ -67,3 +75,58 @@ async def get_quote(
         ),
     )
 
+
+@router.get('/watchlist', response_model=ApiResponse[list[WatchlistEntryRead]])
+async def list_watchlist(
+    request: Request,
+    org_id: UUID = Depends(get_org_id),
+    session: AsyncSession = Depends(get_tenant_session),
+) -> ApiResponse[list[WatchlistEntryRead]]:
+    repo = WatchlistRepository(session)
+    rows = await repo.list(org_id=org_id)
+    return ApiResponse[list[WatchlistEntryRead]](
+        data=[WatchlistEntryRead.model_validate(row, from_attributes=True) for row in rows],
+        meta=MetaEnvelope(
+            request_id=request.state.request_id,
+            org_id=org_id,
+            trace_id=request.state.trace_id,
+            ts=datetime.now(UTC),
+        ),
+    )
+
+
+@router.post('/watchlist', response_model=ApiResponse[WatchlistEntryRead])
+async def add_watchlist_entry(
+    payload: WatchlistEntryCreate,
+    request: Request,
+    org_id: UUID = Depends(get_org_id),
+    session: AsyncSession = Depends(get_tenant_session),
+    redis_pool: ArqRedis = Depends(get_arq_pool),
+) -> ApiResponse[WatchlistEntryRead]:
+    repo = WatchlistRepository(session)
+    row = await repo.add(org_id=org_id, payload=payload)
+    await track_watchlist_org(redis_pool, org_id)
+
+    return ApiResponse[WatchlistEntryRead](
+        data=WatchlistEntryRead.model_validate(row, from_attributes=True),
+        meta=MetaEnvelope(
+            request_id=request.state.request_id,
+            org_id=org_id,
+            trace_id=request.state.trace_id,
+            ts=datetime.now(UTC),
+        ),
+    )
+
+
+@router.delete('/watchlist/{entry_id}', status_code=status.HTTP_204_NO_CONTENT)
+async def remove_watchlist_entry(
+    entry_id: UUID,
+    org_id: UUID = Depends(get_org_id),
+    session: AsyncSession = Depends(get_tenant_session),
+) -> None:
+    repo = WatchlistRepository(session)
+    if not await repo.remove(org_id=org_id, entry_id=entry_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Watchlist entry not found',
+        )
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from arq import ArqRedis
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from finops_api.dependencies import get_arq_pool
+from finops_api.metrics import flush_metrics, load_metrics, render_metrics
+
+router = APIRouter(tags=['metrics'])
+
+
+@router.get('/metrics', response_class=PlainTextResponse)
+async def prometheus_metrics(redis_pool: ArqRedis = Depends(get_arq_pool)) -> PlainTextResponse:
+    await flush_metrics(redis_pool)
+    values = await load_metrics(redis_pool)
+    return PlainTextResponse(
+        render_metrics(values),
+        media_type='text/plain; version=0.0.4; charset=utf-8',
+    )
@@ -20,11 +20,20 @@ class IngestionJobCreate(BaseModel):
     )
 
     provider: Literal['tavily', 'serper', 'serpapi', 'twelvedata', 'alphavantage']
-    resource: Literal['news_search', 'market_timeseries_backfill', 'market_quote_refresh']
+    resource: Literal[
+        'news_search',
+        'market_timeseries_backfill',
+        'market_quote_refresh',
+        'market_quote_batch_refresh',
+    ]
     idempotency_key: str = Field(min_length=4, max_length=128)
     payload: dict[str, Any] = Field(default_factory=dict)
 
 
+class IngestionJobBatchCreate(BaseModel):
+    jobs: list[IngestionJobCreate] = Field(min_length=1)
+
+
 class IngestionJobRead(BaseModel):
     id: UUID
     org_id: UUID
@@ -42,3 +51,9 @@ class IngestionJobRead(BaseModel):
     normalized_record_count: int = 0
     created_at: datetime
     updated_at: datetime
+
+
+class IngestionJobBatchItem(BaseModel):
+    index: int
+    created: bool
+    job: IngestionJobRead
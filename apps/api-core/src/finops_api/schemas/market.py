@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class TimeseriesPointRead(BaseModel):
@@ -30,3 +31,18 @@ class MarketQuoteRead(BaseModel):
     change_percent: float | None
     as_of: datetime
     fetched_at: datetime
+
+
+class WatchlistEntryCreate(BaseModel):
+    provider: Literal['twelvedata', 'alphavantage']
+    symbol: str = Field(min_length=1, max_length=16)
+    timeframe: str = Field(default='1day', min_length=2, max_length=16)
+
+
+class WatchlistEntryRead(BaseModel):
+    id: UUID
+    org_id: UUID
+    provider: str
+    symbol: str
+    timeframe: str
+    created_at: datetime
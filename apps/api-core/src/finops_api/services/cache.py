@@ -1,26 +1,305 @@
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import json
+import logging
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Any, cast
+from uuid import uuid4
+
+from finops_api.config import get_settings
+from finops_api.hashing import stable_hash
+from finops_api.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+CACHE_INVALIDATION_CHANNEL = 'cache:invalidate'
+SHARED_CACHE_SCOPE = 'shared'
+_INSTANCE_ID = uuid4().hex
+
+_DATETIME_ROW_FIELDS = frozenset({'as_of', 'published_at', 'ts'})
 
 
 def stable_payload_hash(payload: dict[str, object]) -> str:
-    encoded = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
-    return hashlib.sha256(encoded).hexdigest()
+    return stable_hash(payload)
+
+
+def cache_scope(*, org_id: str, shared: bool) -> str:
+    return SHARED_CACHE_SCOPE if shared else org_id
 
 
 def provider_cache_key(*, org_id: str, provider: str, resource: str, payload_hash: str) -> str:
     return f'ingestion:{provider}:{resource}:{org_id}:{payload_hash}'
 
 
-async def get_cached_payload(redis_client: Any, key: str) -> dict[str, object] | None:
+def stale_refresh_guard_key(cache_key: str) -> str:
+    return f'swr:{cache_key}'
+
+
+def normalized_cache_key(
+    *,
+    org_id: str,
+    provider: str,
+    resource: str,
+    payload_hash: str,
+    normalization_version: str,
+) -> str:
+    return (
+        f'ingestion:normalized:{normalization_version}:'
+        f'{provider}:{resource}:{org_id}:{payload_hash}'
+    )
+
+
+type JsonDefault = Callable[[Any], Any] | None
+
+
+@dataclass(frozen=True, slots=True)
+class CacheCodec:
+    name: str
+    header: bytes
+    serialize: Callable[[object, JsonDefault], bytes]
+    deserialize: Callable[[bytes], Any]
+    compressed: bool
+
+
+def _json_serialize(value: object, default: JsonDefault) -> bytes:
+    return json.dumps(value, separators=(',', ':'), default=default).encode('utf-8')
+
+
+def _msgpack_serialize(value: object, default: JsonDefault) -> bytes:
+    import msgpack
+
+    return cast(bytes, msgpack.packb(value, default=default))
+
+
+def _msgpack_deserialize(data: bytes) -> Any:
+    import msgpack
+
+    return msgpack.unpackb(data, raw=False)
+
+
+_JSON_CODEC = CacheCodec('json', b'', _json_serialize, json.loads, compressed=False)
+_codecs_by_name: dict[str, CacheCodec] = {}
+_codecs_by_header: dict[bytes, CacheCodec] = {}
+
+
+def register_cache_codec(codec: CacheCodec) -> None:
+    _codecs_by_name[codec.name] = codec
+    if codec.header:
+        _codecs_by_header[codec.header] = codec
+
+
+def _encode_sized(value: object, *, default: JsonDefault = None) -> tuple[bytes, int]:
+    settings = get_settings()
+    codec = _codecs_by_name.get(settings.provider_cache_codec)
+    if codec is None:
+        raise ValueError(f'Unknown cache codec: {settings.provider_cache_codec}')
+    raw = codec.serialize(value, default)
+    body = raw
+    if codec.compressed:
+        body = zlib.compress(raw, settings.provider_cache_compression_level)
+    encoded = codec.header + body
+    metrics.inc('finops_cache_raw_bytes_total', {'codec': codec.name}, len(raw))
+    metrics.inc('finops_cache_encoded_bytes_total', {'codec': codec.name}, len(encoded))
+    return encoded, len(raw)
+
+
+def encode_cache_value(value: object, *, default: JsonDefault = None) -> bytes:
+    return _encode_sized(value, default=default)[0]
+
+
+def _decode_sized(data: bytes | str) -> tuple[Any, int]:
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    codec = _codecs_by_header.get(data[:1], _JSON_CODEC)
+    body = data[len(codec.header) :]
+    if codec.compressed:
+        body = zlib.decompress(body)
+    return codec.deserialize(body), len(body)
+
+
+def decode_cache_value(data: bytes | str) -> Any:
+    return _decode_sized(data)[0]
+
+
+register_cache_codec(_JSON_CODEC)
+register_cache_codec(CacheCodec('zlib', b'\x01', _json_serialize, json.loads, compressed=True))
+if find_spec('msgpack') is not None:
+    register_cache_codec(
+        CacheCodec('msgpack', b'\x02', _msgpack_serialize, _msgpack_deserialize, compressed=True)
+    )
+
+
+@dataclass(slots=True)
+class CachedEntry:
+    payload: dict[str, object]
+    ttl_seconds: float | None
+    cached_hash: str | None = field(default=None, repr=False)
+
+    @property
+    def content_hash(self) -> str:
+        if self.cached_hash is None:
+            self.cached_hash = stable_hash(self.payload)
+        return self.cached_hash
+
+    def is_stale(self, stale_window_seconds: float) -> bool:
+        return (
+            stale_window_seconds > 0
+            and self.ttl_seconds is not None
+            and self.ttl_seconds <= stale_window_seconds
+        )
+
+
+@dataclass(slots=True)
+class LocalCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class LocalCache:
+    def __init__(self, *, max_bytes: int, max_ttl_seconds: float) -> None:
+        self.max_bytes = max_bytes
+        self.max_ttl_seconds = max_ttl_seconds
+        self.stats = LocalCacheStats()
+        self._entries: OrderedDict[str, tuple[float, float, int, CachedEntry]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.max_ttl_seconds > 0
+
+    def get(self, key: str, *, now: float | None = None) -> dict[str, object] | None:
+        entry = self.get_entry(key, now=now)
+        return entry.payload if entry is not None else None
+
+    def get_entry(
+        self,
+        key: str,
+        *,
+        now: float | None = None,
+    ) -> CachedEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        current = now if now is not None else time.monotonic()
+        expires_at, source_expires_at, _, cached = entry
+        if expires_at <= current:
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        cached.ttl_seconds = source_expires_at - current
+        return cached
+
+    def set(
+        self,
+        key: str,
+        value: dict[str, object],
+        *,
+        size_bytes: int,
+        ttl_seconds: float,
+        now: float | None = None,
+    ) -> None:
+        self.put(
+            key,
+            CachedEntry(payload=value, ttl_seconds=ttl_seconds),
+            size_bytes=size_bytes,
+            now=now,
+        )
+
+    def put(
+        self,
+        key: str,
+        entry: CachedEntry,
+        *,
+        size_bytes: int,
+        now: float | None = None,
+    ) -> None:
+        ttl_seconds = entry.ttl_seconds or 0.0
+        ttl = min(ttl_seconds, self.max_ttl_seconds)
+        if not self.enabled or ttl <= 0 or size_bytes > self.max_bytes:
+            return
+        self._remove(key)
+        current = now if now is not None else time.monotonic()
+        self._entries[key] = (current + ttl, current + ttl_seconds, size_bytes, entry)
+        self.stats.bytes += size_bytes
+        self.stats.entries = len(self._entries)
+        while self.stats.bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        if self._remove(key):
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.stats.bytes = 0
+        self.stats.entries = 0
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.stats.bytes -= entry[2]
+        self.stats.entries = len(self._entries)
+        return True
+
+
+@lru_cache(maxsize=1)
+def get_local_cache() -> LocalCache:
+    settings = get_settings()
+    return LocalCache(
+        max_bytes=settings.provider_local_cache_max_bytes,
+        max_ttl_seconds=settings.provider_local_cache_max_ttl_seconds,
+    )
+
+
+async def get_cached_entry(
+    redis_client: Any,
+    key: str,
+    *,
+    with_ttl: bool = False,
+) -> CachedEntry | None:
+    local_cache = get_local_cache()
+    if local_cache.enabled:
+        local = local_cache.get_entry(key)
+        if local is not None:
+            return local
+
     raw = await redis_client.get(key)
     if raw is None:
         return None
-    if isinstance(raw, bytes):
-        raw = raw.decode('utf-8')
-    return cast(dict[str, object], json.loads(raw))
+    decoded, size_bytes = _decode_sized(raw)
+    entry = CachedEntry(payload=cast(dict[str, object], decoded), ttl_seconds=None)
+
+    if with_ttl or local_cache.enabled:
+        ttl_ms = await redis_client.pttl(key)
+        if ttl_ms is not None and ttl_ms > 0:
+            entry.ttl_seconds = ttl_ms / 1000
+    if local_cache.enabled and entry.ttl_seconds is not None:
+        local_cache.put(key, entry, size_bytes=size_bytes)
+    return entry
+
+
+async def get_cached_payload(redis_client: Any, key: str) -> dict[str, object] | None:
+    entry = await get_cached_entry(redis_client, key)
+    return entry.payload if entry is not None else None
 
 
 async def set_cached_payload(
@@ -30,4 +309,79 @@ async def set_cached_payload(
     payload: dict[str, object],
     ttl_seconds: int,
 ) -> None:
-    await redis_client.set(key, json.dumps(payload), ex=ttl_seconds)
+    encoded, size_bytes = _encode_sized(payload)
+    await redis_client.set(key, encoded, ex=ttl_seconds)
+    local_cache = get_local_cache()
+    if local_cache.enabled:
+        local_cache.set(key, payload, size_bytes=size_bytes, ttl_seconds=ttl_seconds)
+        await redis_client.publish(CACHE_INVALIDATION_CHANNEL, f'{_INSTANCE_ID} {key}')
+
+
+async def run_cache_invalidation_listener(redis_client: Any) -> None:
+    local_cache = get_local_cache()
+    pubsub = redis_client.pubsub()
+    await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+    try:
+        while True:
+            try:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except Exception:
+                logger.exception('cache_invalidation_listener_failed')
+                local_cache.clear()
+                await asyncio.sleep(1.0)
+                continue
+            if message is None:
+                continue
+            data = message['data']
+            if isinstance(data, bytes):
+                data = data.decode('utf-8')
+            sender, _, key = str(data).partition(' ')
+            if sender != _INSTANCE_ID:
+                local_cache.invalidate(key)
+    finally:
+        await pubsub.aclose()
+
+
+def _encode_row_value(value: object) -> object:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f'Unsupported normalized row value: {type(value).__name__}')
+
+
+def _decode_row(row: dict[str, object]) -> dict[str, object]:
+    for name in _DATETIME_ROW_FIELDS.intersection(row):
+        value = row[name]
+        if isinstance(value, str):
+            row[name] = datetime.fromisoformat(value)
+    return row
+
+
+async def get_cached_rows(
+    redis_client: Any,
+    key: str,
+    *,
+    content_hash: str,
+) -> list[dict[str, object]] | None:
+    raw = await redis_client.get(key)
+    if raw is None:
+        return None
+    entry = cast(dict[str, Any], decode_cache_value(raw))
+    if entry.get('content_hash') != content_hash:
+        return None
+    return [_decode_row(row) for row in entry['rows']]
+
+
+async def set_cached_rows(
+    redis_client: Any,
+    *,
+    key: str,
+    content_hash: str,
+    rows: list[dict[str, object]],
+    ttl_seconds: int,
+) -> None:
+    entry = {'content_hash': content_hash, 'rows': rows}
+    await redis_client.set(
+        key,
+        encode_cache_value(entry, default=_encode_row_value),
+        ex=ttl_seconds,
+    )
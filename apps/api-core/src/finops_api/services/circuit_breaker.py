@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from finops_api.config import get_settings
+from finops_api.providers.base import ProviderError
+
+
+def circuit_keys(provider: str) -> tuple[str, str, str]:
+    prefix = f'circuit:{provider}'
+    return f'{prefix}:failures', f'{prefix}:open', f'{prefix}:probe'
+
+
+def is_provider_failure(exc: BaseException) -> bool:
+    if not isinstance(exc, ProviderError) or exc.circuit_open:
+        return False
+    if exc.code == 'provider_retries_exhausted':
+        cause = exc.__cause__
+        return isinstance(cause, ProviderError) and cause.retryable
+    return exc.retryable
+
+
+def _circuit_open_error(provider: str, retry_after_seconds: float) -> ProviderError:
+    return ProviderError(
+        f'Circuit open for provider {provider}',
+        code='provider_circuit_open',
+        provider=provider,
+        retryable=True,
+        retry_after_seconds=retry_after_seconds,
+    )
+
+
+async def acquire_circuit(
+    redis_client: Any,
+    *,
+    provider: str,
+    failure_threshold: int,
+    open_seconds: int,
+) -> bool:
+    failures_key, open_key, probe_key = circuit_keys(provider)
+    open_ttl = await redis_client.ttl(open_key)
+    if open_ttl is not None and open_ttl > 0:
+        raise _circuit_open_error(provider, float(open_ttl))
+
+    failures = int(await redis_client.get(failures_key) or 0)
+    if failures < failure_threshold:
+        return False
+    if not await redis_client.set(probe_key, '1', nx=True, ex=open_seconds):
+        raise _circuit_open_error(provider, float(open_seconds))
+    return True
+
+
+async def release_circuit_probe(redis_client: Any, *, provider: str) -> None:
+    _, _, probe_key = circuit_keys(provider)
+    await redis_client.delete(probe_key)
+
+
+async def record_circuit_success(redis_client: Any, *, provider: str) -> None:
+    failures_key, _, probe_key = circuit_keys(provider)
+    await redis_client.delete(failures_key, probe_key)
+
+
+async def record_circuit_failure(
+    redis_client: Any,
+    *,
+    provider: str,
+    failure_threshold: int,
+    window_seconds: int,
+    open_seconds: int,
+) -> None:
+    failures_key, open_key, probe_key = circuit_keys(provider)
+    failures = int(await redis_client.incr(failures_key))
+    if failures < failure_threshold:
+        await redis_client.expire(failures_key, window_seconds)
+        return
+    await redis_client.set(open_key, '1', ex=open_seconds)
+    await redis_client.expire(failures_key, open_seconds + window_seconds)
+    await redis_client.delete(probe_key)
+
+
+async def call_with_circuit[T](
+    redis_client: Any,
+    *,
+    provider: str,
+    call: Callable[[], Awaitable[T]],
+    before_call: Callable[[], Awaitable[None]] | None = None,
+) -> T:
+    settings = get_settings()
+    probing = await acquire_circuit(
+        redis_client,
+        provider=provider,
+        failure_threshold=settings.provider_circuit_failure_threshold,
+        open_seconds=settings.provider_circuit_open_seconds,
+    )
+    try:
+        if before_call is not None:
+            await before_call()
+        try:
+            result = await call()
+        except Exception as exc:
+            if is_provider_failure(exc):
+                await record_circuit_failure(
+                    redis_client,
+                    provider=provider,
+                    failure_threshold=settings.provider_circuit_failure_threshold,
+                    window_seconds=settings.provider_circuit_window_seconds,
+                    open_seconds=settings.provider_circuit_open_seconds,
+                )
+            raise
+        await record_circuit_success(redis_client, provider=provider)
+        return result
+    finally:
+        if probing:
+            await release_circuit_probe(redis_client, provider=provider)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from finops_api.config import get_settings
+from finops_api.providers.base import ProviderError
+
+COALESCED_QUOTES_KEY = '_coalesced_quotes'
+MAX_COALESCED_SYMBOLS = 1000
+
+
+def split_quote_batch(payload: dict[str, object]) -> dict[str, dict[str, object]]:
+    quotes = payload.get('quotes')
+    if not isinstance(quotes, list):
+        return {}
+    return {
+        str(entry['symbol']).upper(): entry
+        for entry in quotes
+        if isinstance(entry, dict) and entry.get('symbol')
+    }
+
+
+def coalesced_quote_payload(entry: dict[str, object]) -> dict[str, object]:
+    return {'quotes': [entry], COALESCED_QUOTES_KEY: True}
+
+
+@dataclass(slots=True)
+class CoalescedBatch:
+    payload: dict[str, object]
+    rejected: dict[tuple[str, str], BaseException] = field(default_factory=dict)
+
+
+type QuoteBatchFetch = Callable[[dict[str, list[str]]], Awaitable[CoalescedBatch]]
+
+
+@dataclass(slots=True)
+class _PendingBatch:
+    fetch_batch: QuoteBatchFetch
+    max_symbols: int
+    waiters: dict[tuple[str, str], asyncio.Future[dict[str, object]]] = field(
+        default_factory=dict
+    )
+    symbols: set[str] = field(default_factory=set)
+    timer: asyncio.TimerHandle | None = None
+
+    def symbols_by_tenant(self) -> dict[str, list[str]]:
+        grouped: dict[str, list[str]] = {}
+        for tenant, symbol in self.waiters:
+            grouped.setdefault(tenant, []).append(symbol)
+        return {tenant: sorted(symbols) for tenant, symbols in grouped.items()}
+
+
+class QuoteCoalescer:
+    def __init__(self, *, window_seconds: float, max_symbols: int = MAX_COALESCED_SYMBOLS) -> None:
+        self.window_seconds = window_seconds
+        self.max_symbols = max_symbols
+        self._pending: dict[str, _PendingBatch] = {}
+        self._running: set[asyncio.Task[None]] = set()
+
+    async def fetch(
+        self,
+        provider: str,
+        symbol: str,
+        fetch_batch: QuoteBatchFetch,
+        *,
+        tenant: str,
+        max_symbols: int | None = None,
+    ) -> dict[str, object]:
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(provider)
+        if batch is None:
+            limit = self.max_symbols if max_symbols is None else min(self.max_symbols, max_symbols)
+            batch = _PendingBatch(fetch_batch, max(1, limit))
+            self._pending[provider] = batch
+            batch.timer = loop.call_later(self.window_seconds, self._flush, provider, batch)
+        waiter = batch.waiters.get((tenant, symbol))
+        if waiter is None:
+            waiter = loop.create_future()
+            batch.waiters[(tenant, symbol)] = waiter
+            batch.symbols.add(symbol)
+            if len(batch.symbols) >= batch.max_symbols:
+                self._flush(provider, batch)
+        return await asyncio.shield(waiter)
+
+    def _flush(self, provider: str, batch: _PendingBatch) -> None:
+        if self._pending.get(provider) is batch:
+            del self._pending[provider]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.ensure_future(self._run(provider, batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, provider: str, batch: _PendingBatch) -> None:
+        try:
+            result = await batch.fetch_batch(batch.symbols_by_tenant())
+        except Exception as exc:
+            for waiter in batch.waiters.values():
+                if not waiter.done():
+                    waiter.set_exception(exc)
+            return
+
+        entries = split_quote_batch(result.payload)
+        errors = result.payload.get('errors')
+        for key, waiter in batch.waiters.items():
+            if waiter.done():
+                continue
+            rejected = result.rejected.get(key)
+            if rejected is not None:
+                waiter.set_exception(rejected)
+                continue
+            symbol = key[1]
+            entry = entries.get(symbol)
+            if entry is not None:
+                waiter.set_result(entry)
+                continue
+            reason = errors.get(symbol) if isinstance(errors, dict) else None
+            waiter.set_exception(
+                ProviderError(
+                    f'No quote returned for {symbol}: {reason or "missing from batch"}',
+                    code='provider_request_failed',
+                    provider=provider,
+                    retryable=False,
+                )
+            )
+
+
+@lru_cache(maxsize=1)
+def get_quote_coalescer() -> QuoteCoalescer:
+    return QuoteCoalescer(window_seconds=get_settings().quote_coalesce_window_seconds)
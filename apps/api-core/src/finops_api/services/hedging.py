@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+HEDGE_PROVIDER_KEY = '_hedge_provider'
+
+
+def hedge_search_payload(request_payload: dict[str, object]) -> dict[str, object]:
+    query = request_payload.get('query', request_payload.get('q'))
+    limit = request_payload.get('max_results', request_payload.get('num'))
+    payload: dict[str, object] = {'query': query, 'q': query}
+    if limit is not None:
+        payload['max_results'] = limit
+        payload['num'] = limit
+    return payload
+
+
+async def hedged_first[T](
+    primary: Callable[[], Awaitable[T]],
+    secondary: Callable[[], Awaitable[T]],
+    *,
+    hedge_after_seconds: float,
+) -> tuple[T, int]:
+    tasks: list[asyncio.Task[T]] = [asyncio.ensure_future(primary())]
+    pending: set[asyncio.Task[T]] = set(tasks)
+    errors: list[BaseException] = []
+    try:
+        while pending:
+            timeout = hedge_after_seconds if len(tasks) == 1 else None
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    return task.result(), tasks.index(task)
+                errors.append(error)
+            if len(tasks) == 1:
+                hedge = asyncio.ensure_future(secondary())
+                tasks.append(hedge)
+                pending.add(hedge)
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    raise errors[0]
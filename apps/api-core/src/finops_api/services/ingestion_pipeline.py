@@ -1,156 +1,794 @@
 from __future__ import annotations
 
+import math
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from datetime import UTC, datetime
-from typing import Any
+from functools import partial
+from typing import Any, cast
 from uuid import UUID
 
 from sqlalchemy import text
 
 from finops_api.config import get_settings
 from finops_api.db import SessionLocal
-from finops_api.models import NewsDocument
-from finops_api.providers.alphavantage.dto import (
-    AlphaVantageQuoteResponse,
-    AlphaVantageTimeseriesResponse,
+from finops_api.metrics import FetchStats, flush_metrics, measure_fetch, observe_cache_lookup
+from finops_api.models import IngestionJob, NewsDocument
+from finops_api.providers.base import ProviderError, ProviderResponse, canonical_request_fields
+from finops_api.providers.registry import (
+    canonical_request_payload,
+    get_market_data_provider,
+    get_provider_registration,
+    get_search_provider,
+    is_shared_resource,
+    provider_rate_limit_per_minute,
 )
-from finops_api.providers.alphavantage.mapper import (
-    to_canonical_quote as alphavantage_to_canonical_quote,
-)
-from finops_api.providers.alphavantage.mapper import (
-    to_canonical_timeseries as alphavantage_to_canonical_timeseries,
-)
-from finops_api.providers.base import ProviderError, ProviderResponse
-from finops_api.providers.registry import get_market_data_provider, get_search_provider
-from finops_api.providers.serpapi.dto import SerpApiSearchResponse
-from finops_api.providers.serpapi.mapper import (
-    to_canonical_news_item as serpapi_to_canonical_news_item,
-)
-from finops_api.providers.serper.dto import SerperNewsResponse
-from finops_api.providers.serper.mapper import (
-    to_canonical_news_item as serper_to_canonical_news_item,
-)
-from finops_api.providers.tavily.dto import TavilySearchResponse
-from finops_api.providers.tavily.mapper import (
-    to_canonical_news_item as tavily_to_canonical_news_item,
-)
-from finops_api.providers.twelvedata.dto import (
-    TwelveDataQuoteResponse,
-    TwelveDataTimeseriesResponse,
-)
-from finops_api.providers.twelvedata.mapper import to_canonical_quote, to_canonical_timeseries
 from finops_api.repositories.ingestion import IngestionRepository
 from finops_api.repositories.ingestion_raw_payloads import IngestionRawPayloadRepository
 from finops_api.repositories.market import MarketRepository
 from finops_api.repositories.news_documents import NewsDocumentRepository
 from finops_api.services.cache import (
-    get_cached_payload,
+    cache_scope,
+    get_cached_entry,
+    get_cached_rows,
+    normalized_cache_key,
     provider_cache_key,
-    set_cached_payload,
+    set_cached_rows,
     stable_payload_hash,
+    stale_refresh_guard_key,
+)
+from finops_api.services.circuit_breaker import call_with_circuit
+from finops_api.services.coalescer import (
+    COALESCED_QUOTES_KEY,
+    CoalescedBatch,
+    coalesced_quote_payload,
+    get_quote_coalescer,
+)
+from finops_api.services.hedging import HEDGE_PROVIDER_KEY, hedge_search_payload, hedged_first
+from finops_api.services.latency import provider_latency
+from finops_api.services.queue import enqueue_cache_refresh
+from finops_api.services.rate_limit import (
+    TokenRequestTooLargeError,
+    acquire_provider_tokens,
+    provider_tenant_share,
+    token_bucket_capacity,
 )
-from finops_api.services.rate_limit import take_provider_token
+from finops_api.services.semaphore import provider_slot
+from finops_api.services.single_flight import fetch_once, refresh_once
 
+NORMALIZATION_VERSION = 'v1'
 
-def _provider_rate_limit_per_minute(provider: str) -> int:
-    settings = get_settings()
-    if provider == 'tavily':
-        return settings.tavily_rate_limit_per_minute
-    if provider == 'serper':
-        return settings.serper_rate_limit_per_minute
-    if provider == 'serpapi':
-        return settings.serpapi_rate_limit_per_minute
-    if provider == 'twelvedata':
-        return settings.twelvedata_rate_limit_per_minute
-    if provider == 'alphavantage':
-        return settings.alphavantage_rate_limit_per_minute
-    return 0
+
+def _unsupported(provider: str, what: str) -> ProviderError:
+    return ProviderError(
+        f'Unsupported provider for {what}: {provider}',
+        code='provider_unsupported',
+        provider=provider,
+        retryable=False,
+    )
 
 
-def _build_documents(
+def _timeseries_rows(
     *,
+    provider: str,
+    payload: dict[str, object],
+    request_payload: dict[str, object],
+) -> Iterator[dict[str, object]]:
+    registration = get_provider_registration(provider)
+    if registration.normalize_timeseries is None:
+        raise _unsupported(provider, 'timeseries')
+    return iter(registration.normalize_timeseries(payload, request_payload=request_payload))
+
+
+def _normalize_rows(
+    *,
+    resource: str,
+    provider: str,
+    payload: dict[str, object],
+    request_payload: dict[str, object],
+) -> list[dict[str, object]]:
+    registration = get_provider_registration(provider)
+    if resource == 'news_search':
+        if registration.normalize_news is None:
+            raise _unsupported(provider, 'normalization')
+        return [
+            {
+                'source_provider': item.source_provider,
+                'source_url': item.source_url,
+                'title': item.title,
+                'snippet': item.snippet,
+                'author': item.author,
+                'language': item.language,
+                'published_at': item.published_at,
+                'document_hash': item.document_hash,
+            }
+            for item in registration.normalize_news(payload)
+        ]
+    if resource == 'market_timeseries_backfill':
+        return list(
+            _timeseries_rows(provider=provider, payload=payload, request_payload=request_payload)
+        )
+    if resource == 'market_quote_refresh':
+        if registration.normalize_quote is None:
+            raise _unsupported(provider, 'quote')
+        if payload.get(COALESCED_QUOTES_KEY) and registration.normalize_quote_batch is not None:
+            quotes = list(registration.normalize_quote_batch(payload))
+        else:
+            quotes = [registration.normalize_quote(payload)]
+    elif resource == 'market_quote_batch_refresh':
+        if registration.normalize_quote_batch is None:
+            raise _unsupported(provider, 'batch quotes')
+        quotes = list(registration.normalize_quote_batch(payload))
+    else:
+        return []
+    return [
+        {
+            'symbol': quote.symbol,
+            'price': quote.price,
+            'change_percent': quote.change_percent,
+            'as_of': quote.as_of,
+        }
+        for quote in quotes
+    ]
+
+
+async def _store_rows(
+    *,
+    job: IngestionJob,
     org_id: UUID,
-    job_id: UUID,
     raw_payload_id: UUID,
+    rows: Iterable[dict[str, object]],
+    news_repo: NewsDocumentRepository,
+    market_repo: MarketRepository,
+) -> int:
+    if job.resource == 'news_search':
+        documents = [
+            NewsDocument(
+                org_id=org_id,
+                job_id=job.id,
+                raw_payload_id=raw_payload_id,
+                normalization_version=NORMALIZATION_VERSION,
+                created_at=datetime.now(UTC),
+                **row,
+            )
+            for row in rows
+        ]
+        if documents:
+            await news_repo.create_many(documents)
+        return len(documents)
+    if job.resource == 'market_timeseries_backfill':
+        return await market_repo.upsert_timeseries_rows(
+            org_id=org_id,
+            provider=job.provider,
+            schema_version=NORMALIZATION_VERSION,
+            raw_payload_id=raw_payload_id,
+            rows=rows,
+            chunk_size=get_settings().market_upsert_chunk_size,
+        )
+    if job.resource in {'market_quote_refresh', 'market_quote_batch_refresh'}:
+        return await market_repo.upsert_quotes(
+            org_id=org_id,
+            provider=job.provider,
+            schema_version=NORMALIZATION_VERSION,
+            raw_payload_id=raw_payload_id,
+            rows=list(rows),
+        )
+    return 0
+
+
+async def _resolve_request_payload(
+    *,
+    job: IngestionJob,
+    org_id: UUID,
+    market_repo: MarketRepository,
+) -> dict[str, object]:
+    if job.resource != 'market_timeseries_backfill' or not job.payload.get('incremental'):
+        return job.payload
+
+    last_ts = await market_repo.get_latest_timeseries_ts(
+        org_id=org_id,
+        provider=job.provider,
+        symbol=str(job.payload.get('symbol', '')),
+        timeframe=str(job.payload.get('interval', '1day')),
+    )
+    if last_ts is None:
+        return job.payload
+    return {
+        **job.payload,
+        'start_date': last_ts.astimezone(UTC).strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
+
+def provider_request_count(provider: str, resource: str, request_payload: dict[str, object]) -> int:
+    if resource == 'market_quote_batch_refresh':
+        return get_market_data_provider(provider).quote_batch_request_count(request_payload)
+    if resource == 'market_timeseries_backfill':
+        return get_market_data_provider(provider).timeseries_request_count(request_payload)
+    return 1
+
+
+def _tenant_share(provider: str, org_id: UUID) -> float:
+    settings = get_settings()
+    return provider_tenant_share(
+        settings.rate_limit_tenant_shares,
+        provider=provider,
+        org_id=str(org_id),
+        default=settings.rate_limit_default_tenant_share,
+    )
+
+
+def provider_token_capacity(provider: str, *, org_id: UUID) -> int:
+    return token_bucket_capacity(
+        limit_per_minute=provider_rate_limit_per_minute(provider),
+        tenant_share=_tenant_share(provider, org_id),
+        borrow_reserve_fraction=get_settings().rate_limit_borrow_reserve_fraction,
+    )
+
+
+async def _take_provider_tokens(
+    redis_client: Any,
+    *,
     provider: str,
-    cached_payload: dict[str, object],
-) -> list[NewsDocument]:
-    documents: list[NewsDocument] = []
-
-    if provider == 'tavily':
-        tavily_response = TavilySearchResponse.model_validate(cached_payload)
-        for tavily_item in tavily_response.results:
-            normalized_tavily = tavily_to_canonical_news_item(tavily_item)
-            documents.append(
-                NewsDocument(
-                    org_id=org_id,
-                    job_id=job_id,
-                    raw_payload_id=raw_payload_id,
-                    source_provider=normalized_tavily.source_provider,
-                    normalization_version='v1',
-                    source_url=normalized_tavily.source_url,
-                    title=normalized_tavily.title,
-                    snippet=normalized_tavily.snippet,
-                    author=normalized_tavily.author,
-                    language=normalized_tavily.language,
-                    published_at=normalized_tavily.published_at,
-                    document_hash=normalized_tavily.document_hash,
-                    created_at=datetime.now(UTC),
-                )
+    org_id: UUID,
+    count: int,
+) -> None:
+    try:
+        allowed, wait_seconds = await acquire_provider_tokens(
+            redis_client,
+            provider=provider,
+            org_id=str(org_id),
+            limit_per_minute=provider_rate_limit_per_minute(provider),
+            tokens=count,
+            tenant_share=_tenant_share(provider, org_id),
+            borrow_reserve_fraction=get_settings().rate_limit_borrow_reserve_fraction,
+        )
+    except TokenRequestTooLargeError as exc:
+        raise ProviderError(
+            str(exc),
+            code='provider_request_too_large',
+            provider=provider,
+            retryable=False,
+        ) from exc
+    if not allowed:
+        raise ProviderError(
+            f'Provider rate limit exceeded for {provider}',
+            code='provider_rate_limited',
+            provider=provider,
+            retryable=True,
+            retry_after_seconds=None if math.isinf(wait_seconds) else wait_seconds,
+        )
+
+
+async def _call_provider[T](
+    redis_client: Any,
+    *,
+    provider: str,
+    org_id: UUID,
+    tokens: int,
+    call: Callable[[], Awaitable[T]],
+) -> T:
+    return await _call_charged_provider(
+        redis_client,
+        provider=provider,
+        charge=partial(
+            _take_provider_tokens,
+            redis_client,
+            provider=provider,
+            org_id=org_id,
+            count=tokens,
+        ),
+        call=call,
+    )
+
+
+async def _call_charged_provider[T](
+    redis_client: Any,
+    *,
+    provider: str,
+    charge: Callable[[], Awaitable[None]],
+    call: Callable[[], Awaitable[T]],
+) -> T:
+    settings = get_settings()
+    async with provider_slot(
+        redis_client,
+        provider=provider,
+        limit=settings.provider_concurrency_limit_overrides.get(
+            provider,
+            settings.provider_concurrency_limit,
+        ),
+        lease_seconds=settings.provider_concurrency_lease_seconds,
+        wait_seconds=settings.provider_concurrency_wait_seconds,
+        poll_interval_seconds=settings.provider_concurrency_poll_seconds,
+    ):
+        return await call_with_circuit(
+            redis_client,
+            provider=provider,
+            call=call,
+            before_call=charge,
+        )
+
+
+async def _search_news(
+    provider: str,
+    *,
+    redis_client: Any,
+    idempotency_key: str,
+    request_payload: dict[str, object],
+    org_id: UUID,
+) -> dict[str, object]:
+    started = time.monotonic()
+    response = await _call_provider(
+        redis_client,
+        provider=provider,
+        org_id=org_id,
+        tokens=provider_request_count(provider, 'news_search', request_payload),
+        call=partial(
+            get_search_provider(provider).search_news,
+            idempotency_key=idempotency_key,
+            request_payload=request_payload,
+        ),
+    )
+    provider_latency.observe(provider, time.monotonic() - started)
+    return response.payload
+
+
+async def _hedged_search_news(
+    *,
+    provider: str,
+    idempotency_key: str,
+    hedge_provider: str,
+    request_payload: dict[str, object],
+    org_id: UUID,
+    redis_client: Any,
+) -> dict[str, object]:
+    settings = get_settings()
+    hedge_after = provider_latency.percentile(
+        provider,
+        0.95,
+        min_samples=settings.news_search_hedge_min_samples,
+    )
+    payload, winner = await hedged_first(
+        partial(
+            _search_news,
+            provider,
+            redis_client=redis_client,
+            idempotency_key=idempotency_key,
+            request_payload=request_payload,
+            org_id=org_id,
+        ),
+        partial(
+            _search_news,
+            hedge_provider,
+            redis_client=redis_client,
+            idempotency_key=idempotency_key,
+            request_payload=hedge_search_payload(request_payload),
+            org_id=org_id,
+        ),
+        hedge_after_seconds=(
+            hedge_after
+            if hedge_after is not None
+            else settings.news_search_hedge_default_delay_seconds
+        ),
+    )
+    if winner == 0:
+        return payload
+    return {**payload, HEDGE_PROVIDER_KEY: hedge_provider}
+
+
+def _coalesces_quotes(provider: str) -> bool:
+    if get_settings().quote_coalesce_window_seconds <= 0:
+        return False
+    if not is_shared_resource(provider, 'market_quote_refresh'):
+        return False
+    registration = get_provider_registration(provider)
+    return (
+        registration.supports_batch_quotes
+        and registration.normalize_quote_batch is not None
+        and 'market_quote_refresh' in registration.request_models
+    )
+
+
+async def _fetch_coalesced_quotes(
+    symbols_by_org: dict[str, list[str]],
+    *,
+    provider: str,
+    redis_client: Any,
+) -> CoalescedBatch:
+    accepted: set[str] = set()
+    rejected: dict[tuple[str, str], BaseException] = {}
+
+    async def charge_orgs() -> None:
+        for org, symbols in symbols_by_org.items():
+            org_id = UUID(org)
+            unpaid = [symbol for symbol in symbols if symbol not in accepted]
+            if not unpaid:
+                continue
+            for chunk_payload in split_quote_batch_payload(
+                provider,
+                {'symbols': unpaid},
+                org_id=org_id,
+            ):
+                chunk = [str(symbol) for symbol in cast(list[object], chunk_payload['symbols'])]
+                try:
+                    await _take_provider_tokens(
+                        redis_client,
+                        provider=provider,
+                        org_id=org_id,
+                        count=provider_request_count(
+                            provider,
+                            'market_quote_batch_refresh',
+                            chunk_payload,
+                        ),
+                    )
+                except ProviderError as exc:
+                    rejected.update({(org, symbol): exc for symbol in chunk})
+                else:
+                    accepted.update(chunk)
+        if not accepted:
+            raise next(iter(rejected.values()))
+
+    async def fetch_accepted() -> ProviderResponse:
+        batch_payload: dict[str, object] = {'symbols': sorted(accepted)}
+        return await get_market_data_provider(provider).get_quote_batch(
+            idempotency_key=f'coalesced:{stable_payload_hash(batch_payload)}',
+            request_payload=batch_payload,
+        )
+
+    try:
+        response = await _call_charged_provider(
+            redis_client,
+            provider=provider,
+            charge=charge_orgs,
+            call=fetch_accepted,
+        )
+    except ProviderError:
+        if accepted or not rejected:
+            raise
+        return CoalescedBatch(payload={}, rejected=rejected)
+    return CoalescedBatch(
+        payload=response.payload,
+        rejected={key: exc for key, exc in rejected.items() if key[1] not in accepted},
+    )
+
+
+async def _coalesced_quote(
+    *,
+    provider: str,
+    request_payload: dict[str, object],
+    org_id: UUID,
+    redis_client: Any,
+) -> dict[str, object]:
+    request_model = get_provider_registration(provider).request_models['market_quote_refresh']
+    request = request_model.model_validate(request_payload)
+    symbol = str(canonical_request_fields(request.model_dump(mode='json'))['symbol'])
+    entry = await get_quote_coalescer().fetch(
+        provider,
+        symbol,
+        partial(_fetch_coalesced_quotes, provider=provider, redis_client=redis_client),
+        tenant=str(org_id),
+        max_symbols=token_bucket_capacity(limit_per_minute=provider_rate_limit_per_minute(provider)),
+    )
+    return coalesced_quote_payload(entry)
+
+
+async def _fetch_provider_payload(
+    *,
+    provider: str,
+    resource: str,
+    idempotency_key: str,
+    request_payload: dict[str, object],
+    org_id: UUID,
+    redis_client: Any,
+) -> dict[str, object]:
+    if resource == 'market_quote_refresh' and _coalesces_quotes(provider):
+        return await _coalesced_quote(
+            provider=provider,
+            request_payload=request_payload,
+            org_id=org_id,
+            redis_client=redis_client,
+        )
+
+    if resource == 'news_search':
+        hedge_provider = get_settings().news_search_hedge_providers.get(provider)
+        if hedge_provider and hedge_provider != provider:
+            return await _hedged_search_news(
+                provider=provider,
+                idempotency_key=idempotency_key,
+                hedge_provider=hedge_provider,
+                request_payload=request_payload,
+                org_id=org_id,
+                redis_client=redis_client,
             )
-        return documents
-
-    if provider == 'serper':
-        serper_response = SerperNewsResponse.model_validate(cached_payload)
-        for serper_item in serper_response.news:
-            normalized_serper = serper_to_canonical_news_item(serper_item)
-            documents.append(
-                NewsDocument(
+        return await _search_news(
+            provider,
+            redis_client=redis_client,
+            idempotency_key=idempotency_key,
+            request_payload=request_payload,
+            org_id=org_id,
+        )
+    market_adapter = get_market_data_provider(provider)
+    if resource == 'market_timeseries_backfill':
+        market_call = market_adapter.get_timeseries
+    elif resource == 'market_quote_refresh':
+        market_call = market_adapter.get_quote
+    elif resource == 'market_quote_batch_refresh':
+        market_call = market_adapter.get_quote_batch
+    else:
+        raise ProviderError(
+            f'Unsupported ingestion resource: {resource}',
+            code='resource_unsupported',
+            provider=provider,
+            retryable=False,
+        )
+    provider_response = await _call_provider(
+        redis_client,
+        provider=provider,
+        org_id=org_id,
+        tokens=provider_request_count(provider, resource, request_payload),
+        call=partial(
+            market_call,
+            idempotency_key=idempotency_key,
+            request_payload=request_payload,
+        ),
+    )
+    return provider_response.payload
+
+
+_THROTTLE_CODES = frozenset(
+    {'provider_rate_limited', 'provider_concurrency_limited', 'provider_fetch_in_flight'}
+)
+
+_THROTTLE_HTTP_STATUSES = frozenset({429, 503})
+
+
+def _is_throttled(exc: ProviderError) -> bool:
+    if exc.code in _THROTTLE_CODES or exc.circuit_open:
+        return True
+    return (
+        exc.code == 'provider_retries_exhausted'
+        and exc.http_status in _THROTTLE_HTTP_STATUSES
+    )
+
+
+def _throttle_delay(exc: ProviderError) -> float | None:
+    if not _is_throttled(exc):
+        return None
+    if exc.retry_after_seconds is None:
+        return None
+    return max(exc.retry_after_seconds, 0.001)
+
+
+def _cache_hard_ttl_seconds() -> int:
+    settings = get_settings()
+    return settings.provider_cache_ttl_seconds + max(settings.provider_cache_stale_ttl_seconds, 0)
+
+
+async def _schedule_stale_refresh(
+    redis_client: Any,
+    *,
+    cache_key: str,
+    provider: str,
+    resource: str,
+    idempotency_key: str,
+    org_id: UUID,
+    request_payload: dict[str, object],
+) -> bool:
+    if not await redis_client.set(
+        stale_refresh_guard_key(cache_key),
+        '1',
+        nx=True,
+        ex=get_settings().provider_single_flight_lock_seconds,
+    ):
+        return False
+    await enqueue_cache_refresh(
+        redis_client,
+        {
+            'cache_key': cache_key,
+            'provider': provider,
+            'resource': resource,
+            'idempotency_key': idempotency_key,
+            'org_id': str(org_id),
+            'request_payload': request_payload,
+        },
+    )
+    return True
+
+
+async def refresh_provider_payload(
+    *,
+    cache_key: str,
+    provider: str,
+    resource: str,
+    idempotency_key: str,
+    org_id: UUID,
+    request_payload: dict[str, object],
+    redis_client: Any,
+) -> bool:
+    try:
+        return await refresh_once(
+            redis_client,
+            cache_key=cache_key,
+            fetch=partial(
+                _fetch_provider_payload,
+                provider=provider,
+                resource=resource,
+                idempotency_key=idempotency_key,
+                request_payload=request_payload,
+                org_id=org_id,
+                redis_client=redis_client,
+            ),
+            cache_ttl_seconds=_cache_hard_ttl_seconds(),
+            lock_ttl_seconds=get_settings().provider_single_flight_lock_seconds,
+        )
+    finally:
+        await flush_metrics(redis_client)
+
+
+def split_quote_batch_payload(
+    provider: str,
+    request_payload: dict[str, object],
+    *,
+    org_id: UUID,
+) -> list[dict[str, object]]:
+    return get_market_data_provider(provider).split_quote_batch_request(
+        request_payload,
+        max_requests=provider_token_capacity(provider, org_id=org_id),
+    )
+
+
+def _request_windows(
+    job: IngestionJob,
+    request_payload: dict[str, object],
+    *,
+    org_id: UUID,
+) -> list[dict[str, object]]:
+    if job.resource == 'market_timeseries_backfill':
+        return get_market_data_provider(job.provider).split_timeseries_request(request_payload)
+    if job.resource == 'market_quote_batch_refresh':
+        return split_quote_batch_payload(job.provider, request_payload, org_id=org_id)
+    return [request_payload]
+
+
+async def _ingest_request(
+    *,
+    job: IngestionJob,
+    org_id: UUID,
+    request_payload: dict[str, object],
+    redis_client: Any,
+    raw_repo: IngestionRawPayloadRepository,
+    news_repo: NewsDocumentRepository,
+    market_repo: MarketRepository,
+) -> tuple[int, bool]:
+    settings = get_settings()
+    payload_hash = stable_payload_hash(
+        canonical_request_payload(job.provider, job.resource, request_payload)
+    )
+    scope = cache_scope(
+        org_id=str(org_id),
+        shared=is_shared_resource(job.provider, job.resource),
+    )
+    cache_key = provider_cache_key(
+        org_id=scope,
+        provider=job.provider,
+        resource=job.resource,
+        payload_hash=payload_hash,
+    )
+
+    fetch_stats = FetchStats()
+    stale_window = settings.provider_cache_stale_ttl_seconds
+    cached_entry = await get_cached_entry(
+        redis_client,
+        cache_key,
+        with_ttl=stale_window > 0,
+    )
+    cached_payload = cached_entry.payload if cached_entry is not None else None
+    cache_hit = cached_entry is not None
+    stale = cached_entry is not None and cached_entry.is_stale(stale_window)
+    if stale:
+        await _schedule_stale_refresh(
+            redis_client,
+            cache_key=cache_key,
+            provider=job.provider,
+            resource=job.resource,
+            idempotency_key=job.idempotency_key,
+            org_id=org_id,
+            request_payload=request_payload,
+        )
+
+    if cached_payload is None:
+        cached_payload, cache_hit = await fetch_once(
+            redis_client,
+            cache_key=cache_key,
+            fetch=partial(
+                measure_fetch,
+                fetch_stats,
+                partial(
+                    _fetch_provider_payload,
+                    provider=job.provider,
+                    resource=job.resource,
+                    idempotency_key=job.idempotency_key,
+                    request_payload=request_payload,
                     org_id=org_id,
-                    job_id=job_id,
-                    raw_payload_id=raw_payload_id,
-                    source_provider=normalized_serper.source_provider,
-                    normalization_version='v1',
-                    source_url=normalized_serper.source_url,
-                    title=normalized_serper.title,
-                    snippet=normalized_serper.snippet,
-                    author=normalized_serper.author,
-                    language=normalized_serper.language,
-                    published_at=normalized_serper.published_at,
-                    document_hash=normalized_serper.document_hash,
-                    created_at=datetime.now(UTC),
-                )
+                    redis_client=redis_client,
+                ),
+            ),
+            cache_ttl_seconds=_cache_hard_ttl_seconds(),
+            lock_ttl_seconds=settings.provider_single_flight_lock_seconds,
+            wait_timeout_seconds=settings.provider_single_flight_wait_seconds,
+            poll_interval_seconds=settings.provider_single_flight_poll_seconds,
+        )
+
+    observe_cache_lookup(
+        provider=job.provider,
+        resource=job.resource,
+        hit=cache_hit,
+        stale=stale,
+    )
+    source_provider = str(cached_payload.get(HEDGE_PROVIDER_KEY, job.provider))
+    raw_payload_hash = (
+        cached_entry.content_hash
+        if cached_entry is not None
+        else stable_payload_hash(cached_payload)
+    )
+    raw_payload = await raw_repo.create(
+        org_id=org_id,
+        job_id=job.id,
+        provider=source_provider,
+        resource=job.resource,
+        content_hash=raw_payload_hash,
+        request_payload=request_payload,
+        response_payload=cached_payload,
+        http_status=200,
+        provider_request_id=None,
+        fetch_latency_ms=fetch_stats.fetch_latency_ms,
+        response_bytes=fetch_stats.response_bytes,
+    )
+
+    rows: Iterable[dict[str, object]]
+    if job.resource == 'market_timeseries_backfill':
+        rows = _timeseries_rows(
+            provider=source_provider,
+            payload=cached_payload,
+            request_payload=request_payload,
+        )
+    else:
+        rows_cache_key = normalized_cache_key(
+            org_id=scope,
+            provider=job.provider,
+            resource=job.resource,
+            payload_hash=payload_hash,
+            normalization_version=NORMALIZATION_VERSION,
+        )
+        cached_rows = await get_cached_rows(
+            redis_client,
+            rows_cache_key,
+            content_hash=raw_payload_hash,
+        )
+        if cached_rows is None:
+            cached_rows = _normalize_rows(
+                resource=job.resource,
+                provider=source_provider,
+                payload=cached_payload,
+                request_payload=request_payload,
             )
-        return documents
-
-    if provider == 'serpapi':
-        serpapi_response = SerpApiSearchResponse.model_validate(cached_payload)
-        for serpapi_item in serpapi_response.news_results:
-            normalized_serpapi = serpapi_to_canonical_news_item(serpapi_item)
-            documents.append(
-                NewsDocument(
-                    org_id=org_id,
-                    job_id=job_id,
-                    raw_payload_id=raw_payload_id,
-                    source_provider=normalized_serpapi.source_provider,
-                    normalization_version='v1',
-                    source_url=normalized_serpapi.source_url,
-                    title=normalized_serpapi.title,
-                    snippet=normalized_serpapi.snippet,
-                    author=normalized_serpapi.author,
-                    language=normalized_serpapi.language,
-                    published_at=normalized_serpapi.published_at,
-                    document_hash=normalized_serpapi.document_hash,
-                    created_at=datetime.now(UTC),
-                )
+            await set_cached_rows(
+                redis_client,
+                key=rows_cache_key,
+                content_hash=raw_payload_hash,
+                rows=cached_rows,
+                ttl_seconds=_cache_hard_ttl_seconds(),
             )
-        return documents
+        rows = cached_rows
 
-    raise ProviderError(
-        f'Unsupported provider for normalization: {provider}',
-        code='provider_unsupported',
-        provider=provider,
-        retryable=False,
+    normalized_count = await _store_rows(
+        job=job,
+        org_id=org_id,
+        raw_payload_id=raw_payload.id,
+        rows=rows,
+        news_repo=news_repo,
+        market_repo=market_repo,
     )
+    return normalized_count, cache_hit
 
 
 async def process_ingestion_job(
@@ -159,8 +797,6 @@ async def process_ingestion_job(
     org_id: UUID,
     redis_client: Any,
 ) -> dict[str, object]:
-    settings = get_settings()
-
     async with SessionLocal() as session:
         await session.execute(
             text("SELECT set_config('app.current_org_id', :org_id, false)"),
@@ -186,156 +822,25 @@ async def process_ingestion_job(
 
         await ingestion_repo.mark_running(job)
         try:
-            payload_hash = stable_payload_hash(job.payload)
-            cache_key = provider_cache_key(
-                org_id=str(org_id),
-                provider=job.provider,
-                resource=job.resource,
-                payload_hash=payload_hash,
-            )
-
-            cached_payload = await get_cached_payload(redis_client, cache_key)
-            cache_hit = cached_payload is not None
-
-            if cached_payload is None:
-                provider_response: ProviderResponse
-                allowed = await take_provider_token(
-                    redis_client,
-                    provider=job.provider,
-                    org_id=str(org_id),
-                    limit_per_minute=_provider_rate_limit_per_minute(job.provider),
-                )
-                if not allowed:
-                    raise ProviderError(f'Provider rate limit exceeded for {job.provider}')
-
-                if job.resource == 'news_search':
-                    search_adapter = get_search_provider(job.provider)
-                    provider_response = await search_adapter.search_news(
-                        idempotency_key=job.idempotency_key,
-                        request_payload=job.payload,
-                    )
-                elif job.resource == 'market_timeseries_backfill':
-                    market_adapter = get_market_data_provider(job.provider)
-                    provider_response = await market_adapter.get_timeseries(
-                        idempotency_key=job.idempotency_key,
-                        request_payload=job.payload,
-                    )
-                elif job.resource == 'market_quote_refresh':
-                    market_adapter = get_market_data_provider(job.provider)
-                    provider_response = await market_adapter.get_quote(
-                        idempotency_key=job.idempotency_key,
-                        request_payload=job.payload,
-                    )
-                else:
-                    raise ProviderError(
-                        f'Unsupported ingestion resource: {job.resource}',
-                        code='resource_unsupported',
-                        provider=job.provider,
-                        retryable=False,
-                    )
-                cached_payload = provider_response.payload
-                await set_cached_payload(
-                    redis_client,
-                    key=cache_key,
-                    payload=cached_payload,
-                    ttl_seconds=settings.provider_cache_ttl_seconds,
-                )
-
-            raw_payload_hash = stable_payload_hash(cached_payload)
-            raw_payload = await raw_repo.create(
+            request_payload = await _resolve_request_payload(
+                job=job,
                 org_id=org_id,
-                job_id=job.id,
-                provider=job.provider,
-                resource=job.resource,
-                content_hash=raw_payload_hash,
-                request_payload=job.payload,
-                response_payload=cached_payload,
-                http_status=200,
-                provider_request_id=None,
+                market_repo=market_repo,
             )
-
             normalized_count = 0
-            if job.resource == 'news_search':
-                documents = _build_documents(
+            cache_hit = True
+            for window_payload in _request_windows(job, request_payload, org_id=org_id):
+                window_count, window_hit = await _ingest_request(
+                    job=job,
                     org_id=org_id,
-                    job_id=job.id,
-                    raw_payload_id=raw_payload.id,
-                    provider=job.provider,
-                    cached_payload=cached_payload,
+                    request_payload=window_payload,
+                    redis_client=redis_client,
+                    raw_repo=raw_repo,
+                    news_repo=news_repo,
+                    market_repo=market_repo,
                 )
-                if documents:
-                    await news_repo.create_many(documents)
-                normalized_count = len(documents)
-            elif job.resource == 'market_timeseries_backfill':
-                if job.provider == 'twelvedata':
-                    twelvedata_timeseries = TwelveDataTimeseriesResponse.model_validate(
-                        cached_payload
-                    )
-                    rows = [
-                        row.model_dump()
-                        for row in to_canonical_timeseries(twelvedata_timeseries)
-                    ]
-                elif job.provider == 'alphavantage':
-                    av_timeseries_response = AlphaVantageTimeseriesResponse.model_validate(
-                        cached_payload
-                    )
-                    symbol = str(job.payload.get('symbol', '')).upper()
-                    interval = str(job.payload.get('interval', '1day'))
-                    rows = [
-                        row.model_dump()
-                        for row in alphavantage_to_canonical_timeseries(
-                            av_timeseries_response,
-                            symbol=symbol,
-                            timeframe=interval,
-                        )
-                    ]
-                else:
-                    raise ProviderError(
-                        f'Unsupported market provider for timeseries: {job.provider}',
-                        code='provider_unsupported',
-                        provider=job.provider,
-                        retryable=False,
-                    )
-                normalized_count = await market_repo.upsert_timeseries_rows(
-                    org_id=org_id,
-                    provider=job.provider,
-                    schema_version='v1',
-                    raw_payload_id=raw_payload.id,
-                    rows=rows,
-                )
-            elif job.resource == 'market_quote_refresh':
-                if job.provider == 'twelvedata':
-                    twelvedata_quote = TwelveDataQuoteResponse.model_validate(cached_payload)
-                    mapped_quote = to_canonical_quote(twelvedata_quote)
-                    canonical_symbol = mapped_quote.symbol
-                    canonical_price = mapped_quote.price
-                    canonical_change_percent = mapped_quote.change_percent
-                    canonical_as_of = mapped_quote.as_of
-                elif job.provider == 'alphavantage':
-                    av_quote_response = AlphaVantageQuoteResponse.model_validate(cached_payload)
-                    av_quote = alphavantage_to_canonical_quote(av_quote_response)
-                    canonical_symbol = av_quote.symbol
-                    canonical_price = av_quote.price
-                    canonical_change_percent = av_quote.change_percent
-                    canonical_as_of = av_quote.as_of
-                else:
-                    raise ProviderError(
-                        f'Unsupported market provider for quote: {job.provider}',
-                        code='provider_unsupported',
-                        provider=job.provider,
-                        retryable=False,
-                    )
-                await market_repo.upsert_quote(
-                    org_id=org_id,
-                    provider=job.provider,
-                    schema_version='v1',
-                    raw_payload_id=raw_payload.id,
-                    symbol=canonical_symbol,
-                    price=canonical_price,
-                    change_percent=canonical_change_percent,
-                    as_of=canonical_as_of,
-                )
-                normalized_count = 1
+                normalized_count += window_count
+                cache_hit = cache_hit and window_hit
 
             await ingestion_repo.mark_completed(job)
 
@@ -345,6 +850,22 @@ async def process_ingestion_job(
                 'normalized_count': normalized_count,
                 'cache_hit': cache_hit,
             }
+        except ProviderError as exc:
+            defer_seconds = _throttle_delay(exc)
+            if defer_seconds is None:
+                await ingestion_repo.mark_failed(job, str(exc))
+                raise
+            await ingestion_repo.mark_throttled(job, str(exc))
+            return {
+                'status': 'throttled',
+                'job_id': str(job.id),
+                'resource': job.resource,
+                'normalized_count': 0,
+                'cache_hit': False,
+                'retry_after_seconds': defer_seconds,
+            }
         except Exception as exc:
             await ingestion_repo.mark_failed(job, str(exc))
             raise
+        finally:
+            await flush_metrics(redis_client)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import math
+from collections import defaultdict, deque
+
+
+class LatencyTracker:
+    def __init__(self, *, window: int = 200) -> None:
+        self._samples: defaultdict[str, deque[float]] = defaultdict(
+            lambda: deque(maxlen=window)
+        )
+
+    def observe(self, key: str, seconds: float) -> None:
+        self._samples[key].append(seconds)
+
+    def percentile(self, key: str, quantile: float, *, min_samples: int = 1) -> float | None:
+        samples = sorted(self._samples.get(key, ()))
+        if not samples or len(samples) < min_samples:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(quantile * len(samples)) - 1))
+        return samples[index]
+
+    def reset(self) -> None:
+        self._samples.clear()
+
+
+provider_latency = LatencyTracker()
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from itertools import batched
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+
+from finops_api.config import get_settings
+from finops_api.db import SessionLocal
+from finops_api.models import MarketWatchlistEntry
+from finops_api.providers.base import ProviderError
+from finops_api.providers.registry import (
+    provider_rate_limit_per_minute,
+    supports_batch_quotes,
+)
+from finops_api.repositories.ingestion import IngestionRepository
+from finops_api.repositories.watchlist import WatchlistRepository
+from finops_api.schemas.ingestion import IngestionJobCreate
+from finops_api.services.ingestion_pipeline import (
+    provider_request_count,
+    split_quote_batch_payload,
+)
+from finops_api.services.queue import QueuedJob, enqueue_many, ingestion_job
+from finops_api.services.rate_limit import provider_tenant_share
+
+WATCHLIST_ORGS_KEY = 'watchlist:orgs'
+QUOTE_BATCH_MAX_SYMBOLS = 1000
+
+
+def prewarm_cron_schedule(times_utc: Sequence[str]) -> list[tuple[int, int]]:
+    schedule: set[tuple[int, int]] = set()
+    for value in times_utc:
+        hour, _, minute = value.strip().partition(':')
+        parsed = (int(hour), int(minute or 0))
+        if not (0 <= parsed[0] < 24 and 0 <= parsed[1] < 60):
+            raise ValueError(f'Invalid WATCHLIST_PREWARM_TIMES_UTC entry: {value}')
+        schedule.add(parsed)
+    return sorted(schedule)
+
+
+async def track_watchlist_org(redis_client: Any, org_id: UUID) -> None:
+    await redis_client.sadd(WATCHLIST_ORGS_KEY, str(org_id))
+
+
+def _quote_batch_payloads(
+    provider: str,
+    symbols: set[str],
+    *,
+    org_id: UUID,
+) -> list[dict[str, object]]:
+    payloads: list[dict[str, object]] = []
+    for chunk in batched(sorted(symbols), QUOTE_BATCH_MAX_SYMBOLS):
+        payload: dict[str, object] = {'symbols': list(chunk)}
+        try:
+            payloads.extend(split_quote_batch_payload(provider, payload, org_id=org_id))
+        except ProviderError:
+            payloads.append(payload)
+    return payloads
+
+
+def build_prewarm_jobs(
+    entries: Iterable[MarketWatchlistEntry],
+    *,
+    window: datetime,
+    org_id: UUID,
+) -> list[IngestionJobCreate]:
+    stamp = window.strftime('%Y%m%d%H%M')
+    symbols_by_provider: dict[str, set[str]] = defaultdict(set)
+    bar_jobs: list[IngestionJobCreate] = []
+    for entry in entries:
+        symbols_by_provider[entry.provider].add(entry.symbol)
+        bar_jobs.append(
+            IngestionJobCreate.model_validate(
+                {
+                    'provider': entry.provider,
+                    'resource': 'market_timeseries_backfill',
+                    'idempotency_key': f'prewarm:{stamp}:bars:{entry.symbol}:{entry.timeframe}',
+                    'payload': {
+                        'symbol': entry.symbol,
+                        'interval': entry.timeframe,
+                        'incremental': True,
+                    },
+                }
+            )
+        )
+
+    quote_jobs: list[IngestionJobCreate] = []
+    for provider, symbols in sorted(symbols_by_provider.items()):
+        if not supports_batch_quotes(provider):
+            quote_jobs.extend(
+                IngestionJobCreate.model_validate(
+                    {
+                        'provider': provider,
+                        'resource': 'market_quote_refresh',
+                        'idempotency_key': f'prewarm:{stamp}:quote:{symbol}',
+                        'payload': {'symbol': symbol},
+                    }
+                )
+                for symbol in sorted(symbols)
+            )
+            continue
+        quote_jobs.extend(
+            IngestionJobCreate.model_validate(
+                {
+                    'provider': provider,
+                    'resource': 'market_quote_batch_refresh',
+                    'idempotency_key': f'prewarm:{stamp}:quotes:{index}',
+                    'payload': payload,
+                }
+            )
+            for index, payload in enumerate(
+                _quote_batch_payloads(provider, symbols, org_id=org_id)
+            )
+        )
+    return quote_jobs + bar_jobs
+
+
+def prewarm_request_interval_seconds(provider: str, *, org_id: UUID) -> float:
+    settings = get_settings()
+    share = provider_tenant_share(
+        settings.rate_limit_tenant_shares,
+        provider=provider,
+        org_id=str(org_id),
+        default=settings.rate_limit_default_tenant_share,
+    )
+    per_minute = (
+        provider_rate_limit_per_minute(provider)
+        * share
+        * settings.watchlist_prewarm_budget_fraction
+    )
+    if per_minute <= 0:
+        return 0.0
+    return 60.0 / per_minute
+
+
+def _request_cost(job: IngestionJobCreate) -> int:
+    try:
+        return provider_request_count(job.provider, job.resource, job.payload)
+    except ProviderError:
+        return 1
+
+
+async def prewarm_org_watchlist(*, org_id: UUID, redis_client: Any, window: datetime) -> int:
+    async with SessionLocal() as session:
+        await session.execute(
+            text("SELECT set_config('app.current_org_id', :org_id, false)"),
+            {'org_id': str(org_id)},
+        )
+        entries = await WatchlistRepository(session).list(org_id=org_id)
+        if not entries:
+            await redis_client.srem(WATCHLIST_ORGS_KEY, str(org_id))
+            return 0
+
+        payloads = build_prewarm_jobs(entries, window=window, org_id=org_id)
+        results = await IngestionRepository(session).create_many(org_id=org_id, payloads=payloads)
+        offsets: dict[str, float] = defaultdict(float)
+        queued: list[QueuedJob] = []
+        for payload, (job, created) in zip(payloads, results, strict=True):
+            if not created:
+                continue
+            queued.append(
+                ingestion_job(
+                    job_id=job.id,
+                    org_id=org_id,
+                    resource=payload.resource,
+                    defer_seconds=offsets[payload.provider],
+                )
+            )
+            offsets[payload.provider] += _request_cost(payload) * prewarm_request_interval_seconds(
+                payload.provider,
+                org_id=org_id,
+            )
+        await enqueue_many(redis_client, queued)
+        return len(queued)
+
+
+async def run_watchlist_prewarm(redis_client: Any, *, window: datetime) -> int:
+    members = await redis_client.smembers(WATCHLIST_ORGS_KEY)
+    enqueued = 0
+    for member in sorted(members):
+        org_id = UUID(member.decode() if isinstance(member, bytes) else str(member))
+        enqueued += await prewarm_org_watchlist(
+            org_id=org_id,
+            redis_client=redis_client,
+            window=window,
+        )
+    return enqueued
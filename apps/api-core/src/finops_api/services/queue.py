@@ -1,21 +1,140 @@
 from __future__ import annotations
 
-from uuid import UUID
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+from uuid import UUID, uuid4
 
-from arq import create_pool
+from arq import ArqRedis, create_pool
 from arq.connections import RedisSettings
+from arq.constants import job_key_prefix
+from arq.jobs import serialize_job
+from arq.utils import timestamp_ms
 
 from finops_api.config import get_settings
 
+DEFAULT_QUEUE_NAME = 'q.agent.async'
 
-async def enqueue_ingestion_job(*, job_id: UUID, org_id: UUID) -> None:
-    settings = get_settings()
-    redis_pool = await create_pool(RedisSettings.from_dsn(settings.redis_url))
+REALTIME_LANE = 'realtime'
+BULK_LANE = 'bulk'
+INTEL_LANE = 'intel'
+LANE_QUEUE_NAMES: dict[str, str] = {
+    REALTIME_LANE: 'q.agent.realtime',
+    BULK_LANE: 'q.agent.bulk',
+    INTEL_LANE: DEFAULT_QUEUE_NAME,
+}
+RESOURCE_LANES: dict[str, str] = {
+    'market_quote_refresh': REALTIME_LANE,
+    'news_search': REALTIME_LANE,
+    'market_quote_batch_refresh': BULK_LANE,
+    'market_timeseries_backfill': BULK_LANE,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class QueuedJob:
+    function: str
+    payload: dict[str, Any]
+    defer_seconds: float = 0.0
+    job_id: str | None = None
+    queue_name: str = DEFAULT_QUEUE_NAME
+
+
+def lane_queue_name(lane: str) -> str:
     try:
-        await redis_pool.enqueue_job(
-            'run_ingestion_job',
-            {'job_id': str(job_id), 'org_id': str(org_id)},
-            _queue_name='q.agent.async',
-        )
-    finally:
-        await redis_pool.close()
+        return LANE_QUEUE_NAMES[lane]
+    except KeyError:
+        raise ValueError(f'Unknown worker lane: {lane}') from None
+
+
+def resource_queue_name(resource: str) -> str:
+    return LANE_QUEUE_NAMES[RESOURCE_LANES.get(resource, BULK_LANE)]
+
+
+async def create_queue_pool() -> ArqRedis:
+    return await create_pool(
+        RedisSettings.from_dsn(get_settings().redis_url),
+        default_queue_name=DEFAULT_QUEUE_NAME,
+    )
+
+
+def ingestion_job(
+    *,
+    job_id: UUID,
+    org_id: UUID,
+    resource: str,
+    defer_seconds: float = 0.0,
+) -> QueuedJob:
+    return QueuedJob(
+        'run_ingestion_job',
+        {'job_id': str(job_id), 'org_id': str(org_id)},
+        defer_seconds=defer_seconds,
+        queue_name=resource_queue_name(resource),
+    )
+
+
+async def enqueue_many(redis_pool: ArqRedis, jobs: Sequence[QueuedJob]) -> list[str]:
+    if not jobs:
+        return []
+    enqueue_time_ms = timestamp_ms()
+    job_ids: list[str] = []
+    async with redis_pool.pipeline(transaction=False) as pipe:
+        for job in jobs:
+            job_id = job.job_id or uuid4().hex
+            defer_ms = max(round(job.defer_seconds * 1000), 0)
+            pipe.set(
+                job_key_prefix + job_id,
+                serialize_job(
+                    job.function,
+                    (job.payload,),
+                    {},
+                    None,
+                    enqueue_time_ms,
+                    serializer=redis_pool.job_serializer,
+                ),
+                px=defer_ms + redis_pool.expires_extra_ms,
+                nx=True,
+            )
+            pipe.zadd(job.queue_name, {job_id: enqueue_time_ms + defer_ms})
+            job_ids.append(job_id)
+        await pipe.execute()
+    return job_ids
+
+
+async def enqueue_ingestion_job(
+    redis_pool: ArqRedis,
+    *,
+    job_id: UUID,
+    org_id: UUID,
+    resource: str,
+) -> None:
+    await redis_pool.enqueue_job(
+        'run_ingestion_job',
+        {'job_id': str(job_id), 'org_id': str(org_id)},
+        _queue_name=resource_queue_name(resource),
+    )
+
+
+async def enqueue_cache_refresh(redis_pool: ArqRedis, payload: dict[str, Any]) -> None:
+    await redis_pool.enqueue_job(
+        'refresh_provider_cache',
+        payload,
+        _queue_name=lane_queue_name(REALTIME_LANE),
+    )
+
+
+async def defer_ingestion_job(
+    redis_pool: ArqRedis,
+    *,
+    job_id: UUID,
+    org_id: UUID,
+    resource: str,
+    defer_seconds: float,
+) -> None:
+    await redis_pool.enqueue_job(
+        'run_ingestion_job',
+        {'job_id': str(job_id), 'org_id': str(org_id)},
+        _queue_name=resource_queue_name(resource),
+        _defer_by=timedelta(seconds=defer_seconds),
+    )
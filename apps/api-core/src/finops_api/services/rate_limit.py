@@ -1,55 +1,210 @@
 from __future__ import annotations
 
-import json
-import time
+import math
 from typing import Any
 
+_TOKEN_BUCKET_SCRIPT = """
+local global_capacity = tonumber(ARGV[1])
+local global_rate = tonumber(ARGV[2])
+local tenant_capacity = tonumber(ARGV[3])
+local tenant_rate = tonumber(ARGV[4])
+local requested = tonumber(ARGV[5])
+local reserve = tonumber(ARGV[6])
+local ttl = tonumber(ARGV[7])
+local now = tonumber(ARGV[8])
+if not now then
+    local clock = redis.call('TIME')
+    now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+end
+
+local function load(key, capacity, rate)
+    local tokens = capacity
+    local last_refill = now
+    local raw = redis.call('GET', key)
+    if raw then
+        local ok, state = pcall(cjson.decode, raw)
+        if ok and type(state) == 'table' then
+            tokens = tonumber(state['tokens']) or capacity
+            last_refill = tonumber(state['last_refill']) or now
+        end
+    end
+    return math.min(capacity, tokens + math.max(0, now - last_refill) * rate)
+end
+
+local function store(key, tokens, capacity, rate)
+    redis.call('SET', key, cjson.encode({
+        tokens = tokens,
+        last_refill = now,
+        capacity = capacity,
+        refill_per_second = rate,
+    }), 'EX', ttl)
+end
+
+local global_tokens = load(KEYS[1], global_capacity, global_rate)
+local tenant_tokens = load(KEYS[2], tenant_capacity, tenant_rate)
+
+local allowed = 0
+local wait = 0
+if requested > global_capacity then
+    wait = -1
+elseif global_tokens >= requested and tenant_tokens >= requested then
+    allowed = 1
+elseif global_tokens - requested >= reserve then
+    allowed = 1
+else
+    local global_wait = math.max(0, (requested - global_tokens) / global_rate)
+    local share_wait = -1
+    if requested <= tenant_capacity then
+        share_wait = math.max(global_wait, (requested - tenant_tokens) / tenant_rate)
+    end
+    local borrow_wait = -1
+    if requested + reserve <= global_capacity then
+        borrow_wait = math.max(0, (requested + reserve - global_tokens) / global_rate)
+    end
+    if borrow_wait < 0 then
+        wait = share_wait
+    elseif share_wait < 0 then
+        wait = borrow_wait
+    else
+        wait = math.min(share_wait, borrow_wait)
+    end
+end
+
+if allowed == 1 then
+    global_tokens = global_tokens - requested
+    tenant_tokens = math.max(0, tenant_tokens - requested)
+end
+store(KEYS[1], global_tokens, global_capacity, global_rate)
+store(KEYS[2], tenant_tokens, tenant_capacity, tenant_rate)
+return {allowed, tostring(wait)}
+"""
+
+
+class TokenRequestTooLargeError(Exception):
+    def __init__(self, *, provider: str, requested: int, capacity: int) -> None:
+        super().__init__(
+            f'Request for {requested} {provider} tokens exceeds bucket capacity of {capacity}'
+        )
+        self.provider = provider
+        self.requested = requested
+        self.capacity = capacity
+
+
+def _bucket_sizes(
+    *,
+    limit_per_minute: int,
+    tenant_share: float,
+    borrow_reserve_fraction: float,
+) -> tuple[float, float, float]:
+    global_capacity = float(max(1, limit_per_minute))
+    tenant_capacity = max(1.0, global_capacity * min(1.0, tenant_share))
+    reserve = global_capacity * min(1.0, max(0.0, borrow_reserve_fraction))
+    return global_capacity, tenant_capacity, reserve
+
+
+def token_bucket_capacity(
+    *,
+    limit_per_minute: int,
+    tenant_share: float = 1.0,
+    borrow_reserve_fraction: float = 0.0,
+) -> int:
+    if limit_per_minute <= 0 or tenant_share <= 0:
+        return 0
+    global_capacity, tenant_capacity, reserve = _bucket_sizes(
+        limit_per_minute=limit_per_minute,
+        tenant_share=tenant_share,
+        borrow_reserve_fraction=borrow_reserve_fraction,
+    )
+    return math.floor(max(tenant_capacity, global_capacity - reserve) + 1e-9)
+
+
+def provider_global_rate_limit_key(*, provider: str) -> str:
+    return f'ratelimit:{provider}:global'
+
+
+def provider_tenant_share(
+    shares: dict[str, float],
+    *,
+    provider: str,
+    org_id: str,
+    default: float,
+) -> float:
+    for key in (f'{provider}:{org_id}', org_id, provider):
+        if key in shares:
+            return shares[key]
+    return default
+
 
 def provider_rate_limit_key(*, provider: str, org_id: str) -> str:
     return f'ratelimit:{provider}:{org_id}'
 
 
+async def acquire_provider_tokens(
+    redis_client: Any,
+    *,
+    provider: str,
+    org_id: str,
+    limit_per_minute: int,
+    tokens: int = 1,
+    tenant_share: float = 1.0,
+    borrow_reserve_fraction: float = 0.0,
+    now_seconds: float | None = None,
+) -> tuple[bool, float]:
+    if limit_per_minute <= 0 or tenant_share <= 0:
+        return False, math.inf
+
+    capacity = token_bucket_capacity(
+        limit_per_minute=limit_per_minute,
+        tenant_share=tenant_share,
+        borrow_reserve_fraction=borrow_reserve_fraction,
+    )
+    if tokens > capacity:
+        raise TokenRequestTooLargeError(provider=provider, requested=tokens, capacity=capacity)
+
+    global_capacity, tenant_capacity, reserve = _bucket_sizes(
+        limit_per_minute=limit_per_minute,
+        tenant_share=tenant_share,
+        borrow_reserve_fraction=borrow_reserve_fraction,
+    )
+    global_rate = float(limit_per_minute) / 60.0
+    share = min(1.0, tenant_share)
+    allowed, raw_wait = await redis_client.eval(
+        _TOKEN_BUCKET_SCRIPT,
+        2,
+        provider_global_rate_limit_key(provider=provider),
+        provider_rate_limit_key(provider=provider, org_id=org_id),
+        global_capacity,
+        global_rate,
+        tenant_capacity,
+        global_rate * share,
+        tokens,
+        reserve,
+        120,
+        '' if now_seconds is None else now_seconds,
+    )
+    if isinstance(raw_wait, bytes):
+        raw_wait = raw_wait.decode('utf-8')
+    wait_seconds = float(raw_wait)
+    return bool(allowed), math.inf if wait_seconds < 0 else wait_seconds
+
+
 async def take_provider_token(
     redis_client: Any,
     *,
     provider: str,
     org_id: str,
     limit_per_minute: int,
+    tenant_share: float = 1.0,
+    borrow_reserve_fraction: float = 0.0,
     now_seconds: float | None = None,
 ) -> bool:
-    key = provider_rate_limit_key(provider=provider, org_id=org_id)
-    if limit_per_minute <= 0:
-        return False
-
-    current_time = now_seconds if now_seconds is not None else time.time()
-    capacity = float(max(1, limit_per_minute))
-    refill_rate = float(limit_per_minute) / 60.0
-
-    raw_state = await redis_client.get(key)
-    if raw_state is None:
-        tokens = capacity
-        last_refill = current_time
-    else:
-        if isinstance(raw_state, bytes):
-            raw_state = raw_state.decode('utf-8')
-        state = json.loads(raw_state)
-        tokens = float(state.get('tokens', capacity))
-        last_refill = float(state.get('last_refill', current_time))
-
-    elapsed = max(0.0, current_time - last_refill)
-    tokens = min(capacity, tokens + (elapsed * refill_rate))
-
-    allowed = tokens >= 1.0
-    if allowed:
-        tokens -= 1.0
-
-    state_payload = json.dumps(
-        {
-            'tokens': tokens,
-            'last_refill': current_time,
-            'capacity': capacity,
-            'refill_per_second': refill_rate,
-        }
+    allowed, _ = await acquire_provider_tokens(
+        redis_client,
+        provider=provider,
+        org_id=org_id,
+        limit_per_minute=limit_per_minute,
+        tenant_share=tenant_share,
+        borrow_reserve_fraction=borrow_reserve_fraction,
+        now_seconds=now_seconds,
     )
-    await redis_client.set(key, state_payload, ex=120)
     return allowed
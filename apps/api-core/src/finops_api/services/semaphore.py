@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import Any
+from uuid import uuid4
+
+from finops_api.providers.base import ProviderError
+
+_SERVER_NOW_MS = """
+local now = tonumber(ARGV[1])
+if not now then
+    local clock = redis.call('TIME')
+    now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+end
+"""
+
+_ACQUIRE_SCRIPT = (
+    _SERVER_NOW_MS
+    + """
+local limit = tonumber(ARGV[2])
+local lease_ms = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) >= limit then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now + lease_ms, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], lease_ms)
+return 1
+"""
+)
+
+_RENEW_SCRIPT = (
+    _SERVER_NOW_MS
+    + """
+local lease_ms = tonumber(ARGV[2])
+local expires_at = redis.call('ZSCORE', KEYS[1], ARGV[3])
+if not expires_at or tonumber(expires_at) <= now then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now + lease_ms, ARGV[3])
+redis.call('PEXPIRE', KEYS[1], lease_ms)
+return 1
+"""
+)
+
+
+def provider_semaphore_key(provider: str) -> str:
+    return f'semaphore:{provider}'
+
+
+async def acquire_semaphore(
+    redis_client: Any,
+    *,
+    key: str,
+    token: str,
+    limit: int,
+    lease_seconds: float,
+    now_ms: int | None = None,
+) -> bool:
+    return bool(
+        await redis_client.eval(
+            _ACQUIRE_SCRIPT,
+            1,
+            key,
+            '' if now_ms is None else now_ms,
+            limit,
+            max(1, round(lease_seconds * 1000)),
+            token,
+        )
+    )
+
+
+async def renew_semaphore(
+    redis_client: Any,
+    *,
+    key: str,
+    token: str,
+    lease_seconds: float,
+    now_ms: int | None = None,
+) -> bool:
+    return bool(
+        await redis_client.eval(
+            _RENEW_SCRIPT,
+            1,
+            key,
+            '' if now_ms is None else now_ms,
+            max(1, round(lease_seconds * 1000)),
+            token,
+        )
+    )
+
+
+async def release_semaphore(redis_client: Any, *, key: str, token: str) -> None:
+    await redis_client.zrem(key, token)
+
+
+async def _keep_lease(redis_client: Any, *, key: str, token: str, lease_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(lease_seconds / 3)
+        if not await renew_semaphore(
+            redis_client,
+            key=key,
+            token=token,
+            lease_seconds=lease_seconds,
+        ):
+            return
+
+
+@asynccontextmanager
+async def provider_slot(
+    redis_client: Any,
+    *,
+    provider: str,
+    limit: int,
+    lease_seconds: float,
+    wait_seconds: float,
+    poll_interval_seconds: float,
+) -> AsyncIterator[None]:
+    if limit <= 0:
+        yield
+        return
+
+    key = provider_semaphore_key(provider)
+    token = uuid4().hex
+    deadline = time.monotonic() + wait_seconds
+    while not await acquire_semaphore(
+        redis_client,
+        key=key,
+        token=token,
+        limit=limit,
+        lease_seconds=lease_seconds,
+    ):
+        if time.monotonic() >= deadline:
+            raise ProviderError(
+                f'Provider concurrency limit reached for {provider}',
+                code='provider_concurrency_limited',
+                provider=provider,
+                retryable=True,
+                retry_after_seconds=max(wait_seconds, poll_interval_seconds),
+            )
+        await asyncio.sleep(poll_interval_seconds)
+
+    keeper = asyncio.create_task(
+        _keep_lease(redis_client, key=key, token=token, lease_seconds=lease_seconds)
+    )
+    try:
+        yield
+    finally:
+        keeper.cancel()
+        with suppress(asyncio.CancelledError):
+            await keeper
+        await release_semaphore(redis_client, key=key, token=token)
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, suppress
+from typing import Any
+from uuid import uuid4
+
+from finops_api.providers.base import ProviderError
+from finops_api.services.cache import get_cached_payload, set_cached_payload
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_RENEW_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+def single_flight_lock_key(cache_key: str) -> str:
+    return f'singleflight:{cache_key}'
+
+
+async def acquire_fetch_lock(
+    redis_client: Any,
+    *,
+    lock_key: str,
+    token: str,
+    ttl_seconds: int,
+) -> bool:
+    return bool(await redis_client.set(lock_key, token, nx=True, ex=ttl_seconds))
+
+
+async def release_fetch_lock(redis_client: Any, *, lock_key: str, token: str) -> None:
+    await redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+
+
+async def renew_fetch_lock(
+    redis_client: Any,
+    *,
+    lock_key: str,
+    token: str,
+    ttl_seconds: int,
+) -> bool:
+    return bool(await redis_client.eval(_RENEW_LOCK_SCRIPT, 1, lock_key, token, ttl_seconds))
+
+
+async def _keep_fetch_lock(
+    redis_client: Any,
+    *,
+    lock_key: str,
+    token: str,
+    ttl_seconds: int,
+) -> None:
+    while True:
+        await asyncio.sleep(ttl_seconds / 3)
+        if not await renew_fetch_lock(
+            redis_client,
+            lock_key=lock_key,
+            token=token,
+            ttl_seconds=ttl_seconds,
+        ):
+            return
+
+
+@asynccontextmanager
+async def _held_fetch_lock(
+    redis_client: Any,
+    *,
+    lock_key: str,
+    token: str,
+    ttl_seconds: int,
+) -> AsyncIterator[None]:
+    keeper = asyncio.create_task(
+        _keep_fetch_lock(redis_client, lock_key=lock_key, token=token, ttl_seconds=ttl_seconds)
+    )
+    try:
+        yield
+    finally:
+        keeper.cancel()
+        with suppress(asyncio.CancelledError):
+            await keeper
+        await release_fetch_lock(redis_client, lock_key=lock_key, token=token)
+
+
+async def wait_for_cached_payload(
+    redis_client: Any,
+    *,
+    cache_key: str,
+    lock_key: str,
+    timeout_seconds: float,
+    poll_interval_seconds: float,
+) -> dict[str, object] | None:
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        cached = await get_cached_payload(redis_client, cache_key)
+        if cached is not None:
+            return cached
+        if not await redis_client.exists(lock_key):
+            return None
+        if time.monotonic() >= deadline:
+            return None
+        await asyncio.sleep(poll_interval_seconds)
+
+
+async def fetch_once(
+    redis_client: Any,
+    *,
+    cache_key: str,
+    fetch: Callable[[], Awaitable[dict[str, object]]],
+    cache_ttl_seconds: int,
+    lock_ttl_seconds: int,
+    wait_timeout_seconds: float,
+    poll_interval_seconds: float,
+) -> tuple[dict[str, object], bool]:
+    lock_key = single_flight_lock_key(cache_key)
+    token = uuid4().hex
+    deadline = time.monotonic() + wait_timeout_seconds
+
+    while True:
+        if await acquire_fetch_lock(
+            redis_client,
+            lock_key=lock_key,
+            token=token,
+            ttl_seconds=lock_ttl_seconds,
+        ):
+            async with _held_fetch_lock(
+                redis_client,
+                lock_key=lock_key,
+                token=token,
+                ttl_seconds=lock_ttl_seconds,
+            ):
+                cached = await get_cached_payload(redis_client, cache_key)
+                if cached is not None:
+                    return cached, True
+                payload = await fetch()
+                await set_cached_payload(
+                    redis_client,
+                    key=cache_key,
+                    payload=payload,
+                    ttl_seconds=cache_ttl_seconds,
+                )
+                return payload, False
+
+        cached = await wait_for_cached_payload(
+            redis_client,
+            cache_key=cache_key,
+            lock_key=lock_key,
+            timeout_seconds=max(0.0, deadline - time.monotonic()),
+            poll_interval_seconds=poll_interval_seconds,
+        )
+        if cached is not None:
+            return cached, True
+        if time.monotonic() >= deadline:
+            break
+
+    raise ProviderError(
+        f'Timed out waiting for in-flight fetch of {cache_key}',
+        code='provider_fetch_in_flight',
+        retryable=True,
+        retry_after_seconds=max(wait_timeout_seconds, poll_interval_seconds),
+    )
+
+
+async def refresh_once(
+    redis_client: Any,
+    *,
+    cache_key: str,
+    fetch: Callable[[], Awaitable[dict[str, object]]],
+    cache_ttl_seconds: int,
+    lock_ttl_seconds: int,
+) -> bool:
+    lock_key = single_flight_lock_key(cache_key)
+    token = uuid4().hex
+    if not await acquire_fetch_lock(
+        redis_client,
+        lock_key=lock_key,
+        token=token,
+        ttl_seconds=lock_ttl_seconds,
+    ):
+        return False
+    async with _held_fetch_lock(
+        redis_client,
+        lock_key=lock_key,
+        token=token,
+        ttl_seconds=lock_ttl_seconds,
+    ):
+        payload = await fetch()
+        await set_cached_payload(
+            redis_client,
+            key=cache_key,
+            payload=payload,
+            ttl_seconds=cache_ttl_seconds,
+        )
+    return True
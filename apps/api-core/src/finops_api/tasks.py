@@ -8,8 +8,13 @@ from sqlalchemy import text
 
 from finops_api.db import SessionLocal
 from finops_api.repositories.intel import IntelRepository
-from finops_api.services.ingestion_pipeline import process_ingestion_job
+from finops_api.services.ingestion_pipeline import (
+    process_ingestion_job,
+    refresh_provider_payload,
+)
 from finops_api.services.intel_runtime import execute_intel_run
+from finops_api.services.prewarm import run_watchlist_prewarm
+from finops_api.services.queue import defer_ingestion_job
 
 
 async def run_ingestion_job(ctx: dict[str, Any], payload: dict[str, Any]) -> dict[str, Any]:
@@ -18,11 +23,47 @@ async def run_ingestion_job(ctx: dict[str, Any], payload: dict[str, Any]) -> dic
     redis_client = ctx['redis']
 
     result = await process_ingestion_job(job_id=job_id, org_id=org_id, redis_client=redis_client)
+    if result['status'] == 'throttled':
+        await defer_ingestion_job(
+            redis_client,
+            job_id=job_id,
+            org_id=org_id,
+            resource=str(result['resource']),
+            defer_seconds=float(str(result['retry_after_seconds'])),
+        )
     result['pipeline'] = 'ingestion'
     result['processed_at'] = datetime.now(UTC).isoformat()
     return result
 
 
+async def refresh_provider_cache(ctx: dict[str, Any], payload: dict[str, Any]) -> dict[str, Any]:
+    refreshed = await refresh_provider_payload(
+        cache_key=str(payload['cache_key']),
+        provider=str(payload['provider']),
+        resource=str(payload['resource']),
+        idempotency_key=str(payload['idempotency_key']),
+        org_id=UUID(str(payload['org_id'])),
+        request_payload=dict(payload['request_payload']),
+        redis_client=ctx['redis'],
+    )
+    return {
+        'status': 'refreshed' if refreshed else 'skipped',
+        'pipeline': 'cache_refresh',
+        'processed_at': datetime.now(UTC).isoformat(),
+    }
+
+
+async def prewarm_watchlists(ctx: dict[str, Any]) -> dict[str, Any]:
+    window = datetime.now(UTC).replace(second=0, microsecond=0)
+    enqueued = await run_watchlist_prewarm(ctx['redis'], window=window)
+    return {
+        'status': 'completed',
+        'pipeline': 'prewarm',
+        'enqueued_jobs': enqueued,
+        'processed_at': datetime.now(UTC).isoformat(),
+    }
+
+
 async def run_intel_analysis(ctx: dict[str, Any], payload: dict[str, Any]) -> dict[str, Any]:
     run_id = UUID(str(payload['run_id']))
     org_id = UUID(str(payload['org_id']))
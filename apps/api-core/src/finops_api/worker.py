@@ -1,10 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import signal
+import sys
+from collections.abc import Sequence
+from contextlib import suppress
+from typing import Any
+
+from arq import Worker, cron
 from arq.connections import RedisSettings
 
 from finops_api.config import get_settings
+from finops_api.logging_config import configure_logging
+from finops_api.providers.http_pool import close_provider_http_clients, open_provider_http_clients
+from finops_api.providers.registry import registered_providers
+from finops_api.services.cache import get_local_cache, run_cache_invalidation_listener
+from finops_api.services.prewarm import prewarm_cron_schedule
+from finops_api.services.queue import (
+    BULK_LANE,
+    INTEL_LANE,
+    LANE_QUEUE_NAMES,
+    REALTIME_LANE,
+    create_queue_pool,
+    lane_queue_name,
+)
 from finops_api.tasks import (
     enqueue_embedding_refresh,
+    prewarm_watchlists,
+    refresh_provider_cache,
     run_ingestion_job,
     run_intel_analysis,
 )
@@ -12,8 +35,112 @@ from finops_api.tasks import (
 settings = get_settings()
 
 
+def lane_max_jobs(lane: str) -> int:
+    return settings.worker_lane_max_jobs_overrides.get(lane, settings.worker_max_jobs)
+
+
+def weighted_lane_max_jobs(lanes: Sequence[str], *, budget: int) -> dict[str, int]:
+    weights = {lane: lane_max_jobs(lane) for lane in dict.fromkeys(lanes)}
+    total = sum(weights.values())
+    if total <= budget:
+        return weights
+    return {lane: max(1, budget * weight // total) for lane, weight in weights.items()}
+
+
+async def startup(ctx: dict[str, Any]) -> None:
+    await open_provider_http_clients(registered_providers())
+    if get_local_cache().enabled:
+        ctx['cache_invalidation_listener'] = asyncio.create_task(
+            run_cache_invalidation_listener(ctx['redis'])
+        )
+
+
+async def shutdown(ctx: dict[str, Any]) -> None:
+    listener = ctx.pop('cache_invalidation_listener', None)
+    if listener is not None:
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
+    await close_provider_http_clients()
+
+
+WORKER_FUNCTIONS = [
+    run_ingestion_job,
+    run_intel_analysis,
+    enqueue_embedding_refresh,
+    refresh_provider_cache,
+]
+PREWARM_CRON_JOBS = [
+    cron(
+        prewarm_watchlists,
+        name=f'cron:prewarm_watchlists:{hour:02d}{minute:02d}',
+        hour=hour,
+        minute=minute,
+    )
+    for hour, minute in prewarm_cron_schedule(settings.watchlist_prewarm_times_utc)
+]
+
+
 class WorkerSettings:
-    functions = [run_ingestion_job, run_intel_analysis, enqueue_embedding_refresh]
+    functions = WORKER_FUNCTIONS
+    cron_jobs = PREWARM_CRON_JOBS
     redis_settings = RedisSettings.from_dsn(settings.redis_url)
-    max_jobs = settings.worker_max_jobs
-    queue_name = 'q.agent.async'
\ No newline at end of file
+    max_jobs = lane_max_jobs(INTEL_LANE)
+    queue_name = lane_queue_name(INTEL_LANE)
+    on_startup = startup
+    on_shutdown = shutdown
+
+
+def lane_worker_settings(lane: str) -> dict[str, Any]:
+    return {
+        'functions': WORKER_FUNCTIONS,
+        'cron_jobs': PREWARM_CRON_JOBS if lane == INTEL_LANE else [],
+        'redis_settings': WorkerSettings.redis_settings,
+        'max_jobs': lane_max_jobs(lane),
+        'queue_name': lane_queue_name(lane),
+        'on_startup': startup,
+        'on_shutdown': shutdown,
+    }
+
+
+RealtimeWorkerSettings = lane_worker_settings(REALTIME_LANE)
+BulkWorkerSettings = lane_worker_settings(BULK_LANE)
+
+
+async def run_worker_lanes(lanes: Sequence[str]) -> None:
+    workers = [
+        Worker(
+            **{
+                **lane_worker_settings(lane),
+                'max_jobs': max_jobs,
+                'on_startup': None,
+                'on_shutdown': None,
+                'handle_signals': False,
+            }
+        )
+        for lane, max_jobs in weighted_lane_max_jobs(lanes, budget=settings.worker_max_jobs).items()
+    ]
+    current = asyncio.current_task()
+    if current is not None:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, current.cancel)
+
+    redis_pool = await create_queue_pool()
+    ctx: dict[str, Any] = {'redis': redis_pool}
+    await startup(ctx)
+    try:
+        await asyncio.gather(*(worker.main() for worker in workers))
+    finally:
+        await asyncio.gather(*(worker.close() for worker in workers))
+        await shutdown(ctx)
+        await redis_pool.close()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    lanes = list(sys.argv[1:] if argv is None else argv) or list(LANE_QUEUE_NAMES)
+    configure_logging()
+    with suppress(KeyboardInterrupt):
+        asyncio.run(run_worker_lanes(lanes))
+
+
+if __name__ == '__main__':
+    main()
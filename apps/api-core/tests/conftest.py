@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from finops_api.services.cache import get_local_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_local_cache() -> Iterator[None]:
+    get_local_cache.cache_clear()
+    yield
+    get_local_cache.cache_clear()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from datetime import UTC, datetime, timedelta
 
 import httpx
 import pytest
@@ -107,3 +108,87 @@ async def test_alphavantage_non_retryable_provider_error() -> None:
             request_payload={'symbol': 'INVALID'},
         )
     assert call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_alphavantage_quote_batch_uses_bulk_endpoint() -> None:
+    _set_alpha_api_key()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params['function'] == 'REALTIME_BULK_QUOTES'
+        return httpx.Response(
+            200,
+            json={
+                'endpoint': 'Realtime Bulk Quotes',
+                'data': [
+                    {
+                        'symbol': symbol,
+                        'timestamp': '2026-02-09 16:00:00.000',
+                        'close': '189.25',
+                        'change_percent': '1.2',
+                    }
+                    for symbol in request.url.params['symbol'].split(',')
+                ],
+            },
+        )
+
+    adapter = AlphaVantageAdapter(transport=httpx.MockTransport(handler))
+    response = await adapter.get_quote_batch(
+        idempotency_key='idem-av-batch-1',
+        request_payload={'symbols': 'AAPL,msft'},
+    )
+    quotes = response.payload['quotes']
+    assert isinstance(quotes, list)
+    assert [quote['symbol'] for quote in quotes] == ['AAPL', 'MSFT']
+
+
+@pytest.mark.asyncio
+async def test_alphavantage_quote_batch_surfaces_entitlement_message() -> None:
+    _set_alpha_api_key()
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={'Information': 'premium endpoint'})
+
+    adapter = AlphaVantageAdapter(transport=httpx.MockTransport(handler))
+    with pytest.raises(ProviderError, match='premium endpoint'):
+        await adapter.get_quote_batch(
+            idempotency_key='idem-av-batch-2',
+            request_payload={'symbols': ['AAPL']},
+        )
+
+
+@pytest.mark.asyncio
+async def test_alphavantage_incremental_timeseries_filters_from_start_date() -> None:
+    _set_alpha_api_key()
+    start = datetime.now(UTC) - timedelta(days=3)
+    days = [(start + timedelta(days=offset)).date().isoformat() for offset in (-2, -1, 0, 1)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params['outputsize'] == 'compact'
+        bar = {
+            '1. open': '1',
+            '2. high': '1',
+            '3. low': '1',
+            '4. close': '1',
+            '5. volume': '1',
+        }
+        return httpx.Response(
+            200,
+            json={
+                'Meta Data': {'2. Symbol': 'AAPL'},
+                'Time Series (Daily)': {day: bar for day in days},
+            },
+        )
+
+    adapter = AlphaVantageAdapter(transport=httpx.MockTransport(handler))
+    response = await adapter.get_timeseries(
+        idempotency_key='idem-av-incremental',
+        request_payload={
+            'symbol': 'AAPL',
+            'start_date': start.strftime('%Y-%m-%d %H:%M:%S'),
+            'incremental': True,
+        },
+    )
+    daily = response.payload['Time Series (Daily)']
+    assert isinstance(daily, dict)
+    assert sorted(daily) == days[2:]
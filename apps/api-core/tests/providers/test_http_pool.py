@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+
+import httpx
+import pytest
+
+from finops_api.config import get_settings
+from finops_api.providers import http_pool
+from finops_api.providers.base import ProviderError
+from finops_api.providers.http_pool import (
+    close_provider_http_clients,
+    get_provider_http_client,
+    open_provider_http_clients,
+)
+from finops_api.providers.twelvedata.client import TwelveDataAdapter
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_client_per_provider() -> None:
+    await open_provider_http_clients(['twelvedata', 'tavily'])
+    try:
+        twelvedata_client = get_provider_http_client('twelvedata')
+        assert get_provider_http_client('twelvedata') is twelvedata_client
+        assert get_provider_http_client('tavily') is not twelvedata_client
+    finally:
+        await close_provider_http_clients()
+
+    assert twelvedata_client.is_closed
+    reopened = get_provider_http_client('twelvedata')
+    assert reopened is not twelvedata_client
+    await close_provider_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_adapter_uses_pooled_client_without_transport() -> None:
+    os.environ['TWELVE_DATA_API_KEY'] = 'test-key'
+    get_settings.cache_clear()
+    call_count = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal call_count
+        call_count += 1
+        return httpx.Response(
+            200,
+            json={
+                'symbol': 'AAPL',
+                'close': '189.25',
+                'percent_change': '1.1',
+                'datetime': '2026-02-09T10:00:00Z',
+            },
+        )
+
+    pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    http_pool._clients['twelvedata'] = pooled
+    try:
+        adapter = TwelveDataAdapter()
+        await adapter.get_quote(idempotency_key='idem-pool-1', request_payload={'symbol': 'AAPL'})
+        await adapter.get_quote(idempotency_key='idem-pool-2', request_payload={'symbol': 'AAPL'})
+        assert call_count == 2
+        assert not pooled.is_closed
+    finally:
+        await close_provider_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_adapter_rejects_payload_over_cap() -> None:
+    os.environ['TWELVE_DATA_API_KEY'] = 'test-key'
+    os.environ['PROVIDER_MAX_PAYLOAD_BYTES'] = '64'
+    get_settings.cache_clear()
+    call_count = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal call_count
+        call_count += 1
+        return httpx.Response(200, json={'symbol': 'AAPL', 'padding': 'x' * 256})
+
+    try:
+        adapter = TwelveDataAdapter(transport=httpx.MockTransport(handler))
+        with pytest.raises(ProviderError) as exc:
+            await adapter.get_quote(
+                idempotency_key='idem-pool-3',
+                request_payload={'symbol': 'AAPL'},
+            )
+        assert 'PROVIDER_MAX_PAYLOAD_BYTES' in str(exc.value)
+        assert call_count == 1
+    finally:
+        os.environ.pop('PROVIDER_MAX_PAYLOAD_BYTES')
+        get_settings.cache_clear()
@@ -5,9 +5,21 @@ import os
 import pytest
 
 from finops_api.config import get_settings
+from finops_api.providers import registry
 from finops_api.providers.alphavantage.client import AlphaVantageAdapter
 from finops_api.providers.base import ProviderError
-from finops_api.providers.registry import get_market_data_provider, get_search_provider
+from finops_api.providers.registry import (
+    ProviderRegistration,
+    canonical_request_payload,
+    get_market_data_provider,
+    get_provider_registration,
+    get_search_provider,
+    is_shared_resource,
+    provider_rate_limit_per_minute,
+    register_provider,
+    registered_providers,
+    reset_provider_instances,
+)
 from finops_api.providers.serpapi.client import SerpApiAdapter
 from finops_api.providers.serper.client import SerperAdapter
 from finops_api.providers.tavily.client import TavilyAdapter
@@ -57,3 +69,86 @@ def test_registry_resolves_alphavantage_provider() -> None:
     get_settings.cache_clear()
     provider = get_market_data_provider('alphavantage')
     assert isinstance(provider, AlphaVantageAdapter)
+
+
+def test_registry_reuses_adapter_instances() -> None:
+    os.environ['TWELVE_DATA_API_KEY'] = 'test-key'
+    get_settings.cache_clear()
+    first = get_market_data_provider('twelvedata')
+    assert get_market_data_provider('twelvedata') is first
+
+    get_settings.cache_clear()
+    assert get_market_data_provider('twelvedata') is not first
+
+
+def test_registry_exposes_rate_limits_and_normalizers() -> None:
+    get_settings.cache_clear()
+    assert provider_rate_limit_per_minute('alphavantage') == 5
+    assert provider_rate_limit_per_minute('unknown') == 0
+    assert get_provider_registration('tavily').normalize_news is not None
+    assert get_provider_registration('twelvedata').normalize_quote is not None
+    with pytest.raises(ProviderError, match='Unsupported provider'):
+        get_provider_registration('unknown')
+
+
+def test_registry_accepts_plugin_registration() -> None:
+    os.environ['TAVILY_API_KEY'] = 'test-key'
+    get_settings.cache_clear()
+    register_provider(
+        ProviderRegistration(
+            name='tavily-mirror',
+            rate_limit_setting='tavily_rate_limit_per_minute',
+            search_factory=TavilyAdapter,
+        )
+    )
+    try:
+        assert 'tavily-mirror' in registered_providers()
+        assert isinstance(get_search_provider('tavily-mirror'), TavilyAdapter)
+        assert provider_rate_limit_per_minute('tavily-mirror') == 30
+    finally:
+        registry._registrations.pop('tavily-mirror', None)
+        reset_provider_instances()
+
+
+def test_public_market_data_resources_are_shared_across_tenants() -> None:
+    assert is_shared_resource('twelvedata', 'market_timeseries_backfill')
+    assert is_shared_resource('alphavantage', 'market_quote_refresh')
+    assert not is_shared_resource('tavily', 'news_search')
+    assert not is_shared_resource('unknown', 'market_quote_refresh')
+
+
+def test_canonical_request_payload_merges_equivalent_search_requests() -> None:
+    variants = [
+        {'query': 'Nvidia earnings'},
+        {'query': '  nvidia   earnings '},
+        {'query': 'nvidia earnings', 'max_results': 10, 'topic': 'news'},
+    ]
+    canonical = [canonical_request_payload('tavily', 'news_search', item) for item in variants]
+    assert canonical[0] == canonical[1] == canonical[2]
+    assert canonical[0]['query'] == 'nvidia earnings'
+    assert canonical_request_payload('serper', 'news_search', {'query': 'NVDA Guidance'}) == {
+        'q': 'nvda guidance',
+        'num': 10,
+    }
+
+
+def test_canonical_request_payload_normalizes_market_symbols() -> None:
+    assert canonical_request_payload(
+        'twelvedata',
+        'market_timeseries_backfill',
+        {'symbol': ' aapl '},
+    ) == canonical_request_payload(
+        'twelvedata',
+        'market_timeseries_backfill',
+        {'symbol': 'AAPL', 'interval': '1day', 'outputsize': 100},
+    )
+    assert canonical_request_payload(
+        'alphavantage',
+        'market_quote_batch_refresh',
+        {'symbols': 'msft, ibm,MSFT'},
+    ) == {'symbols': ['IBM', 'MSFT']}
+
+
+def test_canonical_request_payload_keeps_invalid_or_unknown_payloads() -> None:
+    assert canonical_request_payload('tavily', 'news_search', {'query': 'x'}) == {'query': 'x'}
+    assert canonical_request_payload('unknown', 'news_search', {'q': 'A'}) == {'q': 'A'}
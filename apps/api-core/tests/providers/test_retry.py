@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+
+from finops_api.config import get_settings
+from finops_api.providers.base import ProviderError
+from finops_api.providers.retry import backoff_delay, parse_retry_after
+from finops_api.providers.tavily.client import TavilyAdapter
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates() -> None:
+    now = datetime(2026, 2, 9, 10, 0, 0, tzinfo=UTC)
+    assert parse_retry_after('12') == 12.0
+    assert parse_retry_after('Mon, 09 Feb 2026 10:00:30 GMT', now=now) == 30.0
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+
+def test_backoff_delay_is_jittered_and_honours_retry_after() -> None:
+    for attempt in range(4):
+        delay = backoff_delay(attempt, base_seconds=1.0, max_seconds=5.0)
+        assert delay is not None
+        ceiling = min(5.0, 2.0**attempt)
+        assert ceiling / 2 <= delay <= ceiling
+
+    assert backoff_delay(0, base_seconds=0.1, max_seconds=5.0, retry_after_seconds=3.0) == 3.0
+    assert backoff_delay(0, base_seconds=0.1, max_seconds=5.0, retry_after_seconds=60.0) is None
+
+
+@pytest.mark.asyncio
+async def test_adapter_stops_retrying_when_retry_after_exceeds_cap() -> None:
+    os.environ['TAVILY_API_KEY'] = 'test-key'
+    get_settings.cache_clear()
+    call_count = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal call_count
+        call_count += 1
+        return httpx.Response(429, headers={'Retry-After': '3600'}, json={})
+
+    adapter = TavilyAdapter(max_retries=3, transport=httpx.MockTransport(handler))
+    with pytest.raises(ProviderError) as exc:
+        await adapter.search_news(idempotency_key='idem-retry-1', request_payload={'query': 'fx'})
+
+    assert call_count == 1
+    assert exc.value.code == 'provider_retries_exhausted'
+    assert exc.value.http_status == 429
+    assert exc.value.retry_after_seconds == 3600.0
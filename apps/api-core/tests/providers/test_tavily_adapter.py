@@ -4,6 +4,7 @@ import os
 
 import httpx
 import pytest
+from pydantic import ValidationError
 
 from finops_api.config import get_settings
 from finops_api.providers.base import ProviderError
@@ -124,3 +125,20 @@ async def test_tavily_adapter_does_not_retry_non_retryable_4xx() -> None:
         )
 
     assert call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_tavily_adapter_rejects_malformed_response_body() -> None:
+    _set_tavily_api_key()
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={'query': 'nvda', 'results': [{'title': 'no url'}]})
+
+    transport = httpx.MockTransport(handler)
+    adapter = TavilyAdapter(transport=transport)
+
+    with pytest.raises(ValidationError):
+        await adapter.search_news(
+            idempotency_key='idem-5',
+            request_payload={'query': 'nvda', 'max_results': 5},
+        )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from datetime import UTC, datetime
 
 import httpx
 import pytest
@@ -8,6 +9,7 @@ import pytest
 from finops_api.config import get_settings
 from finops_api.providers.base import ProviderError
 from finops_api.providers.twelvedata.client import TwelveDataAdapter
+from finops_api.providers.twelvedata.dto import TwelveDataTimeseriesRequest, timeseries_windows
 
 
 def _set_twelvedata_api_key() -> None:
@@ -106,3 +108,159 @@ async def test_twelvedata_non_retryable_provider_error() -> None:
             request_payload={'symbol': 'INVALID'},
         )
     assert call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_twelvedata_quote_batch_chunks_symbols() -> None:
+    _set_twelvedata_api_key()
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        symbols = request.url.params['symbol'].split(',')
+        requested.append(request.url.params['symbol'])
+        if len(symbols) == 1:
+            return httpx.Response(
+                200,
+                json={
+                    'symbol': symbols[0],
+                    'close': '10.0',
+                    'datetime': '2026-02-09T10:00:00Z',
+                },
+            )
+        body: dict[str, object] = {}
+        for symbol in symbols:
+            if symbol == 'BAD':
+                body[symbol] = {'code': 404, 'message': 'symbol not found', 'status': 'error'}
+            else:
+                body[symbol] = {
+                    'symbol': symbol,
+                    'close': '10.0',
+                    'datetime': '2026-02-09T10:00:00Z',
+                }
+        return httpx.Response(200, json=body)
+
+    adapter = TwelveDataAdapter(transport=httpx.MockTransport(handler))
+    adapter.max_batch_symbols = 2
+    response = await adapter.get_quote_batch(
+        idempotency_key='idem-batch-1',
+        request_payload={'symbols': ['aapl', 'MSFT', 'bad', 'aapl', 'NVDA']},
+    )
+
+    assert requested == ['AAPL,MSFT', 'BAD,NVDA']
+    quotes = response.payload['quotes']
+    assert isinstance(quotes, list)
+    assert [quote['symbol'] for quote in quotes] == ['AAPL', 'MSFT', 'NVDA']
+    assert response.payload['errors'] == {'BAD': 'symbol not found'}
+
+
+@pytest.mark.asyncio
+async def test_twelvedata_quote_batch_records_error_in_trailing_single_symbol_chunk() -> None:
+    _set_twelvedata_api_key()
+    symbols = [f'S{index:03d}' for index in range(120)] + ['BAD']
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested = request.url.params['symbol'].split(',')
+        if requested == ['BAD']:
+            return httpx.Response(
+                200,
+                json={'code': 404, 'message': 'symbol not found', 'status': 'error'},
+            )
+        return httpx.Response(
+            200,
+            json={
+                symbol: {'symbol': symbol, 'close': '10.0', 'datetime': '2026-02-09T10:00:00Z'}
+                for symbol in requested
+            },
+        )
+
+    adapter = TwelveDataAdapter(transport=httpx.MockTransport(handler))
+    request_payload: dict[str, object] = {'symbols': symbols}
+    response = await adapter.get_quote_batch(
+        idempotency_key='idem-batch-121',
+        request_payload=request_payload,
+    )
+
+    quotes = response.payload['quotes']
+    assert isinstance(quotes, list)
+    assert len(quotes) == 120
+    assert response.payload['errors'] == {'BAD': 'symbol not found'}
+    assert adapter.quote_batch_request_count(request_payload) == 121
+
+
+@pytest.mark.asyncio
+async def test_twelvedata_timeseries_splits_long_ranges_into_windows() -> None:
+    _set_twelvedata_api_key()
+    windows: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start_date = request.url.params['start_date']
+        end_date = request.url.params['end_date']
+        assert request.url.params['outputsize'] == '5000'
+        windows.append((start_date, end_date))
+        return httpx.Response(
+            200,
+            json={
+                'meta': {'symbol': 'AAPL', 'interval': '1h'},
+                'values': [
+                    {
+                        'datetime': end_date,
+                        'open': '1',
+                        'high': '1',
+                        'low': '1',
+                        'close': '1',
+                        'volume': '1',
+                    },
+                    {
+                        'datetime': start_date,
+                        'open': '1',
+                        'high': '1',
+                        'low': '1',
+                        'close': '1',
+                        'volume': '1',
+                    },
+                ],
+            },
+        )
+
+    adapter = TwelveDataAdapter(transport=httpx.MockTransport(handler))
+    request_payload: dict[str, object] = {
+        'symbol': 'AAPL',
+        'interval': '1h',
+        'start_date': '2024-01-01 00:00:00',
+        'end_date': '2025-06-01 00:00:00',
+    }
+    assert adapter.timeseries_request_count(request_payload) == 3
+    with pytest.raises(ProviderError):
+        await adapter.get_timeseries(
+            idempotency_key='idem-ts-windows',
+            request_payload=request_payload,
+        )
+
+    window_payloads = adapter.split_timeseries_request(request_payload)
+    assert len(window_payloads) == 3
+    responses = [
+        await adapter.get_timeseries(
+            idempotency_key='idem-ts-windows',
+            request_payload=window_payload,
+        )
+        for window_payload in window_payloads
+    ]
+
+    assert len(windows) == 3
+    assert windows[0][0] == '2024-01-01 00:00:00'
+    assert windows[-1][1] == '2025-06-01 00:00:00'
+    assert all(adapter.timeseries_request_count(payload) == 1 for payload in window_payloads)
+    values = responses[-1].payload['values']
+    assert isinstance(values, list)
+    assert len(values) == 2
+    assert values[0]['datetime'] == '2025-06-01 00:00:00'
+
+
+def test_twelvedata_short_range_is_single_window() -> None:
+    request = TwelveDataTimeseriesRequest(
+        symbol='AAPL',
+        interval='1day',
+        start_date='2026-02-01 00:00:00',
+    )
+    windows = timeseries_windows(request, now=datetime(2026, 2, 9, tzinfo=UTC))
+    assert windows == [('2026-02-01 00:00:00', None)]
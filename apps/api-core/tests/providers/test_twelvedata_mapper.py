@@ -4,7 +4,12 @@ from finops_api.providers.twelvedata.dto import (
     TwelveDataQuoteResponse,
     TwelveDataTimeseriesResponse,
 )
-from finops_api.providers.twelvedata.mapper import to_canonical_quote, to_canonical_timeseries
+from finops_api.providers.twelvedata.mapper import (
+    normalize_quote_batch_payload,
+    normalize_timeseries_payload,
+    to_canonical_quote,
+    to_canonical_timeseries,
+)
 
 
 def test_twelvedata_quote_mapper() -> None:
@@ -41,3 +46,41 @@ def test_twelvedata_timeseries_mapper() -> None:
     assert rows[0].symbol == 'AAPL'
     assert rows[0].timeframe == '1day'
     assert rows[0].close == 189.0
+
+
+def test_twelvedata_quote_batch_normalizer() -> None:
+    rows = normalize_quote_batch_payload(
+        {
+            'quotes': [
+                {'symbol': 'aapl', 'close': '189.25', 'datetime': '2026-02-09T10:00:00Z'},
+                {'symbol': 'msft', 'close': '410.5', 'datetime': '2026-02-09T10:00:00Z'},
+            ],
+            'errors': {'BAD': 'symbol not found'},
+        }
+    )
+    assert [row.symbol for row in rows] == ['AAPL', 'MSFT']
+    assert rows[1].price == 410.5
+
+
+def test_twelvedata_timeseries_normalizer_streams_rows() -> None:
+    rows = normalize_timeseries_payload(
+        {
+            'meta': {'symbol': 'aapl', 'interval': '1h'},
+            'values': [
+                {
+                    'datetime': '2026-02-08 10:00:00',
+                    'open': '187.0',
+                    'high': '190.0',
+                    'low': '186.0',
+                    'close': '189.0',
+                    'volume': '1000',
+                }
+            ],
+        },
+        request_payload={'symbol': 'AAPL', 'interval': '1h'},
+    )
+    assert not isinstance(rows, list)
+    materialized = list(rows)
+    assert materialized[0]['symbol'] == 'AAPL'
+    assert materialized[0]['timeframe'] == '1h'
+    assert materialized[0]['close'] == 189.0
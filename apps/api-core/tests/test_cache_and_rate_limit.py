@@ -1,25 +1,40 @@
 from __future__ import annotations
 
+import asyncio
+import json
+from datetime import UTC, datetime
+
+import fakeredis
 import pytest
 
+from finops_api.config import get_settings
+from finops_api.metrics import metrics
+from finops_api.services import cache
 from finops_api.services.cache import (
+    CACHE_INVALIDATION_CHANNEL,
+    SHARED_CACHE_SCOPE,
+    LocalCache,
+    cache_scope,
+    decode_cache_value,
+    encode_cache_value,
     get_cached_payload,
+    get_cached_rows,
+    get_local_cache,
+    normalized_cache_key,
     provider_cache_key,
+    run_cache_invalidation_listener,
     set_cached_payload,
+    set_cached_rows,
     stable_payload_hash,
 )
-from finops_api.services.rate_limit import provider_rate_limit_key, take_provider_token
-
-
-class FakeRedis:
-    def __init__(self) -> None:
-        self.store: dict[str, str] = {}
-
-    async def get(self, key: str) -> str | None:
-        return self.store.get(key)
-
-    async def set(self, key: str, value: str, ex: int) -> None:  # noqa: ARG002
-        self.store[key] = value
+from finops_api.services.rate_limit import (
+    TokenRequestTooLargeError,
+    acquire_provider_tokens,
+    provider_rate_limit_key,
+    provider_tenant_share,
+    take_provider_token,
+    token_bucket_capacity,
+)
 
 
 def test_stable_payload_hash_is_deterministic() -> None:
@@ -34,9 +49,23 @@ def test_cache_key_and_rate_limit_key_are_stable() -> None:
     assert provider_rate_limit_key(provider='tavily', org_id='org1') == 'ratelimit:tavily:org1'
 
 
+def test_shared_cache_scope_drops_org_id() -> None:
+    keys = {
+        provider_cache_key(
+            org_id=cache_scope(org_id=org_id, shared=True),
+            provider='twelvedata',
+            resource='market_quote_refresh',
+            payload_hash='abc',
+        )
+        for org_id in ('org1', 'org2')
+    }
+    assert keys == {f'ingestion:twelvedata:market_quote_refresh:{SHARED_CACHE_SCOPE}:abc'}
+    assert cache_scope(org_id='org1', shared=False) == 'org1'
+
+
 @pytest.mark.asyncio
 async def test_cache_round_trip() -> None:
-    redis = FakeRedis()
+    redis = fakeredis.FakeAsyncRedis()
     key = 'k'
     payload = {'query': 'test'}
 
@@ -45,9 +74,148 @@ async def test_cache_round_trip() -> None:
     assert cached == payload
 
 
+def _timeseries_payload(bars: int) -> dict[str, object]:
+    return {
+        'meta': {'symbol': 'AAPL', 'interval': '1h'},
+        'values': [
+            {
+                'datetime': f'2026-02-{1 + index // 24:02d} {index % 24:02d}:00:00',
+                'open': f'{187 + (index % 50) / 10:.5f}',
+                'high': f'{188 + (index % 50) / 10:.5f}',
+                'low': f'{186 + (index % 50) / 10:.5f}',
+                'close': f'{187.5 + (index % 50) / 10:.5f}',
+                'volume': str(1_000_000 + index * 37),
+            }
+            for index in range(bars)
+        ],
+    }
+
+
+def test_cache_codec_compresses_and_reads_legacy_values() -> None:
+    payload = _timeseries_payload(5000)
+    plain = json.dumps(payload).encode('utf-8')
+    metrics.drain()
+
+    encoded = encode_cache_value(payload)
+
+    assert encoded[:1] == b'\x01'
+    assert len(plain) / len(encoded) >= 5
+    assert decode_cache_value(encoded) == payload
+    assert decode_cache_value(plain) == payload
+    assert decode_cache_value(plain.decode('utf-8')) == payload
+    recorded = metrics.drain()
+    assert recorded['finops_cache_encoded_bytes_total{codec="zlib"}'] == len(encoded)
+    assert recorded['finops_cache_raw_bytes_total{codec="zlib"}'] > len(encoded)
+
+
+def test_msgpack_codec_round_trip(monkeypatch) -> None:
+    pytest.importorskip('msgpack')
+    monkeypatch.setenv('PROVIDER_CACHE_CODEC', 'msgpack')
+    get_settings.cache_clear()
+    try:
+        encoded = encode_cache_value({'v': [1, 2.5, 'x']})
+        assert encoded[:1] == b'\x02'
+        assert decode_cache_value(encoded) == {'v': [1, 2.5, 'x']}
+    finally:
+        monkeypatch.delenv('PROVIDER_CACHE_CODEC')
+        get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_local_tier_serves_hot_keys_without_redis() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    await redis.set('k', '{"query": "test"}', ex=300)
+
+    assert await get_cached_payload(redis, 'k') == {'query': 'test'}
+    await redis.delete('k')
+    assert await get_cached_payload(redis, 'k') == {'query': 'test'}
+    assert get_local_cache().stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_local_tier_charges_uncompressed_size_on_write_and_read(monkeypatch) -> None:
+    monkeypatch.setenv('PROVIDER_CACHE_CODEC', 'zlib')
+    get_settings.cache_clear()
+    payload = {'results': [{'title': 'repeated headline ' * 20}] * 10}
+    try:
+        redis = fakeredis.FakeAsyncRedis()
+        await set_cached_payload(redis, key='k', payload=payload, ttl_seconds=300)
+        written = get_local_cache().stats.bytes
+        assert written > len(await redis.get('k'))
+
+        get_local_cache.cache_clear()
+        assert await get_cached_payload(redis, 'k') == payload
+        assert get_local_cache().stats.bytes == written
+    finally:
+        monkeypatch.delenv('PROVIDER_CACHE_CODEC')
+        get_settings.cache_clear()
+
+
+def test_local_cache_evicts_lru_by_bytes_and_expires_entries() -> None:
+    local = LocalCache(max_bytes=100, max_ttl_seconds=60)
+    local.set('a', {'v': 1}, size_bytes=40, ttl_seconds=300, now=0.0)
+    local.set('b', {'v': 2}, size_bytes=40, ttl_seconds=5, now=0.0)
+    assert local.get('a', now=1.0) == {'v': 1}
+
+    local.set('c', {'v': 3}, size_bytes=40, ttl_seconds=300, now=1.0)
+    assert local.get('b', now=1.0) is None
+    assert local.stats.evictions == 1
+    assert local.stats.bytes == 80
+
+    assert local.get('a', now=61.0) is None
+    assert local.stats.expirations == 1
+
+    local.set('huge', {'v': 4}, size_bytes=101, ttl_seconds=300, now=1.0)
+    assert local.get('huge', now=1.0) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidation_from_other_workers_evicts_local_copy() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    await set_cached_payload(redis, key='k', payload={'v': 1}, ttl_seconds=300)
+    listener = asyncio.create_task(run_cache_invalidation_listener(redis))
+    try:
+        await asyncio.sleep(0.05)
+        await redis.publish(CACHE_INVALIDATION_CHANNEL, f'{cache._INSTANCE_ID} k')
+        await asyncio.sleep(0.05)
+        assert get_local_cache().stats.invalidations == 0
+
+        await redis.publish(CACHE_INVALIDATION_CHANNEL, 'other-worker k')
+        for _ in range(50):
+            if get_local_cache().stats.invalidations:
+                break
+            await asyncio.sleep(0.02)
+        assert get_local_cache().stats.invalidations == 1
+    finally:
+        listener.cancel()
+        await asyncio.gather(listener, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_normalized_rows_round_trip_checks_content_hash() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    key = normalized_cache_key(
+        org_id='org1',
+        provider='twelvedata',
+        resource='market_quote_refresh',
+        payload_hash='abc',
+        normalization_version='v1',
+    )
+    assert key == 'ingestion:normalized:v1:twelvedata:market_quote_refresh:org1:abc'
+    as_of = datetime(2026, 2, 9, 10, tzinfo=UTC)
+    rows: list[dict[str, object]] = [
+        {'symbol': 'AAPL', 'price': 189.25, 'change_percent': 1.1, 'as_of': as_of}
+    ]
+
+    await set_cached_rows(redis, key=key, content_hash='h1', rows=rows, ttl_seconds=300)
+
+    assert await get_cached_rows(redis, key, content_hash='h1') == rows
+    assert await get_cached_rows(redis, key, content_hash='h2') is None
+
+
 @pytest.mark.asyncio
 async def test_rate_limit_bucket() -> None:
-    redis = FakeRedis()
+    redis = fakeredis.FakeAsyncRedis()
 
     assert await take_provider_token(
         redis,
@@ -71,7 +239,7 @@ async def test_rate_limit_bucket() -> None:
 
 @pytest.mark.asyncio
 async def test_rate_limit_bucket_refills_over_time() -> None:
-    redis = FakeRedis()
+    redis = fakeredis.FakeAsyncRedis()
 
     assert await take_provider_token(
         redis,
@@ -105,27 +273,133 @@ async def test_rate_limit_bucket_refills_over_time() -> None:
 
 
 @pytest.mark.asyncio
-async def test_rate_limit_bucket_is_isolated_per_org() -> None:
-    redis = FakeRedis()
+async def test_rate_limit_global_bucket_is_shared_across_orgs() -> None:
+    redis = fakeredis.FakeAsyncRedis()
 
-    assert await take_provider_token(
+    async def take(org_id: str) -> bool:
+        return await take_provider_token(
+            redis,
+            provider='tavily',
+            org_id=org_id,
+            limit_per_minute=2,
+            tenant_share=0.5,
+            borrow_reserve_fraction=0.5,
+            now_seconds=200.0,
+        )
+
+    assert await take('org-a')
+    assert not await take('org-a')
+    assert await take('org-b')
+    assert not await take('org-c')
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_tenant_borrows_unused_global_capacity() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+
+    async def acquire(org_id: str, tokens: int) -> tuple[bool, float]:
+        return await acquire_provider_tokens(
+            redis,
+            provider='twelvedata',
+            org_id=org_id,
+            limit_per_minute=60,
+            tokens=tokens,
+            tenant_share=0.25,
+            borrow_reserve_fraction=0.2,
+            now_seconds=300.0,
+        )
+
+    assert await acquire('org-a', 15) == (True, 0.0)
+    assert await acquire('org-a', 30) == (True, 0.0)
+    allowed, wait_seconds = await acquire('org-a', 10)
+    assert not allowed
+    assert wait_seconds == pytest.approx(7.0)
+    assert await acquire('org-b', 10) == (True, 0.0)
+
+
+def test_tenant_share_prefers_most_specific_setting() -> None:
+    shares = {'twelvedata': 0.5, 'org1': 0.3, 'twelvedata:org1': 0.1}
+    assert provider_tenant_share(shares, provider='twelvedata', org_id='org1', default=0.25) == 0.1
+    assert provider_tenant_share(shares, provider='tavily', org_id='org1', default=0.25) == 0.3
+    assert provider_tenant_share(shares, provider='twelvedata', org_id='org2', default=0.25) == 0.5
+    assert provider_tenant_share(shares, provider='tavily', org_id='org2', default=0.25) == 0.25
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_takes_multiple_tokens_and_reports_wait() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+
+    assert await acquire_provider_tokens(
         redis,
-        provider='tavily',
-        org_id='org-a',
-        limit_per_minute=1,
-        now_seconds=200.0,
+        provider='twelvedata',
+        org_id='org1',
+        limit_per_minute=60,
+        tokens=50,
+        now_seconds=100.0,
+    ) == (True, 0.0)
+    allowed, wait_seconds = await acquire_provider_tokens(
+        redis,
+        provider='twelvedata',
+        org_id='org1',
+        limit_per_minute=60,
+        tokens=20,
+        now_seconds=100.0,
+    )
+    assert not allowed
+    assert wait_seconds == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_rejects_requests_larger_than_the_bucket() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    budget = {'limit_per_minute': 60, 'tenant_share': 0.25, 'borrow_reserve_fraction': 0.2}
+
+    assert token_bucket_capacity(**budget) == 48
+    assert token_bucket_capacity(limit_per_minute=60) == 60
+    assert token_bucket_capacity(limit_per_minute=0) == 0
+    assert await acquire_provider_tokens(
+        redis,
+        provider='twelvedata',
+        org_id='org1',
+        tokens=48,
+        now_seconds=100.0,
+        **budget,
+    ) == (True, 0.0)
+    for tokens in (49, 61, 120):
+        with pytest.raises(TokenRequestTooLargeError) as exc_info:
+            await acquire_provider_tokens(
+                redis,
+                provider='twelvedata',
+                org_id='org2',
+                tokens=tokens,
+                now_seconds=100.0,
+                **budget,
+            )
+        assert exc_info.value.capacity == 48
+        assert 'exceeds bucket capacity' in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_migrates_existing_json_state() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    await redis.set(
+        provider_rate_limit_key(provider='tavily', org_id='org1'),
+        '{"tokens": 0.0, "last_refill": 100.0, "capacity": 2.0, "refill_per_second": 0.0333}',
     )
+
     assert not await take_provider_token(
         redis,
         provider='tavily',
-        org_id='org-a',
-        limit_per_minute=1,
-        now_seconds=200.0,
+        org_id='org1',
+        limit_per_minute=2,
+        borrow_reserve_fraction=1.0,
+        now_seconds=110.0,
     )
     assert await take_provider_token(
         redis,
         provider='tavily',
-        org_id='org-b',
-        limit_per_minute=1,
-        now_seconds=200.0,
+        org_id='org1',
+        limit_per_minute=2,
+        borrow_reserve_fraction=1.0,
+        now_seconds=131.0,
     )
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from finops_api.config import get_settings
+from finops_api.providers.base import ProviderError
+from finops_api.services.circuit_breaker import (
+    acquire_circuit,
+    call_with_circuit,
+    circuit_keys,
+    is_provider_failure,
+    record_circuit_failure,
+    record_circuit_success,
+)
+from finops_api.services.ingestion_pipeline import _call_provider
+from finops_api.services.rate_limit import (
+    provider_global_rate_limit_key,
+    provider_rate_limit_key,
+)
+
+
+async def _fail(redis: fakeredis.FakeAsyncRedis) -> None:
+    await record_circuit_failure(
+        redis,
+        provider='tavily',
+        failure_threshold=2,
+        window_seconds=60,
+        open_seconds=30,
+    )
+
+
+async def _acquire(redis: fakeredis.FakeAsyncRedis) -> bool:
+    return await acquire_circuit(redis, provider='tavily', failure_threshold=2, open_seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_threshold_and_fails_fast() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    await _fail(redis)
+    await _acquire(redis)
+
+    await _fail(redis)
+    with pytest.raises(ProviderError) as exc:
+        await _acquire(redis)
+    assert exc.value.circuit_open
+    assert exc.value.retry_after_seconds == 30.0
+
+
+@pytest.mark.asyncio
+async def test_half_open_allows_single_probe_and_closes_on_success() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    await _fail(redis)
+    await _fail(redis)
+    _, open_key, _ = circuit_keys('tavily')
+    await redis.delete(open_key)
+
+    await _acquire(redis)
+    with pytest.raises(ProviderError) as exc:
+        await _acquire(redis)
+    assert exc.value.circuit_open
+
+    await record_circuit_success(redis, provider='tavily')
+    await _acquire(redis)
+    await _acquire(redis)
+
+
+def test_only_transient_failures_trip_the_circuit() -> None:
+    transient = ProviderError('timeout', code='provider_timeout', retryable=True)
+    exhausted = ProviderError('exhausted', code='provider_retries_exhausted')
+    exhausted.__cause__ = transient
+    rejected = ProviderError('bad request', code='provider_request_failed', http_status=400)
+
+    assert is_provider_failure(exhausted)
+    assert not is_provider_failure(rejected)
+    assert not is_provider_failure(ProviderError('open', code='provider_circuit_open'))
+
+
+@pytest.mark.asyncio
+async def test_probe_is_released_when_it_raises_a_non_provider_error(monkeypatch) -> None:
+    monkeypatch.setenv('PROVIDER_CIRCUIT_FAILURE_THRESHOLD', '2')
+    get_settings.cache_clear()
+    redis = fakeredis.FakeAsyncRedis()
+    await _fail(redis)
+    await _fail(redis)
+    _, open_key, probe_key = circuit_keys('tavily')
+    await redis.delete(open_key)
+
+    async def broken() -> None:
+        raise RuntimeError('unexpected payload')
+
+    try:
+        with pytest.raises(RuntimeError):
+            await call_with_circuit(redis, provider='tavily', call=broken)
+    finally:
+        get_settings.cache_clear()
+
+    assert not await redis.exists(probe_key)
+    assert await _acquire(redis)
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_rejects_calls_before_spending_tokens() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    _, open_key, _ = circuit_keys('tavily')
+    await redis.set(open_key, '1', ex=30)
+    org_id = uuid4()
+    calls: list[str] = []
+
+    async def call() -> str:
+        calls.append('called')
+        return 'ok'
+
+    with pytest.raises(ProviderError) as exc_info:
+        await _call_provider(redis, provider='tavily', org_id=org_id, tokens=1, call=call)
+
+    assert exc_info.value.circuit_open
+    assert calls == []
+    assert not await redis.exists(
+        provider_rate_limit_key(provider='tavily', org_id=str(org_id)),
+        provider_global_rate_limit_key(provider='tavily'),
+    )
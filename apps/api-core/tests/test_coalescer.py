@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable
+from typing import cast
+from uuid import UUID, uuid4
+
+import fakeredis
+import httpx
+import pytest
+
+from finops_api.config import get_settings
+from finops_api.providers.alphavantage.client import AlphaVantageAdapter
+from finops_api.providers.base import ProviderError, ProviderResponse
+from finops_api.providers.twelvedata.client import TwelveDataAdapter
+from finops_api.services import ingestion_pipeline
+from finops_api.services.coalescer import (
+    CoalescedBatch,
+    QuoteCoalescer,
+    get_quote_coalescer,
+    split_quote_batch,
+)
+from finops_api.services.rate_limit import provider_rate_limit_key
+
+
+def _quote(symbol: str, close: str = '189.25') -> dict[str, object]:
+    return {
+        'symbol': symbol,
+        'close': close,
+        'percent_change': '0.5',
+        'datetime': '2026-10-19 13:30:00',
+    }
+
+
+@pytest.mark.asyncio
+async def test_coalescer_groups_symbols_by_tenant_into_one_batch() -> None:
+    calls: list[dict[str, list[str]]] = []
+    throttled = ProviderError('no budget', code='provider_rate_limited', retry_after_seconds=4.0)
+
+    async def fetch_batch(symbols_by_tenant: dict[str, list[str]]) -> CoalescedBatch:
+        calls.append(symbols_by_tenant)
+        return CoalescedBatch(
+            payload={
+                'quotes': [_quote('AAPL'), _quote('msft')],
+                'errors': {'NOPE': 'symbol not found'},
+            },
+            rejected={('org-b', 'TSLA'): throttled},
+        )
+
+    coalescer = QuoteCoalescer(window_seconds=0.01)
+    results = await asyncio.gather(
+        coalescer.fetch('twelvedata', 'MSFT', fetch_batch, tenant='org-a'),
+        coalescer.fetch('twelvedata', 'AAPL', fetch_batch, tenant='org-a'),
+        coalescer.fetch('twelvedata', 'AAPL', fetch_batch, tenant='org-b'),
+        coalescer.fetch('twelvedata', 'NOPE', fetch_batch, tenant='org-a'),
+        coalescer.fetch('twelvedata', 'TSLA', fetch_batch, tenant='org-b'),
+        return_exceptions=True,
+    )
+
+    assert calls == [{'org-a': ['AAPL', 'MSFT', 'NOPE'], 'org-b': ['AAPL', 'TSLA']}]
+    assert results[0] == _quote('msft')
+    assert results[1] == results[2] == _quote('AAPL')
+    assert isinstance(results[3], ProviderError)
+    assert 'symbol not found' in str(results[3])
+    assert results[4] is throttled
+
+
+@pytest.mark.asyncio
+async def test_coalescer_fails_every_waiter_and_flushes_full_batches() -> None:
+    calls: list[dict[str, list[str]]] = []
+
+    async def failing(symbols_by_tenant: dict[str, list[str]]) -> CoalescedBatch:
+        calls.append(symbols_by_tenant)
+        raise ProviderError('upstream down', code='provider_request_failed', retryable=True)
+
+    coalescer = QuoteCoalescer(window_seconds=60)
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            coalescer.fetch('twelvedata', 'IBM', failing, tenant='org-a', max_symbols=2),
+            coalescer.fetch('twelvedata', 'IBM', failing, tenant='org-b', max_symbols=2),
+            coalescer.fetch('twelvedata', 'AAPL', failing, tenant='org-a', max_symbols=2),
+            return_exceptions=True,
+        ),
+        timeout=1,
+    )
+
+    assert calls == [{'org-a': ['AAPL', 'IBM'], 'org-b': ['IBM']}]
+    assert all(isinstance(result, ProviderError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_quote_refreshes_share_one_batched_provider_call(monkeypatch) -> None:
+    batch_requests: list[dict[str, object]] = []
+
+    class FakeMarketProvider(TwelveDataAdapter):
+        async def get_quote_batch(
+            self,
+            *,
+            idempotency_key: str,  # noqa: ARG002
+            request_payload: dict[str, object],
+        ) -> ProviderResponse:
+            batch_requests.append(request_payload)
+            return ProviderResponse(
+                http_status=200,
+                provider_request_id=None,
+                payload={'quotes': [_quote('AAPL'), _quote('MSFT', '420.10')], 'errors': {}},
+            )
+
+    async def no_tokens(*_: object, **__: object) -> None:
+        return None
+
+    monkeypatch.setenv('QUOTE_COALESCE_WINDOW_SECONDS', '0.01')
+    monkeypatch.setenv('TWELVE_DATA_API_KEY', 'test-key')
+    get_settings.cache_clear()
+    get_quote_coalescer.cache_clear()
+    monkeypatch.setattr(
+        ingestion_pipeline,
+        'get_market_data_provider',
+        lambda _: FakeMarketProvider(),
+    )
+    monkeypatch.setattr(ingestion_pipeline, '_take_provider_tokens', no_tokens)
+    redis = fakeredis.FakeAsyncRedis()
+    try:
+        payloads = await asyncio.gather(
+            *(
+                ingestion_pipeline._fetch_provider_payload(
+                    provider='twelvedata',
+                    resource='market_quote_refresh',
+                    idempotency_key=f'quote-{symbol}',
+                    request_payload={'symbol': symbol},
+                    org_id=uuid4(),
+                    redis_client=redis,
+                )
+                for symbol in ('aapl', 'MSFT', 'AAPL')
+            )
+        )
+    finally:
+        get_settings.cache_clear()
+        get_quote_coalescer.cache_clear()
+
+    assert batch_requests == [{'symbols': ['AAPL', 'MSFT']}]
+    rows = [
+        ingestion_pipeline._normalize_rows(
+            resource='market_quote_refresh',
+            provider='twelvedata',
+            payload=payload,
+            request_payload={},
+        )
+        for payload in payloads
+    ]
+    assert [[row['symbol'] for row in batch] for batch in rows] == [['AAPL'], ['MSFT'], ['AAPL']]
+    assert float(str(rows[1][0]['price'])) == 420.10
+
+
+@pytest.mark.asyncio
+async def test_lone_alphavantage_quote_skips_coalescing(monkeypatch) -> None:
+    functions: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        functions.append(request.url.params.get('function'))
+        return httpx.Response(
+            200,
+            json={'Global Quote': {'01. symbol': 'IBM', '05. price': '251.10'}},
+        )
+
+    async def no_tokens(*_: object, **__: object) -> None:
+        return None
+
+    monkeypatch.setenv('ALPHA_VANTAGE_API_KEY', 'test-key')
+    monkeypatch.setenv('QUOTE_COALESCE_WINDOW_SECONDS', '0.01')
+    get_settings.cache_clear()
+    get_quote_coalescer.cache_clear()
+    monkeypatch.setattr(
+        ingestion_pipeline,
+        'get_market_data_provider',
+        lambda _: AlphaVantageAdapter(transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(ingestion_pipeline, '_take_provider_tokens', no_tokens)
+    try:
+        payload = await ingestion_pipeline._fetch_provider_payload(
+            provider='alphavantage',
+            resource='market_quote_refresh',
+            idempotency_key='quote-IBM',
+            request_payload={'symbol': 'IBM'},
+            org_id=uuid4(),
+            redis_client=fakeredis.FakeAsyncRedis(),
+        )
+    finally:
+        get_settings.cache_clear()
+        get_quote_coalescer.cache_clear()
+
+    assert functions == ['GLOBAL_QUOTE']
+    assert 'Global Quote' in payload
+
+
+@pytest.mark.asyncio
+async def test_coalesced_quotes_bill_each_org_and_defer_orgs_without_budget(
+    monkeypatch,
+) -> None:
+    batch_requests: list[tuple[str, dict[str, object]]] = []
+
+    class FakeMarketProvider(TwelveDataAdapter):
+        async def get_quote_batch(
+            self,
+            *,
+            idempotency_key: str,
+            request_payload: dict[str, object],
+        ) -> ProviderResponse:
+            batch_requests.append((idempotency_key, request_payload))
+            symbols = cast(list[str], request_payload['symbols'])
+            return ProviderResponse(
+                http_status=200,
+                provider_request_id=None,
+                payload={'quotes': [_quote(symbol) for symbol in symbols], 'errors': {}},
+            )
+
+    monkeypatch.setenv('QUOTE_COALESCE_WINDOW_SECONDS', '0.01')
+    monkeypatch.setenv('TWELVE_DATA_API_KEY', 'test-key')
+    monkeypatch.setenv('TWELVEDATA_RATE_LIMIT_PER_MINUTE', '60')
+    monkeypatch.setenv('RATE_LIMIT_DEFAULT_TENANT_SHARE', '0.25')
+    monkeypatch.setenv('RATE_LIMIT_BORROW_RESERVE_FRACTION', '0.2')
+    get_settings.cache_clear()
+    get_quote_coalescer.cache_clear()
+    monkeypatch.setattr(
+        ingestion_pipeline,
+        'get_market_data_provider',
+        lambda _: FakeMarketProvider(),
+    )
+    redis = fakeredis.FakeAsyncRedis()
+    drained, funded = uuid4(), uuid4()
+
+    def refresh(org_id: UUID, symbol: str) -> Awaitable[dict[str, object]]:
+        return ingestion_pipeline._fetch_provider_payload(
+            provider='twelvedata',
+            resource='market_quote_refresh',
+            idempotency_key=f'quote-{org_id}-{symbol}',
+            request_payload={'symbol': symbol},
+            org_id=org_id,
+            redis_client=redis,
+        )
+
+    try:
+        await ingestion_pipeline._take_provider_tokens(
+            redis,
+            provider='twelvedata',
+            org_id=drained,
+            count=48,
+        )
+        results = await asyncio.gather(
+            refresh(drained, 'AAPL'),
+            refresh(funded, 'MSFT'),
+            refresh(funded, 'NVDA'),
+            return_exceptions=True,
+        )
+    finally:
+        get_settings.cache_clear()
+        get_quote_coalescer.cache_clear()
+
+    assert [request for _, request in batch_requests] == [{'symbols': ['MSFT', 'NVDA']}]
+    assert batch_requests[0][0].startswith('coalesced:')
+    assert isinstance(results[0], ProviderError)
+    assert results[0].code == 'provider_rate_limited'
+    assert ingestion_pipeline._throttle_delay(results[0]) is not None
+    assert [split_quote_batch(cast(dict[str, object], result)) for result in results[1:]] == [
+        {'MSFT': _quote('MSFT')},
+        {'NVDA': _quote('NVDA')},
+    ]
+    funded_bucket = json.loads(
+        await redis.get(provider_rate_limit_key(provider='twelvedata', org_id=str(funded)))
+    )
+    assert funded_bucket['tokens'] == pytest.approx(13.0)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from finops_api.hashing import canonical_json, stable_hash
+from finops_api.providers.tavily.dto import TavilySearchResult
+from finops_api.providers.tavily.mapper import to_canonical_news_item
+from finops_api.services.cache import get_cached_entry, set_cached_payload, stable_payload_hash
+
+
+def _legacy_hash(value: object) -> str:
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@pytest.mark.parametrize(
+    'payload',
+    [
+        {},
+        {'query': 'nvda', 'max_results': 5},
+        {'b': [1, 2.5, None, True], 'a': {'z': 'Zürich €', 'y': ['☃']}},
+        {'values': [{'close': '189.25', 'datetime': '2026-02-09'}] * 3, 'meta': {'symbol': 'X'}},
+    ],
+)
+def test_stable_hash_matches_legacy_json_dumps_hash(payload: dict[str, object]) -> None:
+    assert canonical_json(payload) == json.dumps(
+        payload, sort_keys=True, separators=(',', ':')
+    ).encode('utf-8')
+    assert stable_hash(payload) == _legacy_hash(payload)
+    assert stable_payload_hash(payload) == _legacy_hash(payload)
+
+
+def test_news_document_hash_is_unchanged() -> None:
+    result = TavilySearchResult.model_validate(
+        {'title': ' NVDA rallies ', 'url': 'https://example.com/a', 'content': 'Body '}
+    )
+    expected = _legacy_hash(
+        {
+            'url': 'https://example.com/a',
+            'title': 'NVDA rallies',
+            'content': 'Body',
+            'published_date': None,
+        }
+    )
+    assert to_canonical_news_item(result).document_hash == expected
+
+
+@pytest.mark.asyncio
+async def test_local_cache_hits_reuse_content_hash() -> None:
+    class Redis:
+        def __init__(self) -> None:
+            self.store: dict[str, bytes] = {}
+
+        async def get(self, key: str) -> bytes | None:
+            return self.store.get(key)
+
+        async def set(self, key: str, value: bytes, ex: int) -> None:  # noqa: ARG002
+            self.store[key] = value
+
+        async def pttl(self, key: str) -> int:
+            return 300_000 if key in self.store else -2
+
+        async def publish(self, channel: str, message: str) -> int:  # noqa: ARG002
+            return 0
+
+    redis = Redis()
+    await set_cached_payload(redis, key='k', payload={'q': 'x'}, ttl_seconds=300)
+
+    first = await get_cached_entry(redis, 'k')
+    assert first is not None
+    assert first.content_hash == _legacy_hash({'q': 'x'})
+    second = await get_cached_entry(redis, 'k')
+    assert second is not None
+    assert second.cached_hash == first.content_hash
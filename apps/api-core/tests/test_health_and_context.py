@@ -1,8 +1,18 @@
 from fastapi.testclient import TestClient
 
+from finops_api.dependencies import get_arq_pool
 from finops_api.main import app
 
 
+class FakeArqPool:
+    async def ping(self) -> bool:
+        return True
+
+
+async def override_arq_pool() -> FakeArqPool:
+    return FakeArqPool()
+
+
 def test_live_health() -> None:
     client = TestClient(app)
     response = client.get('/health/live')
@@ -11,14 +21,18 @@ def test_live_health() -> None:
 
 
 def test_ready_health_has_component_checks() -> None:
+    app.dependency_overrides[get_arq_pool] = override_arq_pool
     client = TestClient(app)
-    response = client.get('/health/ready')
+    try:
+        response = client.get('/health/ready')
+    finally:
+        app.dependency_overrides.clear()
     assert response.status_code == 200
     body = response.json()
     assert body['status'] in {'ready', 'degraded'}
     assert 'checks' in body
     assert 'database' in body['checks']
-    assert 'redis' in body['checks']
+    assert body['checks']['redis'] is True
 
 
 def test_context_requires_org_header() -> None:
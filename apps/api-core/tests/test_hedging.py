@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from finops_api.providers.base import ProviderError
+from finops_api.services.hedging import hedge_search_payload, hedged_first
+from finops_api.services.latency import LatencyTracker
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_never_starts_hedge() -> None:
+    hedge_started = False
+
+    async def primary() -> str:
+        return 'primary'
+
+    async def secondary() -> str:
+        nonlocal hedge_started
+        hedge_started = True
+        return 'secondary'
+
+    assert await hedged_first(primary, secondary, hedge_after_seconds=0.5) == ('primary', 0)
+    assert not hedge_started
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_loses_to_hedge_and_is_cancelled() -> None:
+    primary_cancelled = False
+
+    async def primary() -> str:
+        nonlocal primary_cancelled
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            primary_cancelled = True
+            raise
+        return 'primary'
+
+    async def secondary() -> str:
+        return 'secondary'
+
+    assert await hedged_first(primary, secondary, hedge_after_seconds=0.01) == ('secondary', 1)
+    assert primary_cancelled
+
+
+@pytest.mark.asyncio
+async def test_failed_primary_fails_over_immediately() -> None:
+    async def primary() -> str:
+        raise ProviderError('primary down', retryable=True)
+
+    async def secondary() -> str:
+        return 'secondary'
+
+    assert await hedged_first(primary, secondary, hedge_after_seconds=5) == ('secondary', 1)
+
+
+@pytest.mark.asyncio
+async def test_both_failing_raises_primary_error() -> None:
+    async def primary() -> str:
+        raise ProviderError('primary down')
+
+    async def secondary() -> str:
+        raise ProviderError('secondary down')
+
+    with pytest.raises(ProviderError, match='primary down'):
+        await hedged_first(primary, secondary, hedge_after_seconds=0.01)
+
+
+def test_latency_tracker_percentile_requires_samples() -> None:
+    tracker = LatencyTracker(window=100)
+    assert tracker.percentile('tavily', 0.95) is None
+    for value in range(1, 101):
+        tracker.observe('tavily', value / 100)
+
+    assert tracker.percentile('tavily', 0.95) == 0.95
+    assert tracker.percentile('tavily', 0.95, min_samples=200) is None
+
+
+def test_hedge_search_payload_maps_query_and_limit() -> None:
+    assert hedge_search_payload({'query': 'nvda', 'max_results': 5}) == {
+        'query': 'nvda',
+        'q': 'nvda',
+        'max_results': 5,
+        'num': 5,
+    }
@@ -8,7 +8,8 @@ from uuid import UUID, uuid4
 from fastapi import Depends
 from fastapi.testclient import TestClient
 
-from finops_api.dependencies import get_org_id, get_tenant_session
+from finops_api.config import get_settings
+from finops_api.dependencies import get_arq_pool, get_org_id, get_tenant_session
 from finops_api.main import app
 
 
@@ -77,6 +78,18 @@ class FakeIngestionRepository:
         InMemoryStore.jobs[job.id] = job
         return job
 
+    async def create_many(
+        self,
+        org_id: UUID,
+        payloads: list[SimpleNamespace],
+    ) -> list[tuple[JobRecord, bool]]:
+        results = []
+        for payload in payloads:
+            existing = set(InMemoryStore.jobs)
+            job = await self.create(org_id, payload)
+            results.append((job, job.id not in existing))
+        return results
+
     async def get(self, *, org_id: UUID, job_id: UUID) -> JobRecord | None:
         job = InMemoryStore.jobs.get(job_id)
         if job is None:
@@ -113,7 +126,7 @@ class FakeMarketRepository:
         return InMemoryStore.market_quote_counts.get(job_id, 0)
 
 
-async def fake_enqueue_ingestion_job(*, job_id: UUID, org_id: UUID) -> None:  # noqa: ARG001
+async def fake_enqueue_ingestion_job(_: object, *, job_id: UUID, **__: object) -> None:
     job = InMemoryStore.jobs[job_id]
     job.status = 'completed'
     job.attempt_count = 1
@@ -133,6 +146,10 @@ async def override_tenant_session(org_id: UUID = Depends(get_org_id)):
     yield DummySession(org_id=org_id)
 
 
+async def override_arq_pool() -> object:
+    return object()
+
+
 def test_ingestion_post_then_get_with_mocked_provider(monkeypatch) -> None:
     InMemoryStore.jobs.clear()
     InMemoryStore.raw_counts.clear()
@@ -159,6 +176,7 @@ def test_ingestion_post_then_get_with_mocked_provider(monkeypatch) -> None:
     )
 
     app.dependency_overrides[get_tenant_session] = override_tenant_session
+    app.dependency_overrides[get_arq_pool] = override_arq_pool
     try:
         client = TestClient(app)
         headers = {'X-Org-Id': '00000000-0000-0000-0000-000000000001'}
@@ -222,6 +240,7 @@ def test_ingestion_post_then_get_with_serper_provider(monkeypatch) -> None:
     )
 
     app.dependency_overrides[get_tenant_session] = override_tenant_session
+    app.dependency_overrides[get_arq_pool] = override_arq_pool
     try:
         client = TestClient(app)
         headers = {'X-Org-Id': '00000000-0000-0000-0000-000000000001'}
@@ -278,6 +297,7 @@ def test_ingestion_post_then_get_with_serpapi_provider(monkeypatch) -> None:
     )
 
     app.dependency_overrides[get_tenant_session] = override_tenant_session
+    app.dependency_overrides[get_arq_pool] = override_arq_pool
     try:
         client = TestClient(app)
         headers = {'X-Org-Id': '00000000-0000-0000-0000-000000000001'}
@@ -334,6 +354,7 @@ def test_ingestion_get_enforces_tenant_isolation(monkeypatch) -> None:
     )
 
     app.dependency_overrides[get_tenant_session] = override_tenant_session
+    app.dependency_overrides[get_arq_pool] = override_arq_pool
     try:
         client = TestClient(app)
 
@@ -385,6 +406,7 @@ def test_ingestion_market_timeseries_job_counts(monkeypatch) -> None:
     )
 
     app.dependency_overrides[get_tenant_session] = override_tenant_session
+    app.dependency_overrides[get_arq_pool] = override_arq_pool
     try:
         client = TestClient(app)
         headers = {'X-Org-Id': '00000000-0000-0000-0000-000000000001'}
@@ -432,6 +454,7 @@ def test_ingestion_market_quote_job_counts_for_alphavantage(monkeypatch) -> None
     )
 
     app.dependency_overrides[get_tenant_session] = override_tenant_session
+    app.dependency_overrides[get_arq_pool] = override_arq_pool
     try:
         client = TestClient(app)
         headers = {'X-Org-Id': '00000000-0000-0000-0000-000000000001'}
@@ -451,3 +474,50 @@ def test_ingestion_market_quote_job_counts_for_alphavantage(monkeypatch) -> None
         assert data['normalized_record_count'] == 1
     finally:
         app.dependency_overrides.clear()
+
+
+def test_ingestion_batch_creates_jobs_once_and_enqueues_new_ones(monkeypatch) -> None:
+    InMemoryStore.jobs.clear()
+    enqueued: list[object] = []
+
+    async def fake_enqueue_many(_: object, jobs: list[object]) -> list[str]:
+        enqueued.extend(jobs)
+        return []
+
+    monkeypatch.setattr('finops_api.routers.ingestion.IngestionRepository', FakeIngestionRepository)
+    monkeypatch.setattr('finops_api.routers.ingestion.enqueue_many', fake_enqueue_many)
+
+    app.dependency_overrides[get_tenant_session] = override_tenant_session
+    app.dependency_overrides[get_arq_pool] = override_arq_pool
+    try:
+        client = TestClient(app)
+        headers = {'X-Org-Id': '00000000-0000-0000-0000-000000000001'}
+        specs = [
+            {
+                'provider': 'twelvedata',
+                'resource': 'market_quote_refresh',
+                'idempotency_key': f'batch-quote-{symbol}',
+                'payload': {'symbol': symbol},
+            }
+            for symbol in ('AAPL', 'MSFT', 'AAPL')
+        ]
+
+        response = client.post('/v1/ingestion/jobs:batch', headers=headers, json={'jobs': specs})
+        assert response.status_code == 200
+        items = response.json()['data']
+        assert [item['index'] for item in items] == [0, 1, 2]
+        assert [item['created'] for item in items] == [True, True, False]
+        assert items[0]['job']['id'] == items[2]['job']['id']
+        assert len(enqueued) == 2
+
+        again = client.post('/v1/ingestion/jobs:batch', headers=headers, json={'jobs': specs[:1]})
+        assert again.json()['data'][0]['created'] is False
+        assert len(enqueued) == 2
+
+        monkeypatch.setenv('INGESTION_BATCH_MAX_JOBS', '2')
+        get_settings.cache_clear()
+        too_many = client.post('/v1/ingestion/jobs:batch', headers=headers, json={'jobs': specs})
+        assert too_many.status_code == 400
+    finally:
+        get_settings.cache_clear()
+        app.dependency_overrides.clear()
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import cast
+from uuid import UUID, uuid4
+
+import fakeredis
+import httpx
+import pytest
+
+from finops_api.config import get_settings
+from finops_api.providers.base import ProviderResponse
+from finops_api.providers.twelvedata.client import TwelveDataAdapter
+from finops_api.services import ingestion_pipeline
+from finops_api.services.coalescer import get_quote_coalescer
+from finops_api.services.rate_limit import (
+    provider_global_rate_limit_key,
+    provider_rate_limit_key,
+)
+from finops_api.services.semaphore import provider_semaphore_key
+
+
+def _quote(symbol: str) -> dict[str, object]:
+    return {
+        'symbol': symbol,
+        'close': '189.25',
+        'percent_change': '0.5',
+        'datetime': '2026-10-19 13:30:00',
+    }
+
+
+def _job(org_id: UUID, symbol: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        org_id=org_id,
+        provider='twelvedata',
+        resource='market_quote_refresh',
+        idempotency_key=f'quote-{symbol}-{uuid4().hex}',
+        payload={'symbol': symbol},
+        status='queued',
+    )
+
+
+class FakeSession:
+    async def __aenter__(self) -> FakeSession:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+    async def execute(self, *_: object, **__: object) -> None:
+        return None
+
+
+def _install_fake_repositories(
+    monkeypatch,
+    *,
+    jobs: dict[UUID, SimpleNamespace],
+    stored: list[dict[str, object]],
+) -> None:
+    class FakeIngestionRepository:
+        def __init__(self, session: FakeSession) -> None:
+            self.session = session
+
+        async def get(self, *, org_id: UUID, job_id: UUID) -> SimpleNamespace | None:  # noqa: ARG002
+            return jobs.get(job_id)
+
+        async def mark_running(self, job: SimpleNamespace) -> None:
+            job.status = 'running'
+
+        async def mark_completed(self, job: SimpleNamespace) -> None:
+            job.status = 'completed'
+
+        async def mark_failed(self, job: SimpleNamespace, error: str) -> None:  # noqa: ARG002
+            job.status = 'failed'
+
+        async def mark_throttled(self, job: SimpleNamespace, error: str) -> None:  # noqa: ARG002
+            job.status = 'throttled'
+
+    class FakeRawPayloadRepository:
+        def __init__(self, session: FakeSession) -> None:
+            self.session = session
+
+        async def create(self, **_: object) -> SimpleNamespace:
+            return SimpleNamespace(id=uuid4())
+
+    class FakeMarketRepository:
+        def __init__(self, session: FakeSession) -> None:
+            self.session = session
+
+        async def upsert_quotes(self, *, rows: list[dict[str, object]], **_: object) -> int:
+            stored.extend(rows)
+            return len(rows)
+
+    monkeypatch.setattr(ingestion_pipeline, 'SessionLocal', FakeSession)
+    monkeypatch.setattr(ingestion_pipeline, 'IngestionRepository', FakeIngestionRepository)
+    monkeypatch.setattr(
+        ingestion_pipeline,
+        'IngestionRawPayloadRepository',
+        FakeRawPayloadRepository,
+    )
+    monkeypatch.setattr(ingestion_pipeline, 'MarketRepository', FakeMarketRepository)
+
+
+@pytest.mark.asyncio
+async def test_quote_jobs_flow_through_tokens_slot_single_flight_coalescer_and_cache(
+    monkeypatch,
+) -> None:
+    jobs: dict[UUID, SimpleNamespace] = {}
+    batch_requests: list[list[str]] = []
+    stored: list[dict[str, object]] = []
+
+    class StubMarketProvider(TwelveDataAdapter):
+        async def get_quote_batch(
+            self,
+            *,
+            idempotency_key: str,  # noqa: ARG002
+            request_payload: dict[str, object],
+        ) -> ProviderResponse:
+            symbols = cast(list[str], request_payload['symbols'])
+            batch_requests.append(symbols)
+            await asyncio.sleep(0.05)
+            return ProviderResponse(
+                http_status=200,
+                provider_request_id=None,
+                payload={'quotes': [_quote(symbol) for symbol in symbols], 'errors': {}},
+            )
+
+    monkeypatch.setenv('QUOTE_COALESCE_WINDOW_SECONDS', '0.02')
+    monkeypatch.setenv('PROVIDER_CONCURRENCY_LIMIT', '1')
+    monkeypatch.setenv('PROVIDER_SINGLE_FLIGHT_POLL_SECONDS', '0.01')
+    monkeypatch.setenv('TWELVEDATA_RATE_LIMIT_PER_MINUTE', '60')
+    monkeypatch.setenv('TWELVE_DATA_API_KEY', 'test-key')
+    get_settings.cache_clear()
+    get_quote_coalescer.cache_clear()
+    _install_fake_repositories(monkeypatch, jobs=jobs, stored=stored)
+    monkeypatch.setattr(
+        ingestion_pipeline,
+        'get_market_data_provider',
+        lambda _: StubMarketProvider(),
+    )
+    redis = fakeredis.FakeAsyncRedis()
+    first_org, second_org = uuid4(), uuid4()
+    concurrent = [_job(first_org, 'AAPL'), _job(second_org, 'AAPL'), _job(first_org, 'MSFT')]
+    late = _job(uuid4(), 'AAPL')
+    jobs.update({job.id: job for job in [*concurrent, late]})
+    try:
+        results = await asyncio.gather(
+            *(
+                ingestion_pipeline.process_ingestion_job(
+                    job_id=job.id,
+                    org_id=job.org_id,
+                    redis_client=redis,
+                )
+                for job in concurrent
+            )
+        )
+        late_result = await ingestion_pipeline.process_ingestion_job(
+            job_id=late.id,
+            org_id=late.org_id,
+            redis_client=redis,
+        )
+    finally:
+        get_settings.cache_clear()
+        get_quote_coalescer.cache_clear()
+
+    assert batch_requests == [['AAPL', 'MSFT']]
+    assert [result['status'] for result in results] == ['completed'] * 3
+    assert sorted(result['cache_hit'] for result in results) == [False, False, True]
+    assert late_result['cache_hit'] is True
+    assert {job.status for job in jobs.values()} == {'completed'}
+    assert [row['symbol'] for row in stored].count('AAPL') == 3
+    assert await redis.exists(provider_global_rate_limit_key(provider='twelvedata'))
+    assert await redis.zcard(provider_semaphore_key('twelvedata')) == 0
+
+
+@pytest.mark.asyncio
+async def test_large_quote_batch_is_ingested_in_budget_sized_windows(monkeypatch) -> None:
+    symbols = [f'S{index:03d}' for index in range(120)]
+    requested: list[list[str]] = []
+    stored: list[dict[str, object]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        chunk = request.url.params['symbol'].split(',')
+        requested.append(chunk)
+        return httpx.Response(200, json={symbol: _quote(symbol) for symbol in chunk})
+
+    monkeypatch.setenv('TWELVE_DATA_API_KEY', 'test-key')
+    monkeypatch.setenv('TWELVEDATA_RATE_LIMIT_PER_MINUTE', '60')
+    monkeypatch.setenv('RATE_LIMIT_DEFAULT_TENANT_SHARE', '0.25')
+    monkeypatch.setenv('RATE_LIMIT_BORROW_RESERVE_FRACTION', '0.2')
+    get_settings.cache_clear()
+    adapter = TwelveDataAdapter(transport=httpx.MockTransport(handler))
+    org_id = uuid4()
+    job = SimpleNamespace(
+        id=uuid4(),
+        org_id=org_id,
+        provider='twelvedata',
+        resource='market_quote_batch_refresh',
+        idempotency_key='batch-120',
+        payload={'symbols': symbols},
+        status='queued',
+    )
+    _install_fake_repositories(monkeypatch, jobs={job.id: job}, stored=stored)
+    monkeypatch.setattr(ingestion_pipeline, 'get_market_data_provider', lambda _: adapter)
+    redis = fakeredis.FakeAsyncRedis()
+    results: list[dict[str, object]] = []
+    try:
+        while job.status != 'completed' and len(results) < 5:
+            results.append(
+                await ingestion_pipeline.process_ingestion_job(
+                    job_id=job.id,
+                    org_id=org_id,
+                    redis_client=redis,
+                )
+            )
+            await redis.delete(
+                provider_rate_limit_key(provider='twelvedata', org_id=str(org_id)),
+                provider_global_rate_limit_key(provider='twelvedata'),
+            )
+    finally:
+        get_settings.cache_clear()
+
+    assert [result['status'] for result in results] == ['throttled', 'throttled', 'completed']
+    assert all(
+        0 < float(str(result['retry_after_seconds'])) < 60
+        for result in results
+        if result['status'] == 'throttled'
+    )
+    assert [len(chunk) for chunk in requested] == [48, 48, 24]
+    assert sorted(symbol for chunk in requested for symbol in chunk) == symbols
+    assert results[-1]['normalized_count'] == 120
+    assert {row['symbol'] for row in stored} == set(symbols)
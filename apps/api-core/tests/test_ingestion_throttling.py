@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from finops_api import tasks
+from finops_api.providers.base import ProviderError
+from finops_api.providers.retry import retries_exhausted_error
+from finops_api.services.ingestion_pipeline import _throttle_delay
+
+
+class FakeArqRedis:
+    def __init__(self) -> None:
+        self.enqueued: list[tuple[str, dict[str, Any], dict[str, Any]]] = []
+
+    async def enqueue_job(self, function: str, *args: Any, **kwargs: Any) -> None:
+        self.enqueued.append((function, args[0], kwargs))
+
+
+def test_throttle_delay_only_for_rate_limit_and_open_circuit() -> None:
+    rate_limited = ProviderError(
+        'Provider rate limit exceeded for alphavantage',
+        code='provider_rate_limited',
+        retry_after_seconds=12.5,
+    )
+    circuit_open = ProviderError(
+        'Circuit open for provider tavily',
+        code='provider_circuit_open',
+        retry_after_seconds=30.0,
+    )
+    unbounded = ProviderError('too many tokens', code='provider_rate_limited')
+    rejected = ProviderError('bad request', code='provider_request_failed')
+    upstream_429 = retries_exhausted_error(
+        'exhausted',
+        provider='twelvedata',
+        last_exception=ProviderError(
+            'TwelveData transient error: 429',
+            code='provider_transient_error',
+            http_status=429,
+            retryable=True,
+            retry_after_seconds=60.0,
+        ),
+    )
+    upstream_500 = retries_exhausted_error(
+        'exhausted',
+        provider='twelvedata',
+        last_exception=ProviderError(
+            'TwelveData transient error: 500',
+            code='provider_transient_error',
+            http_status=500,
+            retryable=True,
+            retry_after_seconds=60.0,
+        ),
+    )
+
+    assert _throttle_delay(rate_limited) == 12.5
+    assert _throttle_delay(circuit_open) == 30.0
+    assert _throttle_delay(unbounded) is None
+    assert _throttle_delay(rejected) is None
+    assert _throttle_delay(upstream_429) == 60.0
+    assert _throttle_delay(upstream_500) is None
+
+
+@pytest.mark.asyncio
+async def test_throttled_job_is_deferred_until_bucket_refills(monkeypatch) -> None:
+    job_id = uuid4()
+    org_id = uuid4()
+
+    async def fake_process(*, job_id: UUID, org_id: UUID, redis_client: Any) -> dict[str, object]:  # noqa: ARG001
+        return {
+            'status': 'throttled',
+            'job_id': str(job_id),
+            'resource': 'market_timeseries_backfill',
+            'normalized_count': 0,
+            'cache_hit': False,
+            'retry_after_seconds': 12.5,
+        }
+
+    monkeypatch.setattr(tasks, 'process_ingestion_job', fake_process)
+    redis = FakeArqRedis()
+
+    result = await tasks.run_ingestion_job(
+        {'redis': redis},
+        {'job_id': str(job_id), 'org_id': str(org_id)},
+    )
+
+    assert result['status'] == 'throttled'
+    function, payload, options = redis.enqueued[0]
+    assert function == 'run_ingestion_job'
+    assert payload == {'job_id': str(job_id), 'org_id': str(org_id)}
+    assert options['_defer_by'] == timedelta(seconds=12.5)
+    assert options['_queue_name'] == 'q.agent.bulk'
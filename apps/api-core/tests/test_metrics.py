@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+
+import fakeredis
+import httpx
+import pytest
+
+from finops_api.config import get_settings
+from finops_api.metrics import (
+    FetchStats,
+    flush_metrics,
+    load_metrics,
+    measure_fetch,
+    metrics,
+    observe_cache_lookup,
+    render_metrics,
+)
+from finops_api.providers.twelvedata.client import TwelveDataAdapter
+
+
+@pytest.mark.asyncio
+async def test_adapter_attempts_are_recorded_and_flushed() -> None:
+    os.environ['TWELVE_DATA_API_KEY'] = 'test-key'
+    get_settings.cache_clear()
+    metrics.drain()
+    calls = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(503, json={})
+        return httpx.Response(
+            200,
+            json={'symbol': 'AAPL', 'close': '189.25', 'datetime': '2026-02-09T10:00:00Z'},
+        )
+
+    adapter = TwelveDataAdapter(
+        backoff_seconds=0.001,
+        transport=httpx.MockTransport(handler),
+    )
+    stats = FetchStats()
+    await measure_fetch(
+        stats,
+        lambda: adapter.get_quote(idempotency_key='idem-m-1', request_payload={'symbol': 'AAPL'}),
+    )
+    observe_cache_lookup(provider='twelvedata', resource='market_quote_refresh', hit=False)
+
+    assert stats.fetch_latency_ms is not None
+    assert stats.response_bytes is not None and stats.response_bytes > 0
+
+    redis = fakeredis.FakeAsyncRedis()
+    await flush_metrics(redis)
+    values = await load_metrics(redis)
+    labels = 'endpoint="/quote",provider="twelvedata"'
+    assert values[f'finops_provider_attempts_total{{{labels},status="503"}}'] == 1.0
+    assert values[f'finops_provider_attempts_total{{{labels},status="200"}}'] == 1.0
+    assert values[f'finops_provider_retries_total{{{labels}}}'] == 1.0
+    assert values[f'finops_provider_request_duration_seconds_count{{{labels}}}'] == 2.0
+    assert values[f'finops_provider_response_bytes_count{{{labels}}}'] == 2.0
+
+    text = render_metrics(values)
+    assert '# TYPE finops_provider_request_duration_seconds histogram' in text
+    assert '# TYPE finops_ingestion_cache_lookups_total counter' in text
+    assert (
+        'finops_ingestion_cache_lookups_total{provider="twelvedata",'
+        'resource="market_quote_refresh",result="miss"} 1.0'
+    ) in text
+
+
+def test_histogram_buckets_render_in_order() -> None:
+    metrics.drain()
+    metrics.observe('finops_provider_request_duration_seconds', {'provider': 'x'}, 0.3, (0.1, 1.0))
+    lines = render_metrics(metrics.drain()).splitlines()
+    assert lines == [
+        '# TYPE finops_provider_request_duration_seconds histogram',
+        'finops_provider_request_duration_seconds_bucket{le="1.0",provider="x"} 1.0',
+        'finops_provider_request_duration_seconds_bucket{le="+Inf",provider="x"} 1.0',
+        'finops_provider_request_duration_seconds_count{provider="x"} 1.0',
+        'finops_provider_request_duration_seconds_sum{provider="x"} 0.3',
+    ]
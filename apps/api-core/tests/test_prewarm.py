@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+from finops_api.config import get_settings
+from finops_api.schemas.ingestion import IngestionJobCreate
+from finops_api.services import prewarm
+from finops_api.services.prewarm import (
+    WATCHLIST_ORGS_KEY,
+    build_prewarm_jobs,
+    prewarm_cron_schedule,
+    prewarm_org_watchlist,
+    prewarm_request_interval_seconds,
+)
+from finops_api.services.queue import QueuedJob
+
+WINDOW = datetime(2026, 10, 19, 13, 20, tzinfo=UTC)
+
+
+def _entry(provider: str, symbol: str, timeframe: str = '1day') -> SimpleNamespace:
+    return SimpleNamespace(provider=provider, symbol=symbol, timeframe=timeframe)
+
+
+class FakeSession:
+    async def __aenter__(self) -> FakeSession:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+    async def execute(self, *_: object, **__: object) -> None:
+        return None
+
+
+class FakeArqRedis:
+    def __init__(self) -> None:
+        self.members: set[str] = set()
+
+    async def srem(self, key: str, member: str) -> int:  # noqa: ARG002
+        self.members.discard(member)
+        return 1
+
+
+def test_cron_schedule_parses_and_validates_times() -> None:
+    assert prewarm_cron_schedule(['14:20', '13:20', '13:20', '9']) == [(9, 0), (13, 20), (14, 20)]
+    with pytest.raises(ValueError):
+        prewarm_cron_schedule(['25:00'])
+
+
+def test_build_prewarm_jobs_batches_quotes_only_for_batch_providers(monkeypatch) -> None:
+    monkeypatch.setenv('TWELVE_DATA_API_KEY', 'test-key')
+    get_settings.cache_clear()
+    try:
+        jobs = build_prewarm_jobs(
+            [
+                _entry('twelvedata', 'MSFT'),
+                _entry('twelvedata', 'AAPL'),
+                _entry('twelvedata', 'AAPL', '1h'),
+                _entry('alphavantage', 'IBM'),
+            ],
+            window=WINDOW,
+            org_id=uuid4(),
+        )
+    finally:
+        get_settings.cache_clear()
+
+    quotes = [job for job in jobs if job.resource == 'market_quote_batch_refresh']
+    bars = [job for job in jobs if job.resource == 'market_timeseries_backfill']
+    assert [(job.provider, job.payload['symbols']) for job in quotes] == [
+        ('twelvedata', ['AAPL', 'MSFT']),
+    ]
+    assert quotes[0].idempotency_key == 'prewarm:202610191320:quotes:0'
+    single = [job for job in jobs if job.resource == 'market_quote_refresh']
+    assert [(job.provider, job.payload) for job in single] == [
+        ('alphavantage', {'symbol': 'IBM'}),
+    ]
+    assert single[0].idempotency_key == 'prewarm:202610191320:quote:IBM'
+    assert len(bars) == 4
+    assert bars[2].payload == {'symbol': 'AAPL', 'interval': '1h', 'incremental': True}
+
+
+def test_build_prewarm_jobs_sizes_quote_batches_to_the_token_budget(monkeypatch) -> None:
+    monkeypatch.setenv('TWELVE_DATA_API_KEY', 'test-key')
+    monkeypatch.setenv('TWELVEDATA_RATE_LIMIT_PER_MINUTE', '60')
+    monkeypatch.setenv('RATE_LIMIT_DEFAULT_TENANT_SHARE', '0.25')
+    monkeypatch.setenv('RATE_LIMIT_BORROW_RESERVE_FRACTION', '0.2')
+    get_settings.cache_clear()
+    try:
+        jobs = build_prewarm_jobs(
+            [_entry('twelvedata', f'S{index:03d}') for index in range(120)],
+            window=WINDOW,
+            org_id=uuid4(),
+        )
+    finally:
+        get_settings.cache_clear()
+
+    quotes = [job for job in jobs if job.resource == 'market_quote_batch_refresh']
+    assert [len(job.payload['symbols']) for job in quotes] == [48, 48, 24]
+    assert [job.idempotency_key for job in quotes] == [
+        f'prewarm:202610191320:quotes:{index}' for index in range(3)
+    ]
+
+
+def test_request_interval_uses_tenant_budget(monkeypatch) -> None:
+    monkeypatch.setenv('ALPHAVANTAGE_RATE_LIMIT_PER_MINUTE', '20')
+    monkeypatch.setenv('RATE_LIMIT_DEFAULT_TENANT_SHARE', '0.5')
+    monkeypatch.setenv('WATCHLIST_PREWARM_BUDGET_FRACTION', '0.5')
+    get_settings.cache_clear()
+    try:
+        assert prewarm_request_interval_seconds('alphavantage', org_id=uuid4()) == 12.0
+    finally:
+        get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_enqueues_new_jobs_spaced_by_budget(monkeypatch) -> None:
+    org_id = uuid4()
+    created: list[IngestionJobCreate] = []
+
+    class FakeWatchlistRepository:
+        def __init__(self, session: FakeSession) -> None:
+            self.session = session
+
+        async def list(self, *, org_id: UUID) -> list[SimpleNamespace]:  # noqa: ARG002
+            return [_entry('alphavantage', 'IBM'), _entry('alphavantage', 'AAPL')]
+
+    class FakeIngestionRepository:
+        def __init__(self, session: FakeSession) -> None:
+            self.session = session
+
+        async def create_many(
+            self,
+            org_id: UUID,  # noqa: ARG002
+            payloads: list[IngestionJobCreate],
+        ) -> list[tuple[SimpleNamespace, bool]]:
+            results = []
+            for payload in payloads:
+                is_new = not payload.idempotency_key.endswith(':bars:IBM:1day')
+                if is_new:
+                    created.append(payload)
+                results.append((SimpleNamespace(id=uuid4()), is_new))
+            return results
+
+    monkeypatch.setattr(prewarm, 'SessionLocal', FakeSession)
+    monkeypatch.setattr(prewarm, 'WatchlistRepository', FakeWatchlistRepository)
+    monkeypatch.setattr(prewarm, 'IngestionRepository', FakeIngestionRepository)
+    monkeypatch.setattr(prewarm, 'prewarm_request_interval_seconds', lambda *_, **__: 10.0)
+    monkeypatch.setattr(prewarm, 'provider_request_count', lambda *_: 1)
+    enqueued_jobs: list[QueuedJob] = []
+
+    async def fake_enqueue_many(_: object, jobs: list[QueuedJob]) -> list[str]:
+        enqueued_jobs.extend(jobs)
+        return [uuid4().hex for _ in jobs]
+
+    monkeypatch.setattr(prewarm, 'enqueue_many', fake_enqueue_many)
+    redis = FakeArqRedis()
+
+    enqueued = await prewarm_org_watchlist(org_id=org_id, redis_client=redis, window=WINDOW)
+
+    assert enqueued == 3
+    assert [(job.resource, job.payload.get('symbol')) for job in created] == [
+        ('market_quote_refresh', 'AAPL'),
+        ('market_quote_refresh', 'IBM'),
+        ('market_timeseries_backfill', 'AAPL'),
+    ]
+    assert [job.defer_seconds for job in enqueued_jobs] == [0.0, 10.0, 20.0]
+    assert {job.function for job in enqueued_jobs} == {'run_ingestion_job'}
+
+
+@pytest.mark.asyncio
+async def test_prewarm_forgets_orgs_with_empty_watchlists(monkeypatch) -> None:
+    org_id = uuid4()
+
+    class EmptyWatchlistRepository:
+        def __init__(self, session: FakeSession) -> None:
+            self.session = session
+
+        async def list(self, *, org_id: UUID) -> list[SimpleNamespace]:  # noqa: ARG002
+            return []
+
+    monkeypatch.setattr(prewarm, 'SessionLocal', FakeSession)
+    monkeypatch.setattr(prewarm, 'WatchlistRepository', EmptyWatchlistRepository)
+    redis = FakeArqRedis()
+    redis.members.add(str(org_id))
+
+    assert await prewarm_org_watchlist(org_id=org_id, redis_client=redis, window=WINDOW) == 0
+    assert str(org_id) not in redis.members
+    assert WATCHLIST_ORGS_KEY == 'watchlist:orgs'
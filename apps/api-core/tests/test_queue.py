@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import fakeredis
+import pytest
+from arq.connections import ArqRedis
+from fakeredis.aioredis import FakeAsyncRedisConnection
+from redis.asyncio import ConnectionPool
+
+from finops_api.services.queue import (
+    DEFAULT_QUEUE_NAME,
+    QueuedJob,
+    enqueue_many,
+    ingestion_job,
+    lane_queue_name,
+    resource_queue_name,
+)
+from finops_api.worker import lane_worker_settings, weighted_lane_max_jobs
+
+
+def _arq_redis() -> ArqRedis:
+    pool = ConnectionPool(connection_class=FakeAsyncRedisConnection, server=fakeredis.FakeServer())
+    return ArqRedis(connection_pool=pool)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_many_writes_jobs_arq_can_read() -> None:
+    redis = _arq_redis()
+    job_id = uuid4()
+    org_id = uuid4()
+
+    ids = await enqueue_many(
+        redis,
+        [
+            QueuedJob('refresh_provider_cache', {'cache_key': 'k'}, defer_seconds=30),
+            ingestion_job(job_id=job_id, org_id=org_id, resource='market_quote_refresh'),
+            ingestion_job(job_id=job_id, org_id=org_id, resource='market_timeseries_backfill'),
+        ],
+    )
+
+    queued = {job.job_id: job for job in await redis.queued_jobs(queue_name=DEFAULT_QUEUE_NAME)}
+    realtime = await redis.queued_jobs(queue_name='q.agent.realtime')
+    bulk = await redis.queued_jobs(queue_name='q.agent.bulk')
+    assert list(queued) == [ids[0]]
+    assert [job.job_id for job in realtime] == [ids[1]]
+    assert [job.job_id for job in bulk] == [ids[2]]
+    assert realtime[0].function == 'run_ingestion_job'
+    assert realtime[0].args == ({'job_id': str(job_id), 'org_id': str(org_id)},)
+    assert queued[ids[0]].score - realtime[0].score == 30_000
+
+
+@pytest.mark.asyncio
+async def test_enqueue_many_keeps_existing_job_for_explicit_id() -> None:
+    redis = _arq_redis()
+
+    await enqueue_many(redis, [QueuedJob('f', {'attempt': 1}, job_id='fixed')])
+    await enqueue_many(redis, [QueuedJob('f', {'attempt': 2}, job_id='fixed')])
+
+    queued = await redis.queued_jobs(queue_name=DEFAULT_QUEUE_NAME)
+    assert [job.args for job in queued] == [({'attempt': 1},)]
+    assert await enqueue_many(redis, []) == []
+
+
+def test_resources_route_to_lanes() -> None:
+    assert resource_queue_name('market_quote_refresh') == lane_queue_name('realtime')
+    assert resource_queue_name('news_search') == 'q.agent.realtime'
+    assert resource_queue_name('market_quote_batch_refresh') == 'q.agent.bulk'
+    assert resource_queue_name('market_timeseries_backfill') == 'q.agent.bulk'
+    assert lane_queue_name('intel') == DEFAULT_QUEUE_NAME
+    with pytest.raises(ValueError):
+        lane_queue_name('batch')
+
+
+def test_lane_worker_settings_and_weighted_split() -> None:
+    realtime = lane_worker_settings('realtime')
+    intel = lane_worker_settings('intel')
+    assert realtime['queue_name'] == 'q.agent.realtime'
+    assert realtime['cron_jobs'] == []
+    assert intel['cron_jobs']
+    assert lane_worker_settings('bulk')['max_jobs'] == 5
+
+    assert weighted_lane_max_jobs(['realtime', 'bulk', 'intel'], budget=45) == {
+        'realtime': 20,
+        'bulk': 5,
+        'intel': 20,
+    }
+    assert weighted_lane_max_jobs(['realtime', 'bulk', 'intel', 'bulk'], budget=9) == {
+        'realtime': 4,
+        'bulk': 1,
+        'intel': 4,
+    }
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from finops_api.config import get_settings
+from finops_api.providers.base import ProviderError
+from finops_api.services.ingestion_pipeline import _call_provider, _throttle_delay
+from finops_api.services.rate_limit import (
+    provider_global_rate_limit_key,
+    provider_rate_limit_key,
+)
+from finops_api.services.semaphore import (
+    acquire_semaphore,
+    provider_semaphore_key,
+    provider_slot,
+    release_semaphore,
+    renew_semaphore,
+)
+
+
+@pytest.mark.asyncio
+async def test_semaphore_caps_holders_and_reclaims_expired_leases() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    key = provider_semaphore_key('alphavantage')
+    options = {'key': key, 'limit': 2, 'lease_seconds': 30}
+
+    assert await acquire_semaphore(redis, token='a', now_ms=1_000, **options)
+    assert await acquire_semaphore(redis, token='b', now_ms=2_000, **options)
+    assert not await acquire_semaphore(redis, token='c', now_ms=3_000, **options)
+
+    await release_semaphore(redis, key=key, token='b')
+    assert await acquire_semaphore(redis, token='c', now_ms=4_000, **options)
+
+    assert not await acquire_semaphore(redis, token='d', now_ms=30_999, **options)
+    assert await acquire_semaphore(redis, token='d', now_ms=31_000, **options)
+    assert not await renew_semaphore(redis, key=key, token='a', lease_seconds=30, now_ms=31_000)
+    assert await renew_semaphore(redis, key=key, token='c', lease_seconds=30, now_ms=31_000)
+    assert await redis.zscore(key, 'c') == 61_000
+
+
+@pytest.mark.asyncio
+async def test_provider_slot_throttles_when_full_and_releases_on_exit() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    options = {
+        'provider': 'alphavantage',
+        'limit': 1,
+        'lease_seconds': 30,
+        'wait_seconds': 0.0,
+        'poll_interval_seconds': 0.01,
+    }
+
+    async with provider_slot(redis, **options):
+        with pytest.raises(ProviderError) as exc_info:
+            async with provider_slot(redis, **options):
+                pass
+        assert exc_info.value.code == 'provider_concurrency_limited'
+        assert _throttle_delay(exc_info.value) == 0.01
+        assert await redis.zcard(provider_semaphore_key('alphavantage')) == 1
+
+    assert await redis.zcard(provider_semaphore_key('alphavantage')) == 0
+
+
+@pytest.mark.asyncio
+async def test_provider_slot_waits_for_release_and_skips_when_unlimited() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    options = {
+        'provider': 'tavily',
+        'limit': 1,
+        'lease_seconds': 30,
+        'wait_seconds': 1.0,
+        'poll_interval_seconds': 0.01,
+    }
+    order: list[str] = []
+
+    async def hold(name: str) -> None:
+        async with provider_slot(redis, **options):
+            order.append(f'{name}:in')
+            await asyncio.sleep(0.05)
+            order.append(f'{name}:out')
+
+    await asyncio.gather(hold('first'), hold('second'))
+    assert order == ['first:in', 'first:out', 'second:in', 'second:out']
+
+    async with provider_slot(redis, **{**options, 'limit': 0}):
+        assert not await redis.exists(provider_semaphore_key('tavily'))
+
+
+@pytest.mark.asyncio
+async def test_provider_call_spends_no_tokens_when_slot_times_out(monkeypatch) -> None:
+    monkeypatch.setenv('PROVIDER_CONCURRENCY_LIMIT', '1')
+    monkeypatch.setenv('PROVIDER_CONCURRENCY_WAIT_SECONDS', '0')
+    get_settings.cache_clear()
+    redis = fakeredis.FakeAsyncRedis()
+    org_id = uuid4()
+    bucket_keys = (
+        provider_rate_limit_key(provider='twelvedata', org_id=str(org_id)),
+        provider_global_rate_limit_key(provider='twelvedata'),
+    )
+    calls: list[str] = []
+
+    async def call() -> str:
+        calls.append('called')
+        return 'ok'
+
+    try:
+        async with provider_slot(
+            redis,
+            provider='twelvedata',
+            limit=1,
+            lease_seconds=30,
+            wait_seconds=0.0,
+            poll_interval_seconds=0.01,
+        ):
+            with pytest.raises(ProviderError) as exc_info:
+                await _call_provider(
+                    redis,
+                    provider='twelvedata',
+                    org_id=org_id,
+                    tokens=5,
+                    call=call,
+                )
+        assert exc_info.value.code == 'provider_concurrency_limited'
+        assert calls == []
+        assert not await redis.exists(*bucket_keys)
+
+        assert await _call_provider(
+            redis,
+            provider='twelvedata',
+            org_id=org_id,
+            tokens=5,
+            call=call,
+        ) == 'ok'
+        assert await redis.exists(*bucket_keys) == 2
+    finally:
+        get_settings.cache_clear()
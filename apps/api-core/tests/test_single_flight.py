@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+
+import fakeredis
+import pytest
+
+from finops_api.providers.base import ProviderError
+from finops_api.services.cache import get_cached_payload
+from finops_api.services.ingestion_pipeline import _throttle_delay
+from finops_api.services.single_flight import fetch_once, single_flight_lock_key
+
+
+@pytest.mark.asyncio
+async def test_single_flight_calls_provider_once_for_concurrent_jobs() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    call_count = 0
+
+    async def fetch() -> dict[str, object]:
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.05)
+        return {'symbol': 'AAPL', 'close': '189.25'}
+
+    results = await asyncio.gather(
+        *[
+            fetch_once(
+                redis,
+                cache_key='ingestion:twelvedata:market_quote_refresh:org1:abc',
+                fetch=fetch,
+                cache_ttl_seconds=300,
+                lock_ttl_seconds=30,
+                wait_timeout_seconds=2.0,
+                poll_interval_seconds=0.01,
+            )
+            for _ in range(5)
+        ]
+    )
+
+    assert call_count == 1
+    assert all(payload == {'symbol': 'AAPL', 'close': '189.25'} for payload, _ in results)
+    assert sorted(cache_hit for _, cache_hit in results) == [False, True, True, True, True]
+    assert not await redis.exists(
+        single_flight_lock_key('ingestion:twelvedata:market_quote_refresh:org1:abc')
+    )
+    assert await get_cached_payload(
+        redis, 'ingestion:twelvedata:market_quote_refresh:org1:abc'
+    ) == {'symbol': 'AAPL', 'close': '189.25'}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_waiter_takes_over_after_leader_failure() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    call_count = 0
+
+    async def fetch() -> dict[str, object]:
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.02)
+        if call_count == 1:
+            raise RuntimeError('provider down')
+        return {'symbol': 'AAPL'}
+
+    results = await asyncio.gather(
+        *[
+            fetch_once(
+                redis,
+                cache_key='k',
+                fetch=fetch,
+                cache_ttl_seconds=300,
+                lock_ttl_seconds=30,
+                wait_timeout_seconds=2.0,
+                poll_interval_seconds=0.01,
+            )
+            for _ in range(2)
+        ],
+        return_exceptions=True,
+    )
+
+    assert call_count == 2
+    assert any(isinstance(result, RuntimeError) for result in results)
+    assert ({'symbol': 'AAPL'}, False) in results
+
+
+@pytest.mark.asyncio
+async def test_single_flight_defers_waiters_while_leader_outlives_timeout() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    call_count = 0
+
+    async def fetch() -> dict[str, object]:
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(1.5)
+        return {'symbol': 'AAPL'}
+
+    options = {
+        'cache_key': 'slow',
+        'fetch': fetch,
+        'cache_ttl_seconds': 300,
+        'lock_ttl_seconds': 1,
+        'wait_timeout_seconds': 0.1,
+        'poll_interval_seconds': 0.01,
+    }
+    leader = asyncio.create_task(fetch_once(redis, **options))
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(ProviderError) as exc_info:
+        await fetch_once(redis, **options)
+    assert exc_info.value.code == 'provider_fetch_in_flight'
+    assert _throttle_delay(exc_info.value) == 0.1
+
+    await asyncio.sleep(1.1)
+    with pytest.raises(ProviderError):
+        await fetch_once(redis, **options)
+
+    assert await leader == ({'symbol': 'AAPL'}, False)
+    assert call_count == 1
+    assert not await redis.exists(single_flight_lock_key('slow'))
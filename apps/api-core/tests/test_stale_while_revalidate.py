@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from finops_api.services import ingestion_pipeline
+from finops_api.services.cache import (
+    LocalCache,
+    get_cached_entry,
+    get_cached_payload,
+    get_local_cache,
+    set_cached_payload,
+    stale_refresh_guard_key,
+)
+from finops_api.services.single_flight import refresh_once, single_flight_lock_key
+
+
+@pytest.mark.asyncio
+async def test_cached_entry_is_stale_inside_the_stale_window() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    await set_cached_payload(redis, key='k', payload={'q': 'x'}, ttl_seconds=360)
+
+    entry = await get_cached_entry(redis, 'k', with_ttl=True)
+    assert entry is not None
+    assert entry.payload == {'q': 'x'}
+    assert not entry.is_stale(60)
+
+    await redis.expire('k', 45)
+    get_local_cache().clear()
+    entry = await get_cached_entry(redis, 'k', with_ttl=True)
+    assert entry is not None
+    assert entry.is_stale(60)
+    assert not entry.is_stale(0)
+
+
+def test_local_cache_reports_remaining_source_ttl() -> None:
+    local = LocalCache(max_bytes=1024, max_ttl_seconds=10)
+    local.set('k', {'q': 'x'}, size_bytes=10, ttl_seconds=100, now=0.0)
+
+    entry = local.get_entry('k', now=4.0)
+    assert entry is not None
+    assert entry.payload == {'q': 'x'}
+    assert entry.ttl_seconds == 96.0
+    assert local.get_entry('k', now=11.0) is None
+
+
+@pytest.mark.asyncio
+async def test_stale_hit_enqueues_one_refresh_per_key(monkeypatch) -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    enqueued: list[dict[str, object]] = []
+
+    async def fake_enqueue(_: object, payload: dict[str, object]) -> None:
+        enqueued.append(payload)
+
+    monkeypatch.setattr(ingestion_pipeline, 'enqueue_cache_refresh', fake_enqueue)
+    org_id = uuid4()
+    for _ in range(3):
+        await ingestion_pipeline._schedule_stale_refresh(
+            redis,
+            cache_key='ingestion:tavily:news_search:org:abc',
+            provider='tavily',
+            resource='news_search',
+            idempotency_key='idem-swr-1',
+            org_id=org_id,
+            request_payload={'query': 'aapl'},
+        )
+
+    assert len(enqueued) == 1
+    assert enqueued[0]['org_id'] == str(org_id)
+    assert await redis.exists(stale_refresh_guard_key('ingestion:tavily:news_search:org:abc'))
+
+
+@pytest.mark.asyncio
+async def test_refresh_once_skips_while_another_fetch_holds_the_lock() -> None:
+    redis = fakeredis.FakeAsyncRedis()
+    call_count = 0
+
+    async def fetch() -> dict[str, object]:
+        nonlocal call_count
+        call_count += 1
+        return {'symbol': 'AAPL', 'close': '190.00'}
+
+    await redis.set(single_flight_lock_key('k'), 'other', ex=30)
+    assert not await refresh_once(
+        redis,
+        cache_key='k',
+        fetch=fetch,
+        cache_ttl_seconds=360,
+        lock_ttl_seconds=30,
+    )
+    assert call_count == 0
+
+    await redis.delete(single_flight_lock_key('k'))
+    assert await refresh_once(
+        redis,
+        cache_key='k',
+        fetch=fetch,
+        cache_ttl_seconds=360,
+        lock_ttl_seconds=30,
+    )
+    assert call_count == 1
+    assert await get_cached_payload(redis, 'k') == {'symbol': 'AAPL', 'close': '190.00'}
+    assert not await redis.exists(single_flight_lock_key('k'))